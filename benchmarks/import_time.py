@@ -0,0 +1,113 @@
+"""
+Cold-start guard for the oahf packages.
+
+Imports the lazily loaded packages in fresh interpreters, reports the median import
+time and fails (exit code 1) if it exceeds the budget or if importing the packages
+pulled in any submodule or heavy standard library module.
+
+Usage:
+    python benchmarks/import_time.py [--runs 15] [--budget-ms 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Importing these must only load the packages themselves (and the lazy loader)
+PACKAGES = [
+    "oahf.Base",
+    "oahf.ImplementedBase",
+    "oahf.MetaHeuristics",
+    "oahf.Logger",
+]
+
+# Modules that must stay unloaded until a class actually needs them
+HEAVY_MODULES = [
+    "concurrent.futures",
+    "hashlib",
+    "logging",
+    "multiprocessing",
+    "xml.etree.ElementTree",
+]
+
+# Informational only: full import of the modules a typical run uses
+FULL_IMPORTS = [
+    "oahf.MetaHeuristics.ILS",
+    "oahf.MetaHeuristics.ParallelILS",
+    "oahf.MetaHeuristics.GRASP",
+]
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(modules, runs):
+    """Imports the modules in fresh interpreters, returns times and loaded modules."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, PYTHONDONTWRITEBYTECODE="")
+    times = []
+    loaded = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(modules=modules)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        result = json.loads(output)
+        times.append(result["ms"])
+        loaded = result["modules"]
+    return times, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    failures = []
+
+    times, loaded = measure(PACKAGES, args.runs)
+    median = statistics.median(times)
+    print(
+        f"import {', '.join(PACKAGES)}: median {median:.2f} ms "
+        f"(budget {args.budget_ms} ms)"
+    )
+    if median > args.budget_ms:
+        failures.append(f"cold start {median:.2f} ms exceeds {args.budget_ms} ms")
+
+    allowed = set(PACKAGES) | {
+        "oahf",
+        "oahf.main",
+        "oahf.Utils",
+        "oahf.Utils.LazyLoader",
+    }
+    eager = [m for m in loaded if m.startswith("oahf") and m not in allowed]
+    if eager:
+        failures.append(f"submodules imported eagerly: {', '.join(eager)}")
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    if heavy:
+        failures.append(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    for module in FULL_IMPORTS:
+        times, _ = measure([module], max(1, args.runs // 3))
+        print(f"import {module}: median {statistics.median(times):.2f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
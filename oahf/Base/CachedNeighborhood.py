@@ -0,0 +1,197 @@
+from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, Hashable, Iterable, Iterator, Optional, Set
+
+from oahf.Base.Movement import Movement
+from oahf.Base.Neighborhood import Neighborhood
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+
+
+class CachedNeighborhood(Neighborhood, ABC):
+    """
+    Neighborhood keeping its candidate movements, with their evaluated costs, from one
+    build to the next.
+
+    Subclasses enumerate the keys of the candidate movements (e.g. (task, station)
+    pairs) and create the movement of a key, evaluating its cost (delta) when created
+    so get_cost just returns it. Every created movement is cached with the regions its
+    cost depends on (cost_dependencies). Accepting a movement drops only the cached
+    movements depending on the regions it modified; they are created again when the
+    next scan reaches them, while the other movements and costs are reused.
+
+    The cache is kept while the neighborhood is built on the solution of the last
+    accepted movement (same solution_hash), and dropped otherwise. Reused movements
+    are bound to the solution being scanned, so they must reach it only through
+    Movement.solution.
+    """
+
+    def __init__(
+        self, stop_criteria: "StopCriteria", is_perturbation: bool = False
+    ) -> None:
+        """
+        Initializes the CachedNeighborhood with an empty cache.
+
+        Args:
+            stop_criteria (StopCriteria): The stopping criteria for the neighborhood operations.
+            is_perturbation (bool): A flag indicating if the neighborhood is a perturbation. Default is False.
+        """
+        super().__init__(stop_criteria, is_perturbation)
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self._moves: Dict[Hashable, Movement] = {}
+        # Cost dependencies of each cached key, and the keys depending on each region
+        self._dependencies: Dict[Hashable, Optional[FrozenSet[Hashable]]] = {}
+        self._dependents: Dict[Hashable, Set[Hashable]] = {}
+        # Keys whose dependencies are unknown, dropped on every accepted movement
+        self._unbounded: Set[Hashable] = set()
+        self._cached_solution: Optional[int] = None
+        self._solution: Optional["Solution"] = None
+        self._candidates: Iterator[Hashable] = iter(())
+
+    @abstractmethod
+    def candidate_keys(
+        self, thread_id: int, solution: "Solution"
+    ) -> Iterable[Hashable]:
+        """
+        Enumerates the keys of the candidate movements of the solution, in scan order.
+
+        Args:
+            thread_id (int): The ID of the thread.
+            solution (Solution): The solution to operate on.
+
+        Returns:
+            Iterable[Hashable]: The keys, each identifying one movement.
+        """
+        pass
+
+    @abstractmethod
+    def create_move(self, key: Hashable, solution: "Solution") -> Optional[Movement]:
+        """
+        Creates the movement of a key and evaluates its cost.
+
+        Args:
+            key (Hashable): The key of the movement.
+            solution (Solution): The solution to operate on.
+
+        Returns:
+            Optional[Movement]: The movement, or None if it is not possible.
+        """
+        pass
+
+    def cost_dependencies(self, move: Movement) -> Optional[FrozenSet[Hashable]]:
+        """
+        Returns the regions the cost of a movement depends on, keyed like
+        Movement.get_modified_region. Defaults to the regions the movement modifies;
+        override when its cost also reads neighboring regions.
+
+        Args:
+            move (Movement): The movement.
+
+        Returns:
+            Optional[FrozenSet[Hashable]]: The regions, None if unknown.
+        """
+        return move.get_modified_region()
+
+    def build_neighborhood(self, thread_id: int, solution: "Solution") -> bool:
+        """
+        Starts a scan of the candidate movements, keeping the cache if the solution is
+        the one of the last accepted movement.
+
+        Args:
+            thread_id (int): The ID of the thread.
+            solution (Solution): The solution to operate on.
+
+        Returns:
+            bool: True.
+        """
+        key = solution.solution_hash() if solution is not None else None
+        if key is None or key != self._cached_solution:
+            self.invalidate()
+        self._cached_solution = key
+        self._solution = solution
+        self._candidates = iter(self.candidate_keys(thread_id, solution))
+        return True
+
+    def get_move(self) -> Optional[Movement]:
+        """Returns the next candidate movement, from the cache when still valid."""
+        for key in self._candidates:
+            move = self._moves.get(key)
+            if move is not None:
+                self.cache_hits += 1
+                move.solution = self._solution
+                return move
+
+            move = self.create_move(key, self._solution)
+            if move is None:
+                continue
+            self.cache_misses += 1
+            self._store(key, move)
+            return move
+        return None
+
+    def accept_movement(
+        self,
+        move: Optional["Movement"] = None,
+        solution: Optional["Solution"] = None,
+    ) -> None:
+        """
+        Accepts the movement, dropping the cached movements whose cost depends on the
+        regions it modified (all of them if unknown).
+
+        Args:
+            move (Optional[Movement]): The accepted movement.
+            solution (Optional[Solution]): The solution after the movement, by default
+                the solution of the movement.
+        """
+        super().accept_movement(move, solution)
+        self.invalidate(move.get_modified_region() if move is not None else None)
+        if solution is None and move is not None:
+            solution = move.solution
+        self._cached_solution = (
+            solution.solution_hash() if solution is not None else None
+        )
+
+    def invalidate(self, regions: Optional[Iterable[Hashable]] = None) -> None:
+        """
+        Drops the cached movements depending on the given regions, or all of them.
+
+        Args:
+            regions (Optional[Iterable[Hashable]]): The modified regions, None for all.
+        """
+        if regions is None:
+            self._moves.clear()
+            self._dependencies.clear()
+            self._dependents.clear()
+            self._unbounded.clear()
+            return
+
+        stale = set(self._unbounded)
+        for region in regions:
+            stale.update(self._dependents.get(region, ()))
+        for key in stale:
+            self._discard(key)
+
+    def _store(self, key: Hashable, move: Movement) -> None:
+        """Caches a movement with its cost dependencies."""
+        dependencies = self.cost_dependencies(move)
+        self._moves[key] = move
+        self._dependencies[key] = dependencies
+        if dependencies is None:
+            self._unbounded.add(key)
+        else:
+            for region in dependencies:
+                self._dependents.setdefault(region, set()).add(key)
+
+    def _discard(self, key: Hashable) -> None:
+        """Removes a movement from the cache."""
+        self._moves.pop(key, None)
+        dependencies = self._dependencies.pop(key, None)
+        if dependencies is None:
+            self._unbounded.discard(key)
+            return
+        for region in dependencies:
+            keys = self._dependents.get(region)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependents[region]
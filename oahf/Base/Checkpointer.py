@@ -0,0 +1,195 @@
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from oahf.Base.ThreadManager import ThreadManager
+
+if TYPE_CHECKING:
+    from oahf.Base.MetaHeuristic import MetaHeuristic
+    from oahf.Base.Pool import Pool
+    from oahf.Base.Solution import Solution
+
+
+class Checkpointer:
+    """
+    Periodic, atomic checkpoints of a running MetaHeuristic tree.
+
+    MetaHeuristics call `checkpoint()` at safe points of their main loop (between
+    iterations). Once `interval` seconds have passed, the tree state (see
+    MetaHeuristic.get_state: stop criteria counters, pools, incumbent, ...) and the
+    ThreadManager random streams are pickled on the search thread, then compressed
+    and written by a background thread, so the search only pays for the snapshot.
+    If the writer is still busy, a newer snapshot replaces the pending one.
+
+    File format: magic, format version, CRC32 and length of the payload, followed by
+    the zlib-compressed pickle. Files are written to a temporary name, synced and
+    renamed over the previous checkpoint, so a crash never leaves a partial file.
+
+    Example:
+        checkpointer = Checkpointer("run.ckpt", interval=300)
+        ils.set_checkpointer(checkpointer)
+        ils.run_operation(sol)
+        ...
+        # After a crash, continue the same configuration from the checkpoint
+        best = Checkpointer("run.ckpt", interval=300).resume(ils)
+    """
+
+    MAGIC = b"OAHFCKPT"
+    VERSION = 1
+    _HEADER = struct.Struct("<8sHIQ")
+
+    def __init__(
+        self, path: Union[str, Path], interval: float = 60.0, compression: int = 6
+    ) -> None:
+        """
+        Initializes the Checkpointer.
+        :param path: The checkpoint file.
+        :param interval: Minimum number of seconds between two checkpoints.
+        :param compression: zlib compression level (0-9).
+        """
+        self.path: Path = Path(path)
+        self.interval: float = interval
+        self.compression: int = compression
+        self.saved: int = 0
+        self.last_error: Optional[Exception] = None
+
+        self._next_time: float = time.monotonic() + interval
+        self._pending: Optional[bytes] = None
+        self._writing: bool = False
+        self._condition = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+
+    def due(self) -> bool:
+        """Checks if the interval since the last checkpoint has passed."""
+        return time.monotonic() >= self._next_time
+
+    def maybe_save(self, metaheuristic: "MetaHeuristic") -> bool:
+        """
+        Saves a checkpoint if one is due.
+        :param metaheuristic: The root of the MetaHeuristic tree.
+        :return: True if a checkpoint was taken.
+        """
+        if time.monotonic() < self._next_time:
+            return False
+        self.save(metaheuristic)
+        return True
+
+    def save(self, metaheuristic: "MetaHeuristic", wait: bool = False) -> None:
+        """
+        Snapshots the tree and hands it to the background writer.
+        :param metaheuristic: The root of the MetaHeuristic tree.
+        :param wait: Block until the checkpoint is on disk.
+        """
+        snapshot = {
+            "created": time.time(),
+            "metaheuristic": metaheuristic.get_state(),
+            "random": ThreadManager.get_random_state(),
+        }
+        payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        self._next_time = time.monotonic() + self.interval
+
+        with self._condition:
+            self._pending = payload
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="oahf-checkpoint", daemon=True
+                )
+                self._writer.start()
+            self._condition.notify_all()
+        if wait:
+            self.wait()
+
+    def wait(self) -> None:
+        """Blocks until every snapshot taken so far is on disk."""
+        with self._condition:
+            while self._pending is not None or self._writing:
+                self._condition.wait()
+
+    def _write_loop(self) -> None:
+        """Writes pending snapshots, exiting once there is nothing left to write."""
+        while True:
+            with self._condition:
+                payload, self._pending = self._pending, None
+                if payload is None:
+                    self._writer = None
+                    self._condition.notify_all()
+                    return
+                self._writing = True
+            try:
+                self._write(payload)
+                self.saved += 1
+            except Exception as ex:
+                self.last_error = ex
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, payload: bytes) -> None:
+        """Compresses the payload and atomically replaces the checkpoint file."""
+        data = zlib.compress(payload, self.compression)
+        header = self._HEADER.pack(
+            self.MAGIC, self.VERSION, zlib.crc32(data), len(data)
+        )
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            file.write(header)
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+    def exists(self) -> bool:
+        """Checks if a checkpoint file exists."""
+        return self.path.exists()
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Reads and validates the checkpoint file.
+        :return: The snapshot saved by save.
+        """
+        with open(self.path, "rb") as file:
+            header = file.read(self._HEADER.size)
+            data = file.read()
+        if len(header) < self._HEADER.size:
+            raise ValueError(f"'{self.path}' is not a checkpoint.")
+        magic, version, crc, length = self._HEADER.unpack(header)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(
+                f"'{self.path}' is not a version {self.VERSION} checkpoint."
+            )
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise ValueError(f"Checkpoint '{self.path}' is corrupted.")
+        return pickle.loads(zlib.decompress(data))
+
+    def restore(self, metaheuristic: "MetaHeuristic") -> None:
+        """
+        Restores the checkpoint into a MetaHeuristic tree built with the same
+        configuration; its next run_operation continues from the checkpoint.
+        :param metaheuristic: The root of the MetaHeuristic tree.
+        """
+        snapshot = self.load()
+        metaheuristic.set_state(snapshot["metaheuristic"])
+        ThreadManager.set_random_state(snapshot["random"])
+        metaheuristic.resuming = True
+
+    def resume(
+        self,
+        metaheuristic: "MetaHeuristic",
+        sol: Optional[Union["Solution", "Pool"]] = None,
+    ) -> Optional[Union["Solution", "Pool"]]:
+        """
+        Restores the checkpoint and runs the MetaHeuristic to the end, saving new
+        checkpoints to the same file.
+        :param metaheuristic: The root of the MetaHeuristic tree.
+        :param sol: The input originally given to run_operation.
+        :return: The result of run_operation.
+        """
+        self.restore(metaheuristic)
+        metaheuristic.set_checkpointer(self)
+        return metaheuristic.run_operation(sol)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar, FrozenSet, Hashable, Optional
 
 from oahf.Base.ConstraintEvaluation import ConstraintEvaluation
 from oahf.Base.Entity import Entity
@@ -7,6 +8,8 @@ from oahf.Base.StopCriteria import StopCriteria
 
 
 class Constraint(Entity, ABC):
+    # Keys of the solution regions the constraint reads, None meaning the whole solution
+    dependencies: ClassVar[Optional[FrozenSet[Hashable]]] = None
 
     @abstractmethod
     def evaluate(self, solution: "Solution") -> "ConstraintEvaluation":
@@ -27,3 +30,11 @@ class Constraint(Entity, ABC):
         :return: A ConstraintEvaluation object (default behavior is to ignore stop criteria).
         """
         return self.evaluate(solution)
+
+    def depends_on(self, region: FrozenSet[Hashable]) -> bool:
+        """
+        Virtual method to check whether a change in the given region may alter the constraint.
+        :param region: Keys of the solution regions modified by a movement.
+        :return: True if the constraint must be re-evaluated (default compares with dependencies).
+        """
+        return self.dependencies is None or not self.dependencies.isdisjoint(region)
@@ -1,10 +1,16 @@
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
-from oahf.Base.Constraint import Constraint
 from oahf.Base.Entity import Entity
 
+if TYPE_CHECKING:
+    from oahf.Base.Constraint import Constraint
+
 
 class ConstraintEvaluation(Entity):
+    lazy_ids = True
+
+    __slots__ = ("_infeasible", "_penalty", "_constraint", "_constraint_type")
+
     def __init__(
         self, constraint: "Constraint", infeasibility: bool, penalty: float = 0.0
     ):
@@ -17,6 +23,7 @@ class ConstraintEvaluation(Entity):
         super().__init__()
         self._infeasible: bool = infeasibility
         self._penalty: float = penalty
+        self._constraint: "Constraint" = constraint
         self._constraint_type: Type["Constraint"] = type(constraint)
 
     @property
@@ -29,6 +36,11 @@ class ConstraintEvaluation(Entity):
         """Returns the penalty associated with the constraint."""
         return self._penalty
 
+    @property
+    def constraint(self) -> "Constraint":
+        """Returns the constraint that was evaluated."""
+        return self._constraint
+
     @property
     def constraint_type(self) -> Type["Constraint"]:
         """Returns the type of the constraint."""
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from oahf.Base.Neighborhood import Neighborhood
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+
+
+class DifferenceNeighborhood(Neighborhood, ABC):
+    """
+    Neighborhood whose movements take a solution one step closer to a guiding solution.
+
+    Subclasses build their moves from the attributes in which the current solution
+    differs from the guiding one (e.g. a task assigned to another station), so every
+    accepted movement shortens the path between both solutions.
+    """
+
+    def __init__(
+        self, stop_criteria: "StopCriteria", is_perturbation: bool = False
+    ) -> None:
+        """
+        Initializes the DifferenceNeighborhood without a guiding solution.
+
+        Args:
+            stop_criteria (StopCriteria): The stopping criteria for the neighborhood operations.
+            is_perturbation (bool): A flag indicating if the neighborhood is a perturbation. Default is False.
+        """
+        super().__init__(stop_criteria, is_perturbation)
+        self.guiding_solution: Optional["Solution"] = None
+
+    def set_guiding_solution(self, guiding_solution: "Solution") -> None:
+        """Sets the solution the generated movements should lead to."""
+        self.guiding_solution = guiding_solution
+
+    def build_neighborhood_operation(
+        self, thread_id: int, solution: "Solution"
+    ) -> bool:
+        """
+        Builds the movements that reduce the difference to the guiding solution.
+
+        Args:
+            thread_id (int): The ID of the thread.
+            solution (Solution): The solution to operate on.
+
+        Returns:
+            bool: False if there is no guiding solution or no difference left, True otherwise.
+        """
+        if self.guiding_solution is None:
+            return False
+        return super().build_neighborhood_operation(thread_id, solution)
+
+    @abstractmethod
+    def distance(self, solution: "Solution") -> int:
+        """
+        Counts the attributes in which the solution still differs from the guiding solution.
+
+        Args:
+            solution (Solution): The solution to compare against the guiding solution.
+
+        Returns:
+            int: The number of remaining differences, 0 when both solutions are equal.
+        """
+        pass
@@ -30,6 +30,8 @@ class Event:
 
 
 class EfficiencyReport(Entity):
+    lazy_ids = True
+
     def __init__(self, name: str) -> None:
         """
         Initializes the EfficiencyReport with the specified name.
@@ -1,35 +1,53 @@
+import itertools
 import threading
 from abc import ABC
+from typing import ClassVar
 
 
 class Entity(ABC):
     """Represents a base entity with an auto-generated id and class name as the default name."""
 
-    # Class-level counter for automatically assigning IDs
-    _instance_counter = 0
-    _lock = threading.Lock()  # Lock for thread-safe ID generation
+    # Subclasses that also declare __slots__ (e.g. Evaluation) carry no __dict__
+    __slots__ = ("__id", "__name")
+
+    # Ids are handed out in per-thread blocks, so creating entities takes no lock
+    _ID_BLOCK_SIZE: ClassVar[int] = 1024
+    _id_blocks = itertools.count()  # next() on a count is atomic
+    _thread_ids = threading.local()
+
+    # Hot-path classes set this to store nothing at creation; the id is then drawn
+    # on first access of `id` and the name is derived from the class
+    lazy_ids: ClassVar[bool] = False
 
     def __init__(self, entity_id: int = None, name: str = None) -> None:
         """Initializer that sets the id and name. The id is auto-generated, and the name defaults to the class name."""
+        if entity_id is not None:
+            self.__id = entity_id
+        elif not self.lazy_ids:
+            self.__id = Entity._next_id()
 
-        # Increment the class-level counter for the ID
-        with Entity._lock:
-            if entity_id is None:
-                Entity._instance_counter += 1
-                self.__id = Entity._instance_counter
-            else:
-                self.__id = entity_id
-
-        # Set the name to the class name if not provided
-        if name is None:
-            self.__name = self.__class__.__name__.upper()
-        else:
+        if name is not None:
             self.__name = name
 
+    @staticmethod
+    def _next_id() -> int:
+        """Draws the next id from the calling thread's block, taking a new block when exhausted."""
+        local = Entity._thread_ids
+        next_id = getattr(local, "next_id", 0)
+        if next_id >= getattr(local, "end", 0):
+            next_id = next(Entity._id_blocks) * Entity._ID_BLOCK_SIZE + 1
+            local.end = next_id + Entity._ID_BLOCK_SIZE
+        local.next_id = next_id + 1
+        return next_id
+
     @property
     def id(self) -> int:
         """Getter for the entity ID."""
-        return self.__id
+        try:
+            return self.__id
+        except AttributeError:
+            self.__id = Entity._next_id()
+            return self.__id
 
     @id.setter
     def id(self, entity_id: int) -> None:
@@ -38,8 +56,11 @@ class Entity(ABC):
 
     @property
     def name(self) -> str:
-        """Getter for the entity name."""
-        return self.__name
+        """Getter for the entity name, the class name unless set."""
+        try:
+            return self.__name
+        except AttributeError:
+            return self.__class__.__name__.upper()
 
     @name.setter
     def name(self, name: str) -> None:
@@ -48,4 +69,4 @@ class Entity(ABC):
 
     def __str__(self) -> str:
         """String representation of the entity in the format 'name_id'."""
-        return f"{self.__name}_{self.__id}"
+        return f"{self.name}_{self.id}"
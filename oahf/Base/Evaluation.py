@@ -1,18 +1,50 @@
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from oahf.Base.ConstraintEvaluation import ConstraintEvaluation
 from oahf.Base.Entity import Entity
 
 
 class Evaluation(Entity):
+    """
+    Immutable record of a solution evaluation.
+
+    The objective function and feasibility are computed on first use and cached in
+    sort_key, so comparisons between evaluations are plain tuple comparisons.
+    """
+
+    lazy_ids = True
+
+    __slots__ = (
+        "constraints",
+        "_infeasible_constraints",
+        "_objective_function",
+        "_sort_key",
+    )
+
     def __init__(self, constraints: Iterable["ConstraintEvaluation"]):
         """
         Initializes the Evaluation object with constraints.
         :param constraints: Iterable of ConstraintEvaluation objects.
         """
         super().__init__()
-        self.constraints: Iterable["ConstraintEvaluation"] = constraints
+        self.constraints: Tuple["ConstraintEvaluation", ...] = (
+            tuple(constraints) if constraints else ()
+        )
         self._infeasible_constraints: Optional[List["ConstraintEvaluation"]] = None
+        self._objective_function: Optional[float] = None
+        self._sort_key: Optional[Tuple[bool, float]] = None
+
+    @property
+    def sort_key(self) -> Tuple[bool, float]:
+        """
+        Key ordering evaluations from best to worst: feasible before infeasible,
+        then by objective function (minimization).
+        :return: Tuple (infeasible, objective function).
+        """
+        key = self._sort_key
+        if key is None:
+            key = self._sort_key = (self.infeasible(), self.get_objective_function())
+        return key
 
     def better_than(self, ev: "Evaluation") -> bool:
         """
@@ -20,11 +52,7 @@ class Evaluation(Entity):
         :param ev: Another Evaluation object.
         :return: True if the current evaluation is better.
         """
-        if self.infeasible() and not ev.infeasible():
-            return False
-        if not self.infeasible() and ev.infeasible():
-            return True
-        return self.get_objective_function() < ev.get_objective_function()
+        return self.sort_key < ev.sort_key
 
     def better_or_equal_to(self, ev: "Evaluation") -> bool:
         """
@@ -32,11 +60,15 @@ class Evaluation(Entity):
         :param ev: Another Evaluation object.
         :return: True if the current evaluation is better or equal.
         """
-        if self.infeasible() and not ev.infeasible():
-            return False
-        if not self.infeasible() and ev.infeasible():
-            return True
-        return self.get_objective_function() <= ev.get_objective_function()
+        return self.sort_key <= ev.sort_key
+
+    def __lt__(self, ev: "Evaluation") -> bool:
+        """Orders evaluations by sort_key, allowing their use in sorts and heaps."""
+        return self.sort_key < ev.sort_key
+
+    def __le__(self, ev: "Evaluation") -> bool:
+        """Orders evaluations by sort_key, allowing their use in sorts and heaps."""
+        return self.sort_key <= ev.sort_key
 
     def get_infeasible_constraints(self) -> List["ConstraintEvaluation"]:
         """
@@ -64,8 +96,13 @@ class Evaluation(Entity):
     def get_objective_function(self) -> float:
         """
         Calculates the objective function value, including penalties for constraints.
+        The value is computed once and cached.
         :return: The objective function value.
         """
-        return self.get_objective_function_value() + sum(
-            x.penalty for x in self.constraints if self.constraints
-        )
+        value = self._objective_function
+        if value is None:
+            value = self.get_objective_function_value()
+            for x in self.constraints:
+                value += x.penalty
+            self._objective_function = value
+        return value
@@ -1,14 +1,47 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple
 
 from oahf.Base.Constraint import Constraint
+from oahf.Base.ConstraintEvaluation import ConstraintEvaluation
+from oahf.Base.EfficiencyReport import EfficiencyReport
 from oahf.Base.Entity import Entity
 from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Movement import Movement
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 
 
+class _MoveContext(threading.local):
+    """Per-thread context of evaluate_move; pickled as a fresh, empty context."""
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+class _StatisticsLock:
+    """Lock of the constraint statistics; pickled as a fresh, released lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+
+    def __exit__(self, *args) -> None:
+        self._lock.release()
+
+    def __reduce__(self):
+        return type(self), ()
+
+
 class Evaluator(Entity, ABC):
+    # Number of evaluate_constraints calls between two reorderings of the constraints
+    REORDER_INTERVAL: int = 256
+    # True for wrappers forwarding evaluate to another evaluator (e.g. SharedEvaluator)
+    delegates_evaluate: ClassVar[bool] = False
+
     def __init__(self, stop_on_first: bool, *constraints: "Constraint"):
         """
         Initializes an Evaluator with the option to stop on the first infeasibility.
@@ -19,6 +52,14 @@ class Evaluator(Entity, ABC):
         self._constraints: List["Constraint"] = list(constraints)
         self._stop_on_first_infeasibility: bool = stop_on_first
         self.stop_criteria: Optional["StopCriteria"] = None
+        # Time and tally the constraints even without stop_on_first_infeasibility,
+        # e.g. to call reorder_constraints or learn_constraint_order later
+        self.collect_statistics: bool = False
+        # Per-thread region modified by the movement being evaluated (see evaluate_move)
+        self._dirty_region = _MoveContext()
+        # Guards the constraint statistics, shared by the threads using the evaluator
+        self._statistics_lock = _StatisticsLock()
+        self._reset_constraint_statistics()
 
     @abstractmethod
     def evaluate(self, sol: "Solution") -> "Evaluation":
@@ -29,6 +70,146 @@ class Evaluator(Entity, ABC):
         """
         pass
 
+    def evaluate_move(
+        self,
+        sol: "Solution",
+        move: Optional["Movement"],
+        base_evaluation: Optional["Evaluation"],
+    ) -> "Evaluation":
+        """
+        Evaluates a Solution just modified by a movement. Constraints that do not depend
+        on the movement's modified region reuse their ConstraintEvaluation from the
+        evaluation of the solution before the movement.
+        :param sol: A Solution object with the movement applied.
+        :param move: The applied Movement, or None.
+        :param base_evaluation: The Evaluation of the solution before the movement, or None.
+        :return: An Evaluation object.
+        """
+        region = move.get_modified_region() if move is not None else None
+        if region is None or base_evaluation is None:
+            return self.evaluate(sol)
+
+        context = self._dirty_region
+        context.region = region
+        context.base = base_evaluation
+        try:
+            return self.evaluate(sol)
+        finally:
+            context.region = None
+            context.base = None
+
+    def evaluate_constraints(self, sol: "Solution") -> List["ConstraintEvaluation"]:
+        """
+        Evaluates the constraints of a Solution, meant to be called by evaluate.
+        When stop_on_first_infeasibility is set, constraints run from the cheapest and
+        most often violated to the least, and the evaluation stops at the first
+        infeasible one (so penalties of the remaining constraints are not summed).
+        The statistics behind that order are only gathered then, or when
+        collect_statistics is set.
+        Inside evaluate_move, constraints unaffected by the movement are not re-run.
+        :param sol: A Solution object to evaluate.
+        :return: The list of ConstraintEvaluation objects computed.
+        """
+        # Snapshot: reorder_constraints swaps in a new list, never sorts this one
+        order = self._constraint_order
+        if len(order) != len(self._constraints):
+            with self._statistics_lock:
+                self._reset_constraint_statistics()
+            order = self._constraint_order
+
+        region = getattr(self._dirty_region, "region", None)
+        reusable: Optional[Dict[int, "ConstraintEvaluation"]] = None
+        if region is not None:
+            reusable = {
+                id(x.constraint): x for x in self._dirty_region.base.constraints
+            }
+
+        evaluations: List["ConstraintEvaluation"] = []
+        collect = self._stop_on_first_infeasibility or self.collect_statistics
+        # (index, seconds, infeasible) of every constraint run, tallied at the end
+        runs: List[Tuple[int, float, bool]] = []
+        for index in order:
+            constraint = self._constraints[index]
+            evaluation = None
+            if reusable is not None and not constraint.depends_on(region):
+                evaluation = reusable.get(id(constraint))
+
+            if evaluation is None:
+                start = time.perf_counter() if collect else 0.0
+                if self.stop_criteria is None:
+                    evaluation = constraint.evaluate(sol)
+                else:
+                    evaluation = constraint.evaluate_with_stop_criteria(
+                        sol, self.stop_criteria
+                    )
+                if collect:
+                    seconds = time.perf_counter() - start
+                    runs.append((index, seconds, evaluation.infeasible))
+            evaluations.append(evaluation)
+
+            if evaluation.infeasible and self._stop_on_first_infeasibility:
+                break
+
+        if not collect:
+            return evaluations
+        with self._statistics_lock:
+            for index, seconds, infeasible in runs:
+                self._constraint_time[index] += seconds
+                self._constraint_calls[index] += 1
+                if infeasible:
+                    self._constraint_violations[index] += 1
+            if self._stop_on_first_infeasibility:
+                self._calls_since_reorder += 1
+                if self._calls_since_reorder >= self.REORDER_INTERVAL:
+                    self._sort_constraints()
+
+        return evaluations
+
+    def learn_constraint_order(self, reports: Iterable["EfficiencyReport"]) -> None:
+        """
+        Seeds the constraint statistics with the violations tallied by efficiency reports
+        (e.g. from neighborhoods of a previous run) and reorders the constraints.
+        :param reports: EfficiencyReport objects with constraint_per_unapply filled.
+        """
+        with self._statistics_lock:
+            for report in reports:
+                evaluated = report.count_apply - report.count_apply_failed
+                for index, constraint in enumerate(self._constraints):
+                    violations = report.constraint_per_unapply.get(type(constraint), 0)
+                    self._constraint_calls[index] += max(evaluated, violations)
+                    self._constraint_violations[index] += violations
+            self._sort_constraints()
+
+    def reorder_constraints(self) -> None:
+        """
+        Sorts the constraints by expected cost per detected infeasibility, i.e. mean
+        evaluation time divided by the (smoothed) violation frequency.
+        """
+        with self._statistics_lock:
+            self._sort_constraints()
+
+    def _sort_constraints(self) -> None:
+        """Body of reorder_constraints; the caller holds the statistics lock."""
+
+        def expected_cost(index: int) -> float:
+            calls = self._constraint_calls[index]
+            mean_time = self._constraint_time[index] / calls if calls else 0.0
+            violation_rate = (self._constraint_violations[index] + 1) / (calls + 2)
+            return mean_time / violation_rate
+
+        # A new list, as threads iterate over the current one without the lock
+        self._constraint_order = sorted(self._constraint_order, key=expected_cost)
+        self._calls_since_reorder = 0
+
+    def _reset_constraint_statistics(self) -> None:
+        """Resets the statistics used to order the constraints to declaration order."""
+        size = len(self._constraints)
+        self._constraint_order: List[int] = list(range(size))
+        self._constraint_calls: List[int] = [0] * size
+        self._constraint_violations: List[int] = [0] * size
+        self._constraint_time: List[float] = [0.0] * size
+        self._calls_since_reorder: int = 0
+
     def save_evaluation_state(self, sol: "Solution") -> None:
         """
         Saves the state of the evaluation for a given Solution.
@@ -48,6 +229,11 @@ class Evaluator(Entity, ABC):
         """Returns the list of constraints."""
         return self._constraints
 
+    @property
+    def constraint_order(self) -> List["Constraint"]:
+        """Returns the constraints in the order they are currently evaluated."""
+        return [self._constraints[i] for i in self._constraint_order]
+
     @property
     def stop_on_first_infeasibility(self) -> bool:
         """Returns whether to stop on the first infeasibility."""
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
 from oahf.Base.EfficiencyReport import Event
@@ -13,12 +13,18 @@ from oahf.Base.Pool import Pool
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.Logger.LogManager import LogManager
+from oahf.Utils.Profiler import Profiler
+
+if TYPE_CHECKING:
+    from oahf.Base.Checkpointer import Checkpointer
+    from oahf.Logger.TraceWriter import TraceWriter
+    from oahf.Utils.SamplingProfiler import SamplingProfiler
 
 
 class MetaHeuristicReport:
-    def __init__(self, name: str):
+    def __init__(self, name: str, report: Optional[List[Tuple[int, "Event"]]] = None):
         self.name: str = name
-        self.report: List[Tuple[int, "Event"]] = []
+        self.report: List[Tuple[int, "Event"]] = report if report is not None else []
         self.reports: List["MetaHeuristicReport"] = []
         self.start_time: int = 0
         self.end_time: int = 0
@@ -64,6 +70,11 @@ class MetaHeuristic(Entity, ABC):
         self.acceptance_criteria: Optional["AcceptanceCriteria"] = acceptance_criteria
         self.solution_reports: SolutionReport = SolutionReport()
         self.log_solutions: bool = False
+        self.trace: Optional["TraceWriter"] = None
+        self.checkpointer: Optional["Checkpointer"] = None
+        self.sampling_profiler: Optional["SamplingProfiler"] = None
+        # Set by Checkpointer.restore: the next run continues from the restored state
+        self.resuming: bool = False
         self.start_time: int = 0
         self.end_time: int = 0
 
@@ -115,9 +126,16 @@ class MetaHeuristic(Entity, ABC):
     def run_operation(
         self, sol: "Pool", parent: Optional["MetaHeuristic"] = None
     ) -> "Pool":
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.enter(self.__class__.__name__)
+        sampler = self.sampling_profiler
+        if sampler is not None:
+            sampler.start()
         try:
             self.parent_metaheuristic = parent
-            self.stop_criteria.reset()
+            if not self.resuming:
+                self.stop_criteria.reset()
             if self.neighborhood_selection:
                 self.neighborhood_selection.reset(self.thread_id)
 
@@ -128,6 +146,56 @@ class MetaHeuristic(Entity, ABC):
         except Exception as ex:
             LogManager.something_went_wrong(self.__class__, ex)
             raise
+        finally:
+            # Only the first run after Checkpointer.restore continues from it
+            self.resuming = False
+            if sampler is not None:
+                sampler.stop()
+            if profiler is not None:
+                profiler.exit()
+
+    def set_sampling_profiler(self, sampler: Optional["SamplingProfiler"]):
+        """
+        Samples the stacks of every thread while run_operation runs, writing the
+        sampler's collapsed-stack file when it returns.
+        """
+        self.sampling_profiler = sampler
+
+    def set_checkpointer(self, checkpointer: Optional["Checkpointer"]):
+        """Saves checkpoints of this MetaHeuristic tree with the Checkpointer."""
+        self.checkpointer = checkpointer
+
+    def checkpoint(self):
+        """
+        Safe point of the main loop: saves a checkpoint if one is due. Must only be
+        called when the state returned by get_state is consistent.
+        """
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Returns what is needed to continue the run from a checkpoint. Subclasses with
+        a resumable main loop extend it with their pools and current solutions.
+        """
+        return {
+            "class": self.__class__.__name__,
+            "stop_criteria": self.stop_criteria.get_state(),
+            "meta_heuristics": [m.get_state() for m in self.meta_heuristics_used],
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restores a state returned by get_state on an identically built tree."""
+        if state["class"] != self.__class__.__name__:
+            raise ValueError(
+                f"Checkpoint of {state['class']} can not be restored "
+                f"into {self.__class__.__name__}."
+            )
+        self.stop_criteria.set_state(state["stop_criteria"])
+        for meta, meta_state in zip(
+            self.meta_heuristics_used, state["meta_heuristics"]
+        ):
+            meta.set_state(meta_state)
 
     def stop(self) -> bool:
         return self.stop_criteria.stop() or (
@@ -138,13 +206,29 @@ class MetaHeuristic(Entity, ABC):
         self.stop_criteria.set_progress_report(perc_counter)
 
     def log_best_solution(self, eval: "Evaluation"):
-        if self.log_solutions:
+        if self.trace is not None:
+            self.trace.record(
+                self.id,
+                self.thread_id,
+                eval.get_objective_function(),
+                not eval.infeasible(),
+                True,
+            )
+        elif self.log_solutions:
             self.solution_reports.best_solutions.append(
                 (self.stop_criteria.current_status(), eval.get_objective_function())
             )
 
     def log_current_solution(self, eval: "Evaluation"):
-        if self.log_solutions:
+        if self.trace is not None:
+            self.trace.record(
+                self.id,
+                self.thread_id,
+                eval.get_objective_function(),
+                not eval.infeasible(),
+                False,
+            )
+        elif self.log_solutions:
             self.solution_reports.current_solutions.append(
                 (self.stop_criteria.current_status(), eval.get_objective_function())
             )
@@ -158,6 +242,17 @@ class MetaHeuristic(Entity, ABC):
     def set_log_solution(self):
         self.log_solutions = True
 
+    def set_trace(self, trace: Optional["TraceWriter"]):
+        """
+        Streams the logged solutions of this MetaHeuristic and the ones it uses to a
+        TraceWriter instead of keeping them in solution_reports. None stops tracing.
+        """
+        self.trace = trace
+        if trace is not None:
+            self.log_solutions = True
+        for meta in self.meta_heuristics_used:
+            meta.set_trace(trace)
+
     def stop_on_evaluations(self, ev: "Evaluation") -> bool:
         return self.stop_on_evaluations([ev])
 
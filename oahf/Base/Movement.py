@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import FrozenSet, Hashable, Optional
 
 from oahf.Base.EfficiencyReport import EfficiencyReport
 from oahf.Base.Entity import Entity
 from oahf.Base.Evaluation import Evaluation
 from oahf.Base.Solution import Solution
 from oahf.Logger.LogManager import LogManager
+from oahf.Utils.Metrics import Metrics
+from oahf.Utils.Profiler import Profiler
 
 
 class Movement(Entity, ABC):
+    lazy_ids = True
+
     def __init__(self, solution: "Solution", report: "EfficiencyReport"):
         super().__init__()
         self.report: EfficiencyReport = report
@@ -28,16 +33,30 @@ class Movement(Entity, ABC):
         self.report.report_apply_start()
         result = False
 
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.enter(f"{type(self).__name__}.apply")
         try:
             result = self.apply()
         except Exception as ex:
             LogManager.invalid_action("apply movement", type(self).__name__, ex)
             raise
+        finally:
+            if profiler is not None:
+                profiler.exit()
 
         if result:
             self.report.report_apply_end()
         else:
             self.report.report_apply_failed()
+
+        metrics = Metrics.active
+        if metrics is not None:
+            metrics.inc(
+                "oahf_move_applies_total",
+                type(self).__name__,
+                "applied" if result else "failed",
+            )
         return result
 
     def report_apply_improvement(
@@ -46,6 +65,14 @@ class Movement(Entity, ABC):
         """Report an improvement when the movement is applied."""
         self.report.report_apply_improvement(new_evaluation, old_evaluation)
 
+    def get_modified_region(self) -> Optional[FrozenSet[Hashable]]:
+        """
+        Return the keys of the solution regions the movement modifies (e.g. the stations
+        and tasks it touches), so only constraints depending on them are re-evaluated.
+        None (the default) means the whole solution may have changed.
+        """
+        return None
+
     @abstractmethod
     def unapply(self) -> bool:
         """Revert the movement on the solution."""
@@ -56,11 +83,17 @@ class Movement(Entity, ABC):
         self.report.report_unapply_start(evaluation)
         result = False
 
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.enter(f"{type(self).__name__}.unapply")
         try:
             result = self.unapply()
         except Exception as ex:
             LogManager.invalid_action("unapply movement", type(self).__name__, ex)
             raise
+        finally:
+            if profiler is not None:
+                profiler.exit()
 
         self.report.report_unapply_end()
         return result
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import FrozenSet, Hashable, List, Optional
 
 from oahf.Base.EfficiencyReport import EfficiencyReport
 from oahf.Base.Movement import Movement
@@ -30,6 +30,16 @@ class MultipleMovement(Movement):
             worked = movement.apply_operation() or worked
         return worked
 
+    def get_modified_region(self) -> Optional[FrozenSet[Hashable]]:
+        """Return the union of the regions modified by each movement, None if any is unknown."""
+        region = frozenset()
+        for movement in self.movements:
+            movement_region = movement.get_modified_region()
+            if movement_region is None:
+                return None
+            region |= movement_region
+        return region
+
     def unapply(self) -> bool:
         """Unapply each movement in reverse order and return whether any movement was successfully unapplied."""
         worked = False
@@ -1,10 +1,12 @@
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type
 
 from oahf.Base.EfficiencyReport import EfficiencyReport
 from oahf.Base.Movement import Movement
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.Logger.LogManager import LogManager
+from oahf.Utils.Metrics import Metrics
+from oahf.Utils.Profiler import Profiler
 from oahf.Utils.Util import Util
 
 
@@ -23,6 +25,13 @@ class Neighborhood:
         self.report: "EfficiencyReport" = EfficiencyReport(type(self).__name__)
         self.stop_criteria: "StopCriteria" = stop_criteria
         self.is_perturbation: bool = is_perturbation
+        # [start, stop) indices of the movements get_move may return (see move_count)
+        self.move_range: Tuple[int, Optional[int]] = (0, None)
+        # Flagged elements of the don't-look bits (see set_dont_look_bits), None if off
+        self.dont_look_bits: Optional[Set[Hashable]] = None
+        # Elements with an improving movement in the current scan, None for all
+        self._improving: Optional[Set[Hashable]] = set()
+        self._looked_solution: Optional[int] = None
 
     def copy(self) -> "Neighborhood":
         """Abstract method to create a copy of the neighborhood."""
@@ -41,8 +50,20 @@ class Neighborhood:
         Returns:
             bool: True if the operation was successful, False otherwise.
         """
-        self.clear_related_keys()
-        return self.build_neighborhood(thread_id, solution)
+        if self.dont_look_bits is not None:
+            self._sync_dont_look_bits(solution)
+
+        profiler = Profiler.active
+        if profiler is None:
+            self.clear_related_keys()
+            return self.build_neighborhood(thread_id, solution)
+
+        profiler.enter(f"{type(self).__name__}.build")
+        try:
+            self.clear_related_keys()
+            return self.build_neighborhood(thread_id, solution)
+        finally:
+            profiler.exit()
 
     def build_neighborhood(self, thread_id: int, solution: "Solution") -> bool:
         """Abstract method to build the neighborhood. To be implemented in subclasses."""
@@ -52,13 +73,138 @@ class Neighborhood:
         """Abstract method to get a movement. To be implemented in subclasses."""
         raise NotImplementedError
 
+    def move_count(self) -> Optional[int]:
+        """
+        Returns the number of movements of the neighborhood last built, if it can be
+        split into disjoint ranges of movements. Splittable neighborhoods index their
+        movements deterministically from the solution and honor set_move_range.
+
+        Returns:
+            Optional[int]: The number of movements; None (the default) if the
+            neighborhood cannot be split.
+        """
+        return None
+
+    def set_move_range(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Restricts get_move to the movements with index in [start, stop) of the
+        neighborhoods built from now on; the defaults lift the restriction.
+
+        Args:
+            start (int): Index of the first movement.
+            stop (Optional[int]): Index after the last movement, None for the end.
+        """
+        self.move_range = (start, stop)
+
+    @staticmethod
+    def split_moves(count: int, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits movement indices into contiguous ranges of near-equal size.
+
+        Args:
+            count (int): The number of movements.
+            parts (int): The maximum number of ranges.
+
+        Returns:
+            List[Tuple[int, int]]: Non-empty [start, stop) ranges covering 0..count.
+        """
+        parts = max(1, min(parts, count))
+        return [(count * i // parts, count * (i + 1) // parts) for i in range(parts)]
+
     def reset(self, solution: "Solution") -> None:
         """Resets the neighborhood for the given solution. Can be overridden by subclasses."""
         pass
 
-    def accept_movement(self) -> None:
-        """Accepts the movement and clears related keys."""
+    def accept_movement(
+        self,
+        move: Optional["Movement"] = None,
+        solution: Optional["Solution"] = None,
+    ) -> None:
+        """
+        Accepts the movement and clears related keys. With don't-look bits, clears the
+        bits of the elements the movement modified (all bits if unknown).
+
+        Args:
+            move (Optional[Movement]): The accepted movement.
+            solution (Optional[Solution]): The solution after the movement, by default
+                the solution of the movement.
+        """
         self.clear_related_keys()
+        if self.dont_look_bits is not None:
+            self.look_again(move.get_modified_region() if move is not None else None)
+            if solution is None and move is not None:
+                solution = move.solution
+            self._looked_solution = (
+                solution.solution_hash() if solution is not None else None
+            )
+
+    def set_dont_look_bits(self, enabled: bool = True) -> None:
+        """
+        Enables don't-look bits: elements of the solution (e.g. tasks or stations, keyed
+        like Movement.get_modified_region) are flagged once a scan found no improving
+        movement involving them, and stay flagged until an accepted movement modifies
+        them or the neighborhood is built on another solution. Movements whose
+        elements are all flagged are skipped.
+
+        Subclasses opt in by calling dont_look(element) from get_move once all the
+        movements of an element were returned, and may skip generating the movements
+        of elements for which looks_at(element) is False.
+
+        Args:
+            enabled (bool): Whether to use don't-look bits.
+        """
+        self.dont_look_bits = set() if enabled else None
+        self._improving = set()
+        self._looked_solution = None
+
+    def looks_at(self, element: Hashable) -> bool:
+        """Returns whether the movements of an element must be scanned."""
+        bits = self.dont_look_bits
+        return bits is None or element not in bits
+
+    def dont_look(self, element: Hashable) -> None:
+        """
+        Flags an element whose movements were all scanned, unless one of them improved.
+        Called by get_move; does nothing when don't-look bits are off.
+        """
+        bits = self.dont_look_bits
+        if bits is not None and self._improving is not None:
+            if element not in self._improving:
+                bits.add(element)
+
+    def look_again(self, elements: Optional[Iterable[Hashable]] = None) -> None:
+        """Clears the bits of the given elements, or of all elements if None."""
+        bits = self.dont_look_bits
+        if bits is not None:
+            if elements is None:
+                bits.clear()
+            else:
+                bits.difference_update(elements)
+
+    def report_improving_move(self, move: "Movement") -> None:
+        """
+        Reports an improving movement of the current scan that was not accepted right
+        away (e.g. by best improvement), so its elements are not flagged.
+        """
+        if self.dont_look_bits is not None and self._improving is not None:
+            region = move.get_modified_region()
+            if region is None:
+                self._improving = None
+            else:
+                self._improving.update(region)
+
+    def _sync_dont_look_bits(self, solution: "Solution") -> None:
+        """Starts a scan, dropping the bits if the solution is not the last one."""
+        self._improving = set()
+        key = solution.solution_hash() if solution is not None else None
+        if key is None or key != self._looked_solution:
+            self.dont_look_bits.clear()
+        self._looked_solution = key
+
+    def _skipped(self, move: "Movement") -> bool:
+        """Returns whether all the elements a movement modifies are flagged."""
+        region = move.get_modified_region()
+        return bool(region) and region <= self.dont_look_bits
 
     def clear_related_keys(self) -> None:
         """Clears related keys. Can be overridden by subclasses."""
@@ -78,13 +224,26 @@ class Neighborhood:
 
         move: Optional["Movement"] = None
 
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.enter(f"{type(self).__name__}.get_move")
         try:
             move = self.get_move()
+            if self.dont_look_bits is not None:
+                while move is not None and self._skipped(move):
+                    move = self.get_move()
         except Exception as ex:
             LogManager.invalid_action(
                 "get movement, neighborhood", type(self).__name__, ex
             )
             raise
+        finally:
+            if profiler is not None:
+                profiler.exit()
+
+        metrics = Metrics.active
+        if metrics is not None and move is not None:
+            metrics.inc("oahf_moves_total", type(self).__name__)
 
         self.report.report_move_search_end()
         return move
@@ -6,6 +6,7 @@ from oahf.Base.Entity import Entity
 from oahf.Base.Evaluator import Evaluator
 from oahf.Base.Solution import Solution
 from oahf.Base.ThreadManager import ThreadManager
+from oahf.Utils.Metrics import Metrics
 
 
 class PoolEventReport:
@@ -71,7 +72,7 @@ class Pool(Entity, ABC):
         diversity = 0.0  # Assuming diversity calculation logic will be added
         self.report.events.append(
             (
-                ThreadManager.watch.elapsed_milliseconds,
+                ThreadManager.elapsed_milliseconds(),
                 PoolEventReport(
                     accepted,
                     eval.get_objective_function(),
@@ -80,6 +81,14 @@ class Pool(Entity, ABC):
                 ),
             )
         )
+
+        metrics = Metrics.active
+        if metrics is not None:
+            name = type(self).__name__
+            metrics.inc("oahf_pool_additions_total", name, str(accepted).lower())
+            metrics.set_gauge("oahf_pool_size", self.count(), name)
+            if accepted:
+                metrics.observe_incumbent(name, eval)
         return accepted
 
     def get_report(self) -> PoolReport:
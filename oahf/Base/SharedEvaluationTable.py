@@ -0,0 +1,212 @@
+import hashlib
+import multiprocessing
+import os
+import struct
+import time
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from oahf.Base.Constraint import Constraint
+from oahf.Base.ConstraintEvaluation import ConstraintEvaluation
+from oahf.Base.Entity import Entity
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Solution import Solution
+
+
+class _StoredConstraint(Constraint):
+    """Stands for the constraints violated by a stored infeasible evaluation."""
+
+    lazy_ids = True
+
+    def evaluate(self, solution: "Solution") -> "ConstraintEvaluation":
+        return ConstraintEvaluation(self, True)
+
+
+# The only constraint evaluation of stored infeasible evaluations
+_STORED_INFEASIBILITY = ConstraintEvaluation(_StoredConstraint(), True)
+
+
+class StoredEvaluation(Evaluation):
+    """
+    Evaluation rebuilt from a SharedEvaluationTable entry. The violated constraints
+    are unknown, so an infeasible one holds a single placeholder infeasible
+    ConstraintEvaluation. The full evaluation, with the constraint evaluations that
+    Evaluator.evaluate_move reuses, can be attached with set_details.
+    """
+
+    __slots__ = ("_details",)
+
+    def __init__(self, objective_function: float, infeasible: bool):
+        super().__init__((_STORED_INFEASIBILITY,) if infeasible else ())
+        self._objective_function = objective_function
+        # Function computing the full evaluation, replaced by its result once called
+        self._details: Union[None, Callable[[], Evaluation], Evaluation] = None
+
+    def set_details(self, details: Callable[[], Evaluation]) -> None:
+        """
+        Sets how to compute the full evaluation of the solution.
+        :param details: Function evaluating a copy of the solution, called once.
+        """
+        self._details = details
+
+    def details(self) -> Optional[Evaluation]:
+        """
+        Returns the full evaluation of the solution, computed on the first call.
+        :return: The full Evaluation, None if no details were set.
+        """
+        details = self._details
+        if details is None:
+            return None
+        if not isinstance(details, Evaluation):
+            details = self._details = details()
+        return details
+
+
+class SharedEvaluationTable(Entity):
+    """
+    Fixed-size table of (objective function, feasibility) keyed by solution hash, stored
+    in a multiprocessing.shared_memory block so worker processes share it.
+
+    The table is set-associative open addressing: a key may only live in one of the
+    `ways` slots of its bucket, and when they are all taken the oldest entry is
+    evicted. Buckets are guarded by a fixed number of striped process locks.
+
+    The locks can only be handed to other processes at creation time, so the table
+    must be passed as a Process argument or a pool initializer argument.
+    """
+
+    # Slot layout: key (0 = empty), objective function, stamp << 1 | infeasible
+    _SLOT = struct.Struct("<QdQ")
+    _KEY_MASK = (1 << 64) - 1
+
+    def __init__(self, capacity: int, ways: int = 8, stripes: int = 64):
+        """
+        Create the shared block.
+        :param capacity: Maximum number of stored evaluations.
+        :param ways: Number of slots a key may be stored in.
+        :param stripes: Number of process locks guarding the buckets.
+        """
+        super().__init__()
+        self.ways: int = max(1, ways)
+        self.buckets: int = max(1, -(-capacity // self.ways))
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=self.buckets * self.ways * self._SLOT.size
+        )
+        self._memory.buf[:] = bytes(self._memory.size)
+        self._locks: List[Any] = [multiprocessing.Lock() for _ in range(stripes)]
+        # Releases the block when the table is collected or the interpreter exits
+        self._finalizer = weakref.finalize(
+            self, SharedEvaluationTable._release, self._memory, os.getpid()
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "ways": self.ways,
+            "buckets": self.buckets,
+            "name": self._memory.name,
+            "locks": self._locks,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        Entity.__init__(self, state["id"])
+        self.ways = state["ways"]
+        self.buckets = state["buckets"]
+        self._memory = shared_memory.SharedMemory(name=state["name"])
+        self._locks = state["locks"]
+        self._finalizer = weakref.finalize(
+            self, SharedEvaluationTable._release, self._memory, None
+        )
+
+    @staticmethod
+    def _release(memory: shared_memory.SharedMemory, owner: Optional[int]) -> None:
+        """
+        Detach from the block, unlinking it in the creating process (owner pid), not in
+        forked children holding a copy of the table.
+        """
+        memory.close()
+        if owner == os.getpid():
+            memory.unlink()
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots of the table."""
+        return self.buckets * self.ways
+
+    @classmethod
+    def _to_key(cls, key: Hashable) -> int:
+        """Maps a key to a non-zero 64 bits integer, stable across processes."""
+        if isinstance(key, int):
+            value = key & cls._KEY_MASK
+        else:
+            value = int.from_bytes(
+                hashlib.blake2b(str(key).encode("utf-8"), digest_size=8).digest(),
+                "little",
+            )
+        return value or 1
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, bool]]:
+        """
+        Look a key up.
+        :param key: Solution hash.
+        :return: (objective function, infeasible) or None if absent.
+        """
+        table_key = self._to_key(key)
+        bucket = table_key % self.buckets
+        offset = bucket * self.ways * self._SLOT.size
+        with self._locks[bucket % len(self._locks)]:
+            for _ in range(self.ways):
+                slot_key, objective, meta = self._SLOT.unpack_from(
+                    self._memory.buf, offset
+                )
+                if slot_key == table_key:
+                    return objective, bool(meta & 1)
+                offset += self._SLOT.size
+        return None
+
+    def put(self, key: Hashable, objective_function: float, infeasible: bool) -> None:
+        """
+        Store an entry, replacing the key's previous entry or evicting the oldest one
+        of its bucket.
+        :param key: Solution hash.
+        :param objective_function: Objective function of the solution.
+        :param infeasible: Whether the solution is infeasible.
+        """
+        table_key = self._to_key(key)
+        bucket = table_key % self.buckets
+        start = bucket * self.ways * self._SLOT.size
+        meta = (time.monotonic_ns() << 1 | int(infeasible)) & self._KEY_MASK
+        with self._locks[bucket % len(self._locks)]:
+            target = None
+            oldest = None
+            offset = start
+            for _ in range(self.ways):
+                slot_key, _, slot_meta = self._SLOT.unpack_from(
+                    self._memory.buf, offset
+                )
+                if slot_key == table_key or slot_key == 0:
+                    target = offset
+                    break
+                if oldest is None or slot_meta >> 1 < oldest[1]:
+                    oldest = (offset, slot_meta >> 1)
+                offset += self._SLOT.size
+            if target is None:
+                target = oldest[0]
+            self._SLOT.pack_into(
+                self._memory.buf, target, table_key, objective_function, meta
+            )
+
+    def add_solution_node(self, key: Hashable, evaluation: Evaluation) -> bool:
+        """Store the objective function and feasibility of an evaluation."""
+        self.put(key, evaluation.get_objective_function(), evaluation.infeasible())
+        return True
+
+    def get_solution_node(self, key: Hashable) -> Optional[Evaluation]:
+        """Retrieve a stored evaluation, without its constraint evaluations."""
+        entry = self.get(key)
+        return None if entry is None else StoredEvaluation(*entry)
+
+    def close(self) -> None:
+        """Detach from the shared block, releasing it if this is the creating process."""
+        self._finalizer()
@@ -1,29 +1,76 @@
-from collections import defaultdict
-from typing import Dict
+import threading
+from typing import Dict, Hashable, List, Optional
 
 from oahf.Base.Entity import Entity
 from oahf.Base.Evaluation import Evaluation
 
 
 class SharedMemory(Entity):
-    def __init__(self):
-        """Initialize the shared memory with a thread-safe dictionary for solution nodes."""
+    """
+    Thread-safe store of evaluations of already-seen solutions, keyed by solution hash
+    (or string representation).
+
+    Keys are spread over independently locked stripes so threads writing different
+    solutions rarely contend, and reads take no lock. When a capacity is given each
+    stripe evicts its oldest entry once full.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, stripes: int = 16):
+        """
+        Initialize the shared memory.
+        :param capacity: Maximum number of stored evaluations, None for unbounded.
+        :param stripes: Number of independently locked partitions.
+        """
         super().__init__()
-        self.solution_nodes: Dict[str, Evaluation] = defaultdict(Evaluation)
+        self.capacity: Optional[int] = capacity
+        self.stripes: int = max(1, stripes)
+        self._stripe_capacity: Optional[int] = (
+            None if capacity is None else max(1, capacity // self.stripes)
+        )
+        self._locks: List[threading.Lock] = [
+            threading.Lock() for _ in range(self.stripes)
+        ]
+        self._nodes: List[Dict[Hashable, Evaluation]] = [
+            {} for _ in range(self.stripes)
+        ]
+
+    def _stripe(self, key: Hashable) -> int:
+        """Index of the stripe holding the key."""
+        return hash(key) % self.stripes
 
-    def add_solution_node(self, key: str, evaluation: Evaluation) -> bool:
-        """Add a solution node to the shared memory."""
-        # Adding to a regular dictionary; thread safety can be managed as needed
-        self.solution_nodes[key] = evaluation
+    def add_solution_node(self, key: Hashable, evaluation: Evaluation) -> bool:
+        """Add a solution node to the shared memory, evicting the oldest one if full."""
+        index = self._stripe(key)
+        nodes = self._nodes[index]
+        with self._locks[index]:
+            if key in nodes:
+                del nodes[key]  # re-inserted below as the newest entry
+            elif (
+                self._stripe_capacity is not None
+                and len(nodes) >= self._stripe_capacity
+            ):
+                del nodes[next(iter(nodes))]
+            nodes[key] = evaluation
         return True
 
-    def get_solution_node(self, key: str) -> Evaluation:
-        """Retrieve a solution node from the shared memory."""
-        return self.solution_nodes.get(key)
+    def get_solution_node(self, key: Hashable) -> Optional[Evaluation]:
+        """Retrieve a solution node from the shared memory (dict reads are atomic)."""
+        return self._nodes[self._stripe(key)].get(key)
 
-    def remove_solution_node(self, key: str) -> bool:
+    def remove_solution_node(self, key: Hashable) -> bool:
         """Remove a solution node from the shared memory."""
-        if key in self.solution_nodes:
-            del self.solution_nodes[key]
-            return True
-        return False
+        index = self._stripe(key)
+        with self._locks[index]:
+            return self._nodes[index].pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all solution nodes."""
+        for lock, nodes in zip(self._locks, self._nodes):
+            with lock:
+                nodes.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes[self._stripe(key)]
+
+    def __len__(self) -> int:
+        return sum(len(nodes) for nodes in self._nodes)
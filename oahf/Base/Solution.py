@@ -5,6 +5,8 @@ from oahf.Base.Entity import Entity
 
 
 class Solution(Entity, ABC):
+    lazy_ids = True
+
     def __init__(self) -> None:
         super().__init__()  # Call the constructor of the Entity class
 
@@ -25,6 +27,21 @@ class Solution(Entity, ABC):
         """
         return None
 
+    def shift_decomposition(self, k: int, shift: int) -> Optional[List["Solution"]]:
+        """Decomposes the solution into k parts whose boundaries are moved by shift
+        units, so consecutive shifts cut the solution at different places. Parts are
+        put back together by merge_solutions. Override to support shifting; the
+        default ignores the shift.
+
+        Args:
+            k (int): The number of parts to decompose into.
+            shift (int): How far to move the part boundaries.
+
+        Returns:
+            Optional[List[Solution]]: A list of decomposed solutions or None.
+        """
+        return self.decompose_solution(k)
+
     @abstractmethod
     def merge_solutions(self, solutions: List["Solution"]) -> "Solution":
         """Merges multiple solutions into one.
@@ -58,6 +75,40 @@ class Solution(Entity, ABC):
         """
         pass
 
+    def instance_fingerprint(self) -> Optional[str]:
+        """Identifies the problem instance the solution belongs to, so solutions of
+        the same instance can be stored and retrieved together (SolutionArchive).
+
+        Returns:
+            Optional[str]: A stable digest of the instance data, or None if unknown.
+        """
+        return None
+
+    def to_bytes(self) -> bytes:
+        """Packs the solution for storage. Override to store only the decision
+        variables, leaving the instance data out.
+
+        Returns:
+            bytes: The packed solution, read back with from_bytes.
+        """
+        import pickle
+
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def from_bytes(self, data: bytes) -> "Solution":
+        """Unpacks a solution packed with to_bytes. Called on a solution of the same
+        instance, which supplies the instance data.
+
+        Args:
+            data (bytes): The packed solution.
+
+        Returns:
+            Solution: A new solution.
+        """
+        import pickle
+
+        return pickle.loads(data)
+
     @abstractmethod
     def solution_string_representation(self) -> str:
         """Gets a string representation of the solution.
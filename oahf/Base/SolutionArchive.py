@@ -0,0 +1,347 @@
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.Pool import Pool
+from oahf.Base.Solution import Solution
+
+
+class SolutionArchive:
+    """
+    Persistent archive of solutions shared across runs, for warm starts.
+
+    Solutions are keyed by (instance fingerprint, solution hash). A SQLite index
+    keeps their objective function and feasibility, and points into an append-only
+    file of packed solutions (Solution.to_bytes) read through a memory map, so the
+    top-k solutions of an instance are found by one indexed query and unpacked
+    without copying the blob file.
+
+    Example:
+        with SolutionArchive("archive") as archive:
+            archive.seed_pool(pool, instance, k=10)
+            best = ils.run_operation(pool.get_best(evaluator))
+            archive.flush_pool(pool, evaluator)
+
+    The archive is safe to share between the threads of a process; it assumes a
+    single writing process at a time.
+    """
+
+    INDEX_FILE = "index.sqlite"
+    # Blob file of a new archive; compact() writes the next generations
+    # (solutions.1.bin, solutions.2.bin, ...) and records the current one in the index
+    BLOB_FILE = "solutions.bin"
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Opens (or creates) the archive.
+        :param directory: Directory holding the index and the blob file.
+        """
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+
+        self._db = sqlite3.connect(
+            self.directory / self.INDEX_FILE, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            " fingerprint TEXT NOT NULL,"
+            " hash INTEGER NOT NULL,"
+            " infeasible INTEGER NOT NULL,"
+            " objective REAL NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " PRIMARY KEY (fingerprint, hash))"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_rank"
+            " ON solutions (fingerprint, infeasible, objective)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS settings ("
+            " name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+        row = self._db.execute(
+            "SELECT value FROM settings WHERE name = 'blob_file'"
+        ).fetchone()
+        self._blob_file: str = row[0] if row is not None else self.BLOB_FILE
+        self._remove_stale_blob_files()
+        self._blobs = open(self.directory / self._blob_file, "a+b")
+        self._map: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "SolutionArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the index and the blob file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._blobs.close()
+            self._db.close()
+
+    def _remove_stale_blob_files(self) -> None:
+        """Removes blob files of other generations, left by an interrupted compact."""
+        stem, suffix = os.path.splitext(self.BLOB_FILE)
+        for path in self.directory.glob(f"{stem}*{suffix}"):
+            if path.name != self._blob_file:
+                path.unlink()
+
+    @staticmethod
+    def _fingerprint(solution: Solution, fingerprint: Optional[str]) -> str:
+        """Returns the given fingerprint or the solution's instance fingerprint."""
+        fingerprint = fingerprint or solution.instance_fingerprint()
+        if fingerprint is None:
+            raise ValueError(
+                f"{type(solution).__name__} has no instance_fingerprint; "
+                "pass the fingerprint explicitly."
+            )
+        return fingerprint
+
+    @staticmethod
+    def _key(solution: Solution) -> int:
+        """Solution hash as a signed 64-bit SQLite integer."""
+        key = solution.solution_hash() & 0xFFFFFFFFFFFFFFFF
+        return key - (1 << 64) if key >= 1 << 63 else key
+
+    def add(
+        self,
+        solution: Solution,
+        evaluator: Evaluator,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Archives a solution.
+        :param solution: The solution.
+        :param evaluator: Evaluator giving the stored objective function.
+        :param fingerprint: The instance fingerprint, by default the solution's.
+        :return: True if the solution was not archived yet.
+        """
+        return self.add_many([solution], evaluator, fingerprint) == 1
+
+    def add_many(
+        self,
+        solutions: Iterable[Solution],
+        evaluator: Evaluator,
+        fingerprint: Optional[str] = None,
+    ) -> int:
+        """
+        Archives solutions with one write to the blob file and one transaction.
+        :param solutions: The solutions.
+        :param evaluator: Evaluator giving the stored objective function.
+        :param fingerprint: The instance fingerprint, by default each solution's.
+        :return: Number of solutions that were not archived yet.
+        """
+        with self._lock:
+            rows: List[Tuple[str, int, int, float, int, int, float]] = []
+            blobs: List[bytes] = []
+            seen = set()
+            offset = self._blobs.seek(0, os.SEEK_END)
+            created = time.time()
+            for solution in solutions:
+                if solution is None:
+                    continue
+                solution_fingerprint = self._fingerprint(solution, fingerprint)
+                key = self._key(solution)
+                if (solution_fingerprint, key) in seen or self._contains(
+                    solution_fingerprint, key
+                ):
+                    continue
+                seen.add((solution_fingerprint, key))
+
+                evaluation = evaluator.evaluate(solution)
+                blob = solution.to_bytes()
+                rows.append(
+                    (
+                        solution_fingerprint,
+                        key,
+                        int(evaluation.infeasible()),
+                        evaluation.get_objective_function(),
+                        offset,
+                        len(blob),
+                        created,
+                    )
+                )
+                blobs.append(blob)
+                offset += len(blob)
+
+            if not rows:
+                return 0
+
+            # Blobs first: an index row never points past the end of the file
+            self._blobs.write(b"".join(blobs))
+            self._blobs.flush()
+            os.fsync(self._blobs.fileno())
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            return len(rows)
+
+    def _contains(self, fingerprint: str, key: int) -> bool:
+        return (
+            self._db.execute(
+                "SELECT 1 FROM solutions WHERE fingerprint = ? AND hash = ?",
+                (fingerprint, key),
+            ).fetchone()
+            is not None
+        )
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Reads a blob through the memory map, remapping it if the file grew."""
+        if self._map is None or offset + length > len(self._map):
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._blobs.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length]
+
+    def top_k(
+        self,
+        template: Solution,
+        k: int,
+        fingerprint: Optional[str] = None,
+        feasible_only: bool = False,
+    ) -> List[Solution]:
+        """
+        Retrieves the best archived solutions of an instance, best first.
+        :param template: A solution of the instance, used to unpack the others.
+        :param k: Maximum number of solutions.
+        :param fingerprint: The instance fingerprint, by default the template's.
+        :param feasible_only: Skip infeasible solutions.
+        :return: The solutions ordered by feasibility then objective function.
+        """
+        fingerprint = self._fingerprint(template, fingerprint)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT offset, length FROM solutions WHERE fingerprint = ?"
+                + (" AND infeasible = 0" if feasible_only else "")
+                + " ORDER BY infeasible, objective LIMIT ?",
+                (fingerprint, k),
+            ).fetchall()
+            blobs = [self._read(offset, length) for offset, length in rows]
+        return [template.from_bytes(blob) for blob in blobs]
+
+    def seed_pool(
+        self,
+        pool: Pool,
+        template: Solution,
+        k: int,
+        fingerprint: Optional[str] = None,
+    ) -> int:
+        """
+        Adds the k best archived solutions of the instance to a pool.
+        :param pool: The pool to seed.
+        :param template: A solution of the instance.
+        :param k: Maximum number of solutions.
+        :param fingerprint: The instance fingerprint, by default the template's.
+        :return: Number of solutions accepted by the pool.
+        """
+        return sum(
+            1
+            for solution in self.top_k(template, k, fingerprint)
+            if pool.add_solution(solution)
+        )
+
+    def flush_pool(
+        self, pool: Pool, evaluator: Evaluator, fingerprint: Optional[str] = None
+    ) -> int:
+        """
+        Archives every solution of a pool.
+        :param pool: The pool.
+        :param evaluator: Evaluator giving the stored objective function.
+        :param fingerprint: The instance fingerprint, by default each solution's.
+        :return: Number of solutions that were not archived yet.
+        """
+        return self.add_many(pool.get_list(), evaluator, fingerprint)
+
+    def count(self, fingerprint: Optional[str] = None) -> int:
+        """Number of archived solutions, of one instance or in total."""
+        with self._lock:
+            if fingerprint is None:
+                query = self._db.execute("SELECT COUNT(*) FROM solutions")
+            else:
+                query = self._db.execute(
+                    "SELECT COUNT(*) FROM solutions WHERE fingerprint = ?",
+                    (fingerprint,),
+                )
+            return query.fetchone()[0]
+
+    def prune(self, fingerprint: str, keep: int) -> int:
+        """
+        Keeps only the best solutions of an instance; compact() reclaims the space.
+        :param fingerprint: The instance fingerprint.
+        :param keep: Number of solutions kept.
+        :return: Number of solutions removed.
+        """
+        with self._lock, self._db:
+            return self._db.execute(
+                "DELETE FROM solutions WHERE fingerprint = ? AND hash NOT IN ("
+                " SELECT hash FROM solutions WHERE fingerprint = ?"
+                " ORDER BY infeasible, objective LIMIT ?)",
+                (fingerprint, fingerprint, keep),
+            ).rowcount
+
+    def compact(self) -> None:
+        """
+        Rewrites the blob file without the blobs of removed solutions. Meant to be run
+        between runs. The blobs are copied to a new generation of the blob file, and
+        one transaction switches the index to the new file and offsets, so a crash
+        leaves the archive on either the old or the new generation; the old file is
+        removed afterwards (or when the archive is next opened).
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT fingerprint, hash, offset, length FROM solutions"
+                " ORDER BY offset"
+            ).fetchall()
+            stem, suffix = os.path.splitext(self.BLOB_FILE)
+            generation = 1
+            if self._blob_file != self.BLOB_FILE:
+                generation = int(self._blob_file[len(stem) + 1 : -len(suffix)]) + 1
+            blob_file = f"{stem}.{generation}{suffix}"
+
+            updates = []
+            with open(self.directory / blob_file, "wb") as file:
+                offset = 0
+                for fingerprint, key, old_offset, length in rows:
+                    file.write(self._read(old_offset, length))
+                    updates.append((offset, fingerprint, key))
+                    offset += length
+                file.flush()
+                os.fsync(file.fileno())
+
+            with self._db:
+                self._db.executemany(
+                    "UPDATE solutions SET offset = ?"
+                    " WHERE fingerprint = ? AND hash = ?",
+                    updates,
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO settings VALUES ('blob_file', ?)",
+                    (blob_file,),
+                )
+
+            # The switch must be durable before the old generation is removed
+            self._db.execute("PRAGMA wal_checkpoint(FULL)")
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._blobs.close()
+            old_file = self._blob_file
+            self._blob_file = blob_file
+            self._blobs = open(self.directory / blob_file, "a+b")
+            os.unlink(self.directory / old_file)
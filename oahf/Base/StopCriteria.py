@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, Dict, Iterable
 
 from oahf.Base.Evaluation import Evaluation
 from oahf.Base.ThreadManager import ThreadManager
@@ -23,6 +23,22 @@ class StopCriteria(ABC):
         """Resets the stopping criteria."""
         pass
 
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the counters needed to continue from a checkpoint.
+
+        Returns:
+            Dict[str, Any]: The state, restored with set_state.
+        """
+        return {}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores the counters saved by get_state.
+
+        Args:
+            state (Dict[str, Any]): A state returned by get_state.
+        """
+        pass
+
     def stop_on_evaluations(self, evaluations: Iterable["Evaluation"]) -> bool:
         """Checks if the stopping criteria are met based on evaluations.
 
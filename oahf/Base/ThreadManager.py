@@ -1,7 +1,7 @@
 import random
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Dict, Iterable, TypeVar
+from typing import Any, Callable, Dict, Iterable, TypeVar
 
 TSource = TypeVar("TSource")
 
@@ -21,6 +21,33 @@ class ThreadManager:
             else:
                 cls._random_keys[i] = random.Random(seed + i)
 
+    @classmethod
+    def elapsed_milliseconds(cls) -> int:
+        """Returns the milliseconds elapsed since initialize."""
+        return int((time.time() - cls._watch) * 1000)
+
+    @classmethod
+    def get_random_state(cls) -> Dict[int, Any]:
+        """Returns the state of every thread's random stream, used by checkpoints."""
+        return {i: r.getstate() for i, r in cls._random_keys.items()}
+
+    @classmethod
+    def set_random_state(cls, states: Dict[int, Any]) -> None:
+        """Restores the random streams saved by get_random_state."""
+        for i, state in states.items():
+            if i not in cls._random_keys:
+                cls._random_keys[i] = random.Random()
+            cls._random_keys[i].setstate(state)
+
+    @classmethod
+    def reseed(cls, salt: int) -> None:
+        """
+        Derives new streams from the current ones and a salt, e.g. in forked worker
+        processes, which would otherwise all draw the same numbers.
+        """
+        for i, stream in cls._random_keys.items():
+            cls._random_keys[i] = random.Random(stream.getrandbits(64) ^ salt)
+
     @classmethod
     def get_next_double(cls, thread_id: int) -> float:
         """Gets the next random double for the specified thread ID."""
@@ -1,28 +1,41 @@
-from .AcceptanceCriteria import AcceptanceCriteria
-from .Constraint import Constraint
-from .ConstraintEvaluation import ConstraintEvaluation
-from .CrossOver import CrossOver
-from .EfficiencyReport import EfficiencyReport
-from .Entity import Entity
-from .Evaluation import Evaluation
-from .Evaluator import Evaluator
-from .MetaHeuristic import MetaHeuristic
-from .Movement import Movement
-from .MultipleMovement import MultipleMovement
-from .Neighborhood import Neighborhood
-from .NeighborhoodSelection import NeighborhoodSelection
-from .Pool import Pool
-from .Selection import Selection
-from .SharedMemory import SharedMemory
-from .Solution import Solution
-from .StopCriteria import StopCriteria
-from .ThreadManager import ThreadManager
+from typing import TYPE_CHECKING
+
+from oahf.Utils.LazyLoader import LazyLoader
+
+if TYPE_CHECKING:
+    from .AcceptanceCriteria import AcceptanceCriteria
+    from .CachedNeighborhood import CachedNeighborhood
+    from .Checkpointer import Checkpointer
+    from .Constraint import Constraint
+    from .ConstraintEvaluation import ConstraintEvaluation
+    from .CrossOver import CrossOver
+    from .DifferenceNeighborhood import DifferenceNeighborhood
+    from .EfficiencyReport import EfficiencyReport
+    from .Entity import Entity
+    from .Evaluation import Evaluation
+    from .Evaluator import Evaluator
+    from .MetaHeuristic import MetaHeuristic
+    from .Movement import Movement
+    from .MultipleMovement import MultipleMovement
+    from .Neighborhood import Neighborhood
+    from .NeighborhoodSelection import NeighborhoodSelection
+    from .Pool import Pool
+    from .Selection import Selection
+    from .SharedEvaluationTable import SharedEvaluationTable, StoredEvaluation
+    from .SharedMemory import SharedMemory
+    from .Solution import Solution
+    from .SolutionArchive import SolutionArchive
+    from .StopCriteria import StopCriteria
+    from .ThreadManager import ThreadManager
 
 __all__ = [
     "AcceptanceCriteria",
+    "CachedNeighborhood",
+    "Checkpointer",
     "Constraint",
     "ConstraintEvaluation",
     "CrossOver",
+    "DifferenceNeighborhood",
     "EfficiencyReport",
     "Entity",
     "Evaluation",
@@ -34,8 +47,17 @@ __all__ = [
     "NeighborhoodSelection",
     "Pool",
     "Selection",
+    "SharedEvaluationTable",
     "SharedMemory",
     "Solution",
+    "SolutionArchive",
     "StopCriteria",
+    "StoredEvaluation",
     "ThreadManager",
 ]
+
+# Attribute -> submodule defining it, imported on first access
+_exports = {name: name for name in __all__}
+_exports["StoredEvaluation"] = "SharedEvaluationTable"
+
+__getattr__, __dir__ = LazyLoader.attach(__name__, _exports)
@@ -1,7 +1,13 @@
-from typing import List, Optional, Dict
+import hashlib
+from array import array
+from typing import FrozenSet, Iterable, List, Optional, Dict, Tuple
 from oahf.Base.Solution import Solution
 
 class ALWABP(Solution):
+    # Region key kinds used by movements (get_modified_region) and constraints (dependencies)
+    STATION_REGION: str = "STATION"
+    TASK_REGION: str = "TASK"
+
     def __init__(self, number_of_tasks: int, number_of_workers: int, number_of_stations: int) -> None:
         """
         Initializes the ALWABP problem with the given number of tasks, workers, and stations.
@@ -22,6 +28,11 @@ class ALWABP(Solution):
         # Dictionary where key = station, value = dictionary {worker: list of tasks assigned to that worker}
         self.station_assignment: Dict[int, Dict[int, List[int]]] = {station: {worker: [] for worker in self.workers} for station in self.stations}
 
+        # Only set on the parts of a decomposition: key = task outside the part, value = its station in the
+        # decomposed solution. Those tasks stay there while the part is optimized, so precedence checks treat
+        # them as fixed.
+        self.fixed_task_stations: Dict[int, int] = {}
+
     def set_task_execution_times(self, task_number: int, execution_times: List[int]) -> None:
         """
         Sets the list of execution times for a specific task.
@@ -42,6 +53,24 @@ class ALWABP(Solution):
         # Set the execution times for the task
         self.task_execution_times[task_number] = execution_times
 
+    @staticmethod
+    def get_region(stations: Iterable[int] = (), tasks: Iterable[int] = ()) -> FrozenSet[Tuple[str, int]]:
+        """
+        Builds the region keys for the given stations and tasks, to be returned by movements
+        modifying them or declared as dependencies by constraints reading them.
+
+        Args:
+            stations (Iterable[int]): The stations touched.
+            tasks (Iterable[int]): The tasks touched.
+
+        Returns:
+            FrozenSet[Tuple[str, int]]: The region keys.
+        """
+        return frozenset(
+            [(ALWABP.STATION_REGION, station) for station in stations]
+            + [(ALWABP.TASK_REGION, task) for task in tasks]
+        )
+
     def copy(self) -> "ALWABP":
         """
         Creates a copy of the current solution.
@@ -49,34 +78,100 @@ class ALWABP(Solution):
         Returns:
             ALWABP: A new instance of the ALWABP solution with the same data.
         """
-        new_copy = ALWABP(len(self.tasks), len(self.workers), len(self.stations))
+        new_copy = ALWABP(0, 0, 0)
+        # Parts of a decomposition keep the original numbers of their tasks, workers and stations
+        new_copy.tasks = self.tasks[:]
+        new_copy.workers = self.workers[:]
+        new_copy.stations = self.stations[:]
+        new_copy.fixed_task_stations = self.fixed_task_stations
         new_copy.task_execution_times = {task: times[:] for task, times in self.task_execution_times.items()}
         new_copy.station_assignment = {station: {worker: tasks[:] for worker, tasks in workers.items()} for station, workers in self.station_assignment.items()}
         return new_copy
 
     def decompose_solution(self, k: int) -> Optional[List["ALWABP"]]:
         """
-        Decomposes the solution into smaller parts (not implemented).
+        Decomposes the solution into k parts of contiguous stations (see shift_decomposition).
 
         Args:
             k (int): The number of parts to decompose into.
 
-        Raises:
-            NotImplementedError: This function is not implemented.
+        Returns:
+            Optional[List[ALWABP]]: The parts, in station order.
         """
-        raise NotImplementedError("Decomposition is not supported for this problem.")
+        return self.shift_decomposition(k, 0)
+
+    def shift_decomposition(self, k: int, shift: int) -> Optional[List["ALWABP"]]:
+        """
+        Decomposes the solution into at most k ranges of contiguous stations, with every range boundary moved
+        shift stations forward (modulo the range length). Each part holds the stations of its range, the tasks
+        assigned there and the workers executing them, keeping their original numbers, so a part is a smaller
+        ALWABP that can be optimized on its own. Workers without tasks are spread over the parts, each given to
+        one part only, so the subproblems may use them too. The stations of the tasks outside a part are kept in
+        its fixed_task_stations, so precedence between the tasks of the part and the fixed ones stays checkable.
+
+        Args:
+            k (int): The number of parts to decompose into.
+            shift (int): How many stations to move the range boundaries.
+
+        Returns:
+            Optional[List[ALWABP]]: The parts, in station order; None if there are no stations.
+        """
+        if not self.stations:
+            return None
+        k = max(1, min(k, len(self.stations)))
+        step = len(self.stations) // k
+        offset = shift % step if step > 1 else 0
+        cuts = [0] + [len(self.stations) * i // k + offset for i in range(1, k)] + [len(self.stations)]
+
+        task_stations = {task: station for station, workers in self.station_assignment.items() for tasks in workers.values() for task in tasks}
+        ranges = [(start, stop) for start, stop in zip(cuts, cuts[1:]) if start < stop]
+        idle = [worker for worker in self.workers if not any(workers[worker] for workers in self.station_assignment.values())]
+        return [self._station_range_part(self.stations[start:stop], task_stations, idle[i::len(ranges)]) for i, (start, stop) in enumerate(ranges)]
+
+    def _station_range_part(self, stations: List[int], task_stations: Dict[int, int], idle_workers: List[int]) -> "ALWABP":
+        """
+        Builds the part of a decomposition holding the given stations.
+
+        Args:
+            stations (List[int]): The stations of the part.
+            task_stations (Dict[int, int]): The station of every assigned task of the solution.
+            idle_workers (List[int]): Workers without tasks in the solution given to this part.
+
+        Returns:
+            ALWABP: The part, sharing the execution times with this solution.
+        """
+        in_part = set(stations)
+        workers = [worker for worker in self.workers if worker in idle_workers or any(self.station_assignment[station][worker] for station in stations)]
+        part = ALWABP(0, 0, 0)
+        part.stations = stations
+        part.workers = workers
+        part.tasks = sorted(task for station in stations for tasks in self.station_assignment[station].values() for task in tasks)
+        part.task_execution_times = {task: self.task_execution_times[task] for task in part.tasks}
+        part.station_assignment = {station: {worker: self.station_assignment[station][worker][:] for worker in workers} for station in stations}
+        part.fixed_task_stations = {task: station for task, station in task_stations.items() if station not in in_part}
+        return part
 
     def merge_solutions(self, solutions: List["ALWABP"]) -> "ALWABP":
         """
-        Merges multiple solutions into one (not implemented).
+        Merges the parts of a decomposition of this solution back into a whole solution, in time linear in the
+        size of the assignment: the stations of every part take the assignment of the part, the other stations
+        keep the assignment of this solution.
 
         Args:
-            solutions (List[ALWABP]): A list of solutions to merge.
+            solutions (List[ALWABP]): The (optimized) parts returned by decompose_solution or shift_decomposition.
 
-        Raises:
-            NotImplementedError: This function is not implemented.
+        Returns:
+            ALWABP: The merged solution.
         """
-        raise NotImplementedError("Merging is not supported for this problem.")
+        merged = self.copy()
+        merged.fixed_task_stations = {}
+        for part in solutions:
+            for station in part.stations:
+                assignment = {worker: [] for worker in merged.workers}
+                for worker, tasks in part.station_assignment[station].items():
+                    assignment[worker] = tasks[:]
+                merged.station_assignment[station] = assignment
+        return merged
 
     def solution_hash(self) -> int:
         """
@@ -93,6 +188,54 @@ class ALWABP(Solution):
             frozenset((station, frozenset((worker, tuple(tasks)) for worker, tasks in workers.items())) for station, workers in self.station_assignment.items())
         ))
 
+    def instance_fingerprint(self) -> str:
+        """
+        Digest of the instance data (tasks, workers, stations and execution times), shared by all
+        solutions of the same instance.
+
+        Returns:
+            str: The hexadecimal digest.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(array("q", (len(self.tasks), len(self.workers), len(self.stations))).tobytes())
+        for task in self.tasks:
+            digest.update(array("q", self.task_execution_times[task]).tobytes())
+        return digest.hexdigest()
+
+    def to_bytes(self) -> bytes:
+        """
+        Packs only the assignment, as (station, worker, task) triples of 32-bit integers.
+
+        Returns:
+            bytes: The packed assignment.
+        """
+        packed = array("i")
+        for station, workers in self.station_assignment.items():
+            for worker, tasks in workers.items():
+                for task in tasks:
+                    packed.extend((station, worker, task))
+        return packed.tobytes()
+
+    def from_bytes(self, data: bytes) -> "ALWABP":
+        """
+        Builds a solution of this instance from an assignment packed with to_bytes.
+
+        Args:
+            data (bytes): The packed assignment.
+
+        Returns:
+            ALWABP: A new solution with the instance data of this one.
+        """
+        new_solution = self.copy()
+        for workers in new_solution.station_assignment.values():
+            for tasks in workers.values():
+                tasks.clear()
+        packed = array("i")
+        packed.frombytes(data)
+        for i in range(0, len(packed), 3):
+            new_solution.station_assignment[packed[i]][packed[i + 1]].append(packed[i + 2])
+        return new_solution
+
     def solution_string_representation(self) -> str:
         """
         Gets a string representation of the solution, focusing on the task allocations per station and its assigned worker.
@@ -32,7 +32,7 @@ class BetterUnknownAcceptance(BetterAcceptanceCriteria):
         :return: True if the next solution is accepted, False otherwise.
         """
         return super().accept(curr_eval, next_eval, next_sol) and (
-            next_sol.shared_memory.solution_nodes.get(
+            next_sol.shared_memory.get_solution_node(
                 next_sol.solution_string_representation()
             )
             is None
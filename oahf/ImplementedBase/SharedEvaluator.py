@@ -0,0 +1,145 @@
+import functools
+import threading
+from typing import ClassVar, Dict, List, Optional, Union
+
+from oahf.Base.Constraint import Constraint
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.Movement import Movement
+from oahf.Base.SharedEvaluationTable import SharedEvaluationTable, StoredEvaluation
+from oahf.Base.SharedMemory import SharedMemory
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+
+
+class SharedEvaluator(Evaluator):
+    """
+    Evaluator that looks solutions up by solution_hash in a shared store before
+    delegating to the wrapped evaluator, so a solution scored by one worker is not
+    evaluated again by the others.
+
+    Only whole solutions (evaluate) go through the store. Movements are evaluated by
+    the wrapped evaluator's evaluate_move, as hashing the solution on every movement
+    would cost more than the delta evaluation it replaces. Use share to wrap the
+    evaluators of a metaheuristic and of the ones it uses.
+    """
+
+    delegates_evaluate: ClassVar[bool] = True
+
+    def __init__(
+        self, evaluator: Evaluator, store: Union[SharedMemory, SharedEvaluationTable]
+    ):
+        """
+        Initializes the SharedEvaluator.
+        :param evaluator: The evaluator used for solutions not in the store.
+        :param store: SharedMemory (threads) or SharedEvaluationTable (processes).
+        """
+        super().__init__(evaluator.stop_on_first_infeasibility)
+        self.evaluator = evaluator
+        self.store = store
+        # [hits, misses] of each thread, so threads count without a lock
+        self._counts: Dict[int, List[int]] = {}
+
+    @staticmethod
+    def share(
+        meta: MetaHeuristic, store: Union[SharedMemory, SharedEvaluationTable]
+    ) -> None:
+        """
+        Wraps the evaluator of a metaheuristic, and of the metaheuristics it uses,
+        with a SharedEvaluator on the store. Their copies keep the wrapped evaluators.
+        :param meta: The metaheuristic.
+        :param store: SharedMemory (threads) or SharedEvaluationTable (processes).
+        """
+        if meta.evaluator is not None and not isinstance(
+            meta.evaluator, SharedEvaluator
+        ):
+            meta.evaluator = SharedEvaluator(meta.evaluator, store)
+        for used in meta.meta_heuristics_used:
+            SharedEvaluator.share(used, store)
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of evaluations found in the store."""
+        return sum(counts[0] for counts in list(self._counts.values()))
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of evaluations delegated to the wrapped evaluator."""
+        return sum(counts[1] for counts in list(self._counts.values()))
+
+    def _count(self, index: int) -> None:
+        """Counts a hit (0) or a miss (1) of the calling thread."""
+        counts = self._counts.get(threading.get_ident())
+        if counts is None:
+            counts = self._counts.setdefault(threading.get_ident(), [0, 0])
+        counts[index] += 1
+
+    def evaluate(self, sol: Solution) -> Evaluation:
+        """
+        Returns the stored evaluation of the solution, evaluating and storing it if absent.
+        :param sol: A Solution object to evaluate.
+        :return: An Evaluation object.
+        """
+        if sol is None:
+            return self.evaluator.evaluate(sol)
+
+        key = sol.solution_hash()
+        evaluation = self.store.get_solution_node(key)
+        if evaluation is not None:
+            self._count(0)
+            if isinstance(evaluation, StoredEvaluation):
+                # Computed only if used as the base of a movement evaluation
+                evaluation.set_details(
+                    functools.partial(self.evaluator.evaluate, sol.copy())
+                )
+            return evaluation
+
+        self._count(1)
+        evaluation = self.evaluator.evaluate(sol)
+        self.store.add_solution_node(key, evaluation)
+        return evaluation
+
+    def evaluate_move(
+        self,
+        sol: Solution,
+        move: Optional[Movement],
+        base_evaluation: Optional[Evaluation],
+    ) -> Evaluation:
+        """
+        Forwards to the wrapped evaluator's evaluate_move, without using the store.
+        A stored base evaluation is replaced by its full evaluation, whose constraint
+        evaluations can be reused.
+        :param sol: A Solution object with the movement applied.
+        :param move: The applied Movement, or None.
+        :param base_evaluation: The Evaluation of the solution before the movement, or None.
+        :return: An Evaluation object.
+        """
+        if isinstance(base_evaluation, StoredEvaluation):
+            base_evaluation = base_evaluation.details()
+        return self.evaluator.evaluate_move(sol, move, base_evaluation)
+
+    def save_evaluation_state(self, sol: Solution) -> None:
+        """Forwards to the wrapped evaluator."""
+        self.evaluator.save_evaluation_state(sol)
+
+    def update_evaluation_after_unapply(self, sol: Solution) -> None:
+        """Forwards to the wrapped evaluator."""
+        self.evaluator.update_evaluation_after_unapply(sol)
+
+    @property
+    def stop_criteria(self) -> Optional[StopCriteria]:
+        """Returns the stop criteria of the wrapped evaluator."""
+        return self.evaluator.stop_criteria
+
+    @stop_criteria.setter
+    def stop_criteria(self, stop_criteria: Optional[StopCriteria]) -> None:
+        """Sets the stop criteria of the wrapped evaluator."""
+        # Evaluator.__init__ sets it before the wrapped evaluator is known
+        if "evaluator" in self.__dict__:
+            self.evaluator.stop_criteria = stop_criteria
+
+    @property
+    def constraints(self) -> List[Constraint]:
+        """Returns the list of constraints of the wrapped evaluator."""
+        return self.evaluator.constraints
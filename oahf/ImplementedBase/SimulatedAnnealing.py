@@ -1,4 +1,5 @@
 import math
+from typing import Optional
 
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
 from oahf.Base.Evaluation import Evaluation
@@ -8,18 +9,42 @@ from oahf.Utils.Util import Util
 
 
 class SimulatedAnnealing(AcceptanceCriteria):
-    def __init__(self, t_start: float, t_end: float, iter_max: int):
+    def __init__(
+        self,
+        t_start: float,
+        t_end: float,
+        iter_max: int,
+        thread_id: Optional[int] = None,
+    ):
         """
         Initializes a SimulatedAnnealing acceptance criteria.
         :param t_start: The starting temperature.
         :param t_end: The ending temperature.
         :param iter_max: The maximum number of iterations.
+        :param thread_id: ThreadManager stream to draw from, by default the one of
+            the current thread.
         """
         self._t_start = t_start
         self._t_end = t_end
         self._iter_max = iter_max
         self._curr_iter = 0
         self._step = (t_start - t_end) / iter_max
+        self._thread_id = thread_id
+        self._fixed_temperature: Optional[float] = None
+
+    def temperature(self) -> float:
+        """Returns the temperature of the current iteration."""
+        if self._fixed_temperature is not None:
+            return self._fixed_temperature
+        return (self._iter_max - self._curr_iter) * self._step
+
+    def set_temperature(self, temperature: Optional[float]) -> None:
+        """
+        Holds the temperature constant (e.g. a replica of ParallelTempering), or
+        returns to the linear schedule if None.
+        :param temperature: The temperature.
+        """
+        self._fixed_temperature = temperature
 
     def accept(
         self, curr_eval: Evaluation, next_eval: Evaluation, next_sol: Solution
@@ -32,23 +57,27 @@ class SimulatedAnnealing(AcceptanceCriteria):
         :return: True if the next solution is accepted, otherwise False.
         """
         self._curr_iter += 1
-        v = ThreadManager.get_next_double(Util.get_current_thread_id())
-
-        return next_eval.better_than(curr_eval) or (
-            not next_eval.infeasible()
-            and v
-            <= math.exp(
-                (
-                    curr_eval.get_objective_function()
-                    - next_eval.get_objective_function()
-                )
-                / ((self._iter_max - self._curr_iter) * self._step)
-            )
+        if next_eval.better_than(curr_eval):
+            return True
+        temperature = self.temperature()
+        if next_eval.infeasible() or temperature <= 0:
+            return False
+        thread_id = self._thread_id
+        v = ThreadManager.get_next_double(
+            thread_id if thread_id is not None else Util.get_current_thread_id()
+        )
+        return v <= math.exp(
+            (curr_eval.get_objective_function() - next_eval.get_objective_function())
+            / temperature
         )
 
     def copy(self) -> "SimulatedAnnealing":
         """Creates a copy of the current SimulatedAnnealing instance."""
-        return SimulatedAnnealing(self._t_start, self._t_end, self._iter_max)
+        copy = SimulatedAnnealing(
+            self._t_start, self._t_end, self._iter_max, self._thread_id
+        )
+        copy.set_temperature(self._fixed_temperature)
+        return copy
 
     def reset(self) -> None:
         """Resets the current iteration counter."""
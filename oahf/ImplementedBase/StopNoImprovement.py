@@ -1,4 +1,6 @@
-from typing import Iterable, LinkedList, Optional
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
 
 from oahf.Base.Evaluation import Evaluation
 from oahf.Base.StopCriteria import StopCriteria
@@ -21,10 +23,10 @@ class StopNoImprovement(StopTimeIterationCriteria):
         :param perc_improv: The percentage improvement required.
         """
         super().__init__(seconds, iterations)
-        self.ofs: LinkedList[float] = LinkedList()
+        self.ofs: Deque[float] = deque()
         self.iterations_no_improv = iterations_no_improv
         self.perc_improvement = (
-            perc_improv if perc_improv is not None else float("epsilon")
+            perc_improv if perc_improv is not None else sys.float_info.epsilon
         )
         self.last_evaluation: Optional[Evaluation] = None
 
@@ -35,7 +37,7 @@ class StopNoImprovement(StopTimeIterationCriteria):
     def copy(self) -> StopCriteria:
         """Creates a copy of the current StopNoImprovement instance."""
         return StopNoImprovement(
-            self.seconds,
+            None if self.milliseconds is None else self.milliseconds / 1000,
             self.max_iterations,
             self.iterations_no_improv,
             self.perc_improvement,
@@ -63,9 +65,21 @@ class StopNoImprovement(StopTimeIterationCriteria):
         if self.last_evaluation is not None:
             self.ofs.append(self.last_evaluation.get_objective_function())
             if len(self.ofs) > self.iterations_no_improv:
-                self.ofs.pop(0)  # Remove the first element
+                self.ofs.popleft()  # Remove the first element
         super().increment_counter()
 
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the counters and the recent objective function values."""
+        state = super().get_state()
+        state["ofs"] = list(self.ofs)
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores the counters and the recent objective function values."""
+        super().set_state(state)
+        self.ofs.clear()
+        self.ofs.extend(state["ofs"])
+
     def reset(self) -> None:
         """Resets the stopping criteria."""
         super().reset()
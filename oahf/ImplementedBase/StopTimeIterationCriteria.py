@@ -1,5 +1,5 @@
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from oahf.Base.StopCriteria import StopCriteria
 
@@ -83,6 +83,15 @@ class StopTimeIterationCriteria(StopCriteria):
         self.counter = 0
         self.sw_start = time.time()
 
+    def get_state(self) -> Dict[str, Any]:
+        """Returns the iterations done and the time consumed so far."""
+        return {"counter": self.counter, "elapsed": time.time() - self.sw_start}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores the counter, keeping the time consumed before the checkpoint."""
+        self.counter = state["counter"]
+        self.sw_start = time.time() - state["elapsed"]
+
     def elapsed_time(self) -> str:
         """Returns the elapsed time as a string."""
         elapsed = time.time() - self.sw_start
@@ -1,16 +1,22 @@
-from .BetterAcceptanceCriteria import BetterAcceptanceCriteria
-from .BetterOrSameAcceptanceCriteria import BetterOrSameAcceptanceCriteria
-from .BetterUnknownAcceptance import BetterUnknownAcceptance
-from .EliteDiversePool import EliteDiversePool
-from .ElitePool import ElitePool
-from .ListPool import ListPool
-from .ListSelection import ListSelection
-from .ProbabilityListSelection import ProbabilityListSelection
-from .RandomListSelection import RandomListSelection
-from .SimulatedAnnealing import SimulatedAnnealing
-from .StopNoImprovement import StopNoImprovement
-from .StopTimeIterationCriteria import StopTimeIterationCriteria
-from .ThresholdAcceptance import ThresholdAcceptance
+from typing import TYPE_CHECKING
+
+from oahf.Utils.LazyLoader import LazyLoader
+
+if TYPE_CHECKING:
+    from .BetterAcceptanceCriteria import BetterAcceptanceCriteria
+    from .BetterOrSameAcceptanceCriteria import BetterOrSameAcceptanceCriteria
+    from .BetterUnknownAcceptance import BetterUnknownAcceptance
+    from .EliteDiversePool import EliteDiversePool
+    from .ElitePool import ElitePool
+    from .ListPool import ListPool
+    from .ListSelection import ListSelection
+    from .ProbabilityListSelection import ProbabilityListSelection
+    from .RandomListSelection import RandomListSelection
+    from .SharedEvaluator import SharedEvaluator
+    from .SimulatedAnnealing import SimulatedAnnealing
+    from .StopNoImprovement import StopNoImprovement
+    from .StopTimeIterationCriteria import StopTimeIterationCriteria
+    from .ThresholdAcceptance import ThresholdAcceptance
 
 __all__ = [
     "BetterAcceptanceCriteria",
@@ -22,8 +28,14 @@ __all__ = [
     "ListSelection",
     "ProbabilityListSelection",
     "RandomListSelection",
+    "SharedEvaluator",
     "SimulatedAnnealing",
     "StopNoImprovement",
     "StopTimeIterationCriteria",
     "ThresholdAcceptance",
 ]
+
+# Attribute -> submodule defining it, imported on first access
+_exports = {name: name for name in __all__}
+
+__getattr__, __dir__ = LazyLoader.attach(__name__, _exports)
@@ -0,0 +1,37 @@
+import copy
+import logging
+from logging.handlers import QueueHandler
+from typing import Any
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records to a background writer (BatchQueueListener).
+
+    The arguments are always merged into the message before enqueueing, as they may
+    be changed by the caller before the writer reads them. For thread queues the JSON
+    formatting still happens on the writer thread. Records sent to another process
+    must be picklable, so for process queues the traceback is also rendered to text
+    before enqueueing.
+    """
+
+    def __init__(self, log_queue: Any, process_safe: bool = False) -> None:
+        """
+        Initializes the handler.
+
+        Args:
+            log_queue: The queue read by the BatchQueueListener.
+            process_safe (bool): True if the queue is a multiprocessing queue.
+        """
+        super().__init__(log_queue)
+        self.process_safe: bool = process_safe
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Returns the record to enqueue, made picklable for process queues."""
+        if self.process_safe:
+            return super().prepare(record)
+        # Other handlers may still use the record, so merge into a copy
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
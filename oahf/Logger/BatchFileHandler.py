@@ -0,0 +1,82 @@
+import locale
+import logging
+from logging.handlers import RotatingFileHandler
+from typing import Iterable
+
+
+class BatchFileHandler(RotatingFileHandler):
+    """
+    Size-rotating file handler that can write a batch of records with a single lock
+    acquisition and a single flush.
+
+    Used by BatchQueueListener so the background writer hits the disk once per batch
+    instead of once per record.
+    """
+
+    def __init__(
+        self,
+        log_file: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        Initializes the handler.
+
+        Args:
+            log_file (str): The path to the file where logs will be recorded.
+            max_bytes (int): Size at which the file is rotated. 0 disables rotation.
+            backup_count (int): Number of rotated files kept (log_file.1, ...).
+            encoding (str): The file encoding.
+        """
+        super().__init__(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding
+        )
+        self._encoding: str = encoding or locale.getpreferredencoding(False)
+        # Size of the file in bytes, as max_bytes counts encoded bytes
+        self._size: int = self._current_size()
+
+    def _current_size(self) -> int:
+        """Returns the size of the open file, 0 if it is not open."""
+        if self.stream is None:
+            return 0
+        self.stream.seek(0, 2)
+        return self.stream.tell()
+
+    def emit_batch(self, records: Iterable[logging.LogRecord]) -> None:
+        """
+        Formats and writes the records, rotating the file whenever it would exceed
+        max_bytes, and flushes once at the end.
+
+        Args:
+            records (Iterable[LogRecord]): Records already filtered by level.
+        """
+        self.acquire()
+        try:
+            for record in records:
+                if not self.filter(record):
+                    continue
+                try:
+                    message = self.format(record) + self.terminator
+                    size = len(message.encode(self._encoding, self.errors or "strict"))
+                    if (
+                        self.maxBytes > 0
+                        and self._size > 0
+                        and self._size + size >= self.maxBytes
+                    ):
+                        self.doRollover()
+                        self._size = self._current_size()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self.stream.write(message)
+                    self._size += size
+                except Exception:
+                    self.handleError(record)
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Writes a single record, keeping the tracked file size up to date."""
+        self.emit_batch((record,))
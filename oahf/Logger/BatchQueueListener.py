@@ -0,0 +1,88 @@
+import logging
+import queue
+from logging.handlers import QueueListener
+from typing import Any, List
+
+
+class BatchQueueListener(QueueListener):
+    """
+    QueueListener that drains the queue in batches on its background thread.
+
+    After blocking for the first record, it takes every record already queued (up to
+    batch_size) and hands them to each handler at once, through emit_batch when the
+    handler provides it (see BatchFileHandler).
+    """
+
+    def __init__(
+        self,
+        log_queue: Any,
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+        respect_handler_level: bool = True,
+    ) -> None:
+        """
+        Initializes the listener.
+
+        Args:
+            log_queue: A queue.Queue, queue.SimpleQueue or multiprocessing.Queue.
+            handlers (Handler): The handlers the records are written to.
+            batch_size (int): Maximum number of records written per batch.
+            respect_handler_level (bool): Skip records below a handler's level.
+        """
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.batch_size: int = max(1, batch_size)
+
+    def _monitor(self) -> None:
+        """Takes batches of records from the queue until the sentinel is found."""
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, "task_done")
+        stopped = False
+        while not stopped:
+            batch = []
+            try:
+                batch.append(self.dequeue(True))
+                while len(batch) < self.batch_size:
+                    batch.append(self.dequeue(False))
+            except queue.Empty:
+                pass
+            except (EOFError, OSError):
+                # multiprocessing queue closed under us
+                break
+
+            records: List[logging.LogRecord] = []
+            for record in batch:
+                if record is self._sentinel:
+                    stopped = True
+                else:
+                    records.append(self.prepare(record))
+            self.handle_batch(records)
+
+            if has_task_done:
+                for _ in batch:
+                    log_queue.task_done()
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Hands the records to every handler.
+
+        Args:
+            records (List[LogRecord]): Records taken from the queue.
+        """
+        if not records:
+            return
+        for handler in self.handlers:
+            accepted = (
+                [r for r in records if r.levelno >= handler.level]
+                if self.respect_handler_level
+                else records
+            )
+            if not accepted:
+                continue
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
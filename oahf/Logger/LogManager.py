@@ -1,106 +1,171 @@
+import json
+import logging
 import os
-import xml.etree.ElementTree as ET
+import re
+import zlib
 from pathlib import Path
-from typing import Dict, Optional, Union
-
-from LogMessages import LogMessages
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from oahf.Base.Evaluation import Evaluation
+from oahf.Logger.LogMessages import LogMessages
 from oahf.Utils.Util import Util
 
+# Compiled message: %-style template and the order in which the {n} arguments appear
+CompiledMessage = Tuple[str, List[int]]
+
 
 class LogManager:
-    """Static class to manage log messages and convert .resx files to JSON format."""
+    """
+    Static class to manage log messages.
+
+    The messages in LogMessages.resx are compiled once into a JSON catalogue of
+    %-style templates, cached on disk next to the .resx file and reused while the
+    .resx file is unchanged. Log calls check whether the logger is enabled for the
+    level before doing any work and leave the formatting to the logging module.
+    """
 
-    _log_messages: Dict[LogMessages, str] = {}
-    __calls_counter: int = 0
+    RESX_FILE: Path = Path(__file__).with_name("LogMessages.resx")
+    CATALOGUE_FILE: Path = Path(__file__).with_name("LogMessages.json")
+
+    _log_messages: Optional[Dict[str, CompiledMessage]] = None
+    _placeholder = re.compile(r"\{(\d+)\}")
 
     @classmethod
-    def __convert_resx_to_json(cls, resx_file: Path) -> None:
-        """Convert a .resx file to JSON format."""
+    def compile_catalogue(
+        cls, resx_file: Path = RESX_FILE, catalogue_file: Optional[Path] = None
+    ) -> Dict[str, CompiledMessage]:
+        """
+        Compiles a .resx file into a catalogue of %-style templates.
+
+        Args:
+            resx_file (Path): The .resx file holding the messages.
+            catalogue_file (Optional[Path]): Where to write the JSON catalogue.
+
+        Returns:
+            Dict[str, CompiledMessage]: Message name -> (template, argument order).
+        """
+        # Only needed when the cached catalogue is missing or stale
+        import xml.etree.ElementTree as ET
+
+        source = resx_file.read_bytes()
+        messages: Dict[str, CompiledMessage] = {}
+        for data_node in ET.fromstring(source).findall(".//data"):
+            key = str(data_node.get("name") or "")
+            if key == "" or key not in LogMessages.__members__:
+                continue
+
+            value_element = data_node.find("./value")
+            if value_element is None or not (value_element.text or "").strip():
+                logging.getLogger(__name__).warning(
+                    "No valid value found for key '%s' in '%s'", key, resx_file
+                )
+                continue
+            messages[key] = cls.__compile_message(str(value_element.text))
+
+        if catalogue_file is not None:
+            catalogue = {"source_crc": zlib.crc32(source), "messages": messages}
+            temporary_file = catalogue_file.with_suffix(f".{os.getpid()}.tmp")
+            temporary_file.write_text(json.dumps(catalogue, indent=2))
+            os.replace(temporary_file, catalogue_file)
+        return messages
 
-        LogManager.__calls_counter += 1
+    @classmethod
+    def __compile_message(cls, value: str) -> CompiledMessage:
+        """Converts a {n} template to %-style, recording the order of the arguments."""
+        order = [int(x) for x in cls._placeholder.findall(value)]
+        template = cls._placeholder.sub("%s", value.replace("%", "%%"))
+        return template, order
+
+    @classmethod
+    def __load_catalogue(cls) -> Dict[str, CompiledMessage]:
+        """Loads the cached catalogue, recompiling it if missing or stale."""
+        try:
+            source_crc = zlib.crc32(cls.RESX_FILE.read_bytes())
+            catalogue = json.loads(cls.CATALOGUE_FILE.read_text())
+            if catalogue.get("source_crc") == source_crc:
+                return {k: (v[0], v[1]) for k, v in catalogue["messages"].items()}
+        except (OSError, ValueError, KeyError, IndexError):
+            pass
 
-        # Parse the .resx file as an XML tree
         try:
-            xml_tree = ET.parse(resx_file)
-            root = xml_tree.getroot()
-
-            for data_node in root.findall(".//data"):
-                # Extract the 'name' attribute as the key
-                key = str(data_node.get("name"))
-
-                if key == "":
-                    continue
-
-                # Find the <value> element
-                value_element = data_node.find("./value")
-                if value_element is not None:
-                    # Extract the text content of the <value> element as the value
-                    value = value_element.text
-                    # Check if value is not None and not empty
-                    if value is not None and value.strip():
-                        # Store the key-value pair in the 'log_messages' dictionary
-                        cls._log_messages[LogMessages[key]] = str(value)
-                    else:
-                        # Handle the case when value is None or empty
-                        Util.logger.warning(
-                            f"No valid value found for key '{key}' in '{resx_file}'"
-                        )
-                else:
-                    # Handle the case when <value> element is not found
-                    Util.logger.warning(
-                        f"Warning: No <value> element found for key '{key}' in '{resx_file}'"
-                    )
+            return cls.compile_catalogue(cls.RESX_FILE, cls.CATALOGUE_FILE)
+        except OSError:
+            # Read-only installation: keep the compiled catalogue in memory only
+            try:
+                return cls.compile_catalogue(cls.RESX_FILE)
+            except Exception as e:
+                cls.__log_load_error(e)
         except Exception as e:
-            LogManager.log_error(e)
+            cls.__log_load_error(e)
+        return {}
 
-    @staticmethod
-    def get_message(message_type: LogMessages) -> str:
-        """Get the log message by message type."""
+    @classmethod
+    def __log_load_error(cls, exception: Exception) -> None:
+        logging.getLogger(__name__).error(
+            "Unable to load '%s': %s", cls.RESX_FILE, exception
+        )
 
-        if LogManager.__calls_counter <= 0:
-            # Get the absolute path of the current Python script
-            current_file_path = os.path.abspath(__file__)
+    @classmethod
+    def __get_compiled(cls, message_type: LogMessages) -> CompiledMessage:
+        """Returns the compiled message, loading the catalogue on first use."""
+        messages = cls._log_messages
+        if messages is None:
+            messages = cls._log_messages = cls.__load_catalogue()
+        return messages.get(message_type.name, ("Message not found", []))
 
-            # Get the directory containing the current Python script
-            current_directory = os.path.dirname(current_file_path)
+    @staticmethod
+    def get_message(message_type: LogMessages, *args: Any) -> str:
+        """
+        Get the log message by message type, formatted with the given arguments.
+        Without arguments, messages with placeholders are returned as %-style templates.
+        """
+        template, order = LogManager.__get_compiled(message_type)
+        if order and not args:
+            return template
+        return template % tuple(args[i] for i in order)
 
-            LogManager.__convert_resx_to_json(
-                Path(rf"{current_directory}\LogMessages.resx")
-            )
+    @classmethod
+    def __log(cls, level: int, message_type: LogMessages, *args: Any) -> None:
+        """Logs the message if the logger is enabled for the level."""
+        logger = Util.logger
+        if logger is None or not logger.is_enabled_for(level):
+            return
+        template, order = cls.__get_compiled(message_type)
+        logger.log(level, template, *(args[i] for i in order))
 
-        return LogManager._log_messages.get(message_type, "Message not found")
+    @classmethod
+    def is_enabled_for(cls, level: int) -> bool:
+        """Checks if a logger is set and enabled for the level."""
+        logger = Util.logger
+        return logger is not None and logger.is_enabled_for(level)
 
     @classmethod
     def something_went_wrong(cls, class_name: str, exception: Union[Exception, str]):
-        log_message: LogMessages = LogMessages.SOMETHING_WENT_WRONG
-        if Util.logger:
-            Util.logger.error(
-                LogManager.get_message(log_message).format(class_name, exception)
-            )
+        cls.__log(
+            logging.ERROR, LogMessages.SOMETHING_WENT_WRONG, class_name, exception
+        )
 
     @classmethod
     def unable_to_get_neighborhood(cls):
-        log_message: LogMessages = LogMessages.UNABLE_TO_GET_NEIGHBORHOOD
-        if Util.logger:
-            Util.logger.error(LogManager.get_message(log_message))
+        cls.__log(logging.ERROR, LogMessages.UNABLE_TO_GET_NEIGHBORHOOD)
 
     @classmethod
     def log_solution(cls, evaluation: Evaluation):
-        log_message: LogMessages = LogMessages.LOG_SOLUTION
-        if Util.logger:
-            Util.logger.info(LogManager.get_message(log_message).format(evaluation))
+        cls.__log(logging.INFO, LogMessages.LOG_SOLUTION, evaluation)
 
     @classmethod
     def invalid_action(
         cls, action: str, structure_name: str, exception: Optional[Exception] = None
     ):
-        log_message: LogMessages = LogMessages.INVALID_ACTION
-        if Util.logger:
-            Util.logger.error(
-                LogManager.get_message(log_message).format(action, structure_name)
-            )
-
-            if exception:
-                cls.something_went_wrong(structure_name, exception)
+        if not cls.is_enabled_for(logging.ERROR):
+            return
+        cls.__log(logging.ERROR, LogMessages.INVALID_ACTION, action, structure_name)
+
+        if exception:
+            cls.something_went_wrong(structure_name, exception)
+
+
+if __name__ == "__main__":
+    # Build step: python -m oahf.Logger.LogManager
+    LogManager.compile_catalogue(LogManager.RESX_FILE, LogManager.CATALOGUE_FILE)
+    print(f"Compiled '{LogManager.RESX_FILE}' to '{LogManager.CATALOGUE_FILE}'")
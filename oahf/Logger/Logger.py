@@ -1,9 +1,12 @@
+import atexit
 import logging
-from typing import Any
-
-from JsonFormatter import JsonFormatter
+from typing import Any, Optional
 
 from oahf.Base.Entity import Entity
+from oahf.Logger.AsyncQueueHandler import AsyncQueueHandler
+from oahf.Logger.BatchFileHandler import BatchFileHandler
+from oahf.Logger.BatchQueueListener import BatchQueueListener
+from oahf.Logger.JsonFormatter import JsonFormatter
 
 
 class Logger(Entity):
@@ -12,30 +15,134 @@ class Logger(Entity):
 
     This class allows creating logs with different severity levels
     (DEBUG, INFO, WARNING, ERROR, CRITICAL) and records them in a JSON file.
+
+    In asynchronous mode, log calls only put the record on a queue; a background
+    BatchQueueListener formats the records and writes them in batches, so search
+    threads never wait on the disk. With process_safe the queue is a
+    multiprocessing.Queue: pass `logger.queue` to the worker processes and create
+    their loggers with `Logger(None, queue=...)`.
+
+    Example:
+        logger = Logger("logs.json", asynchronous=True, max_bytes=50_000_000)
+        Util.set_logger(logger)
+        ...
+        logger.close()  # also done at interpreter exit
     """
 
-    def __init__(self, log_file: str, level: int = logging.DEBUG) -> None:
+    def __init__(
+        self,
+        log_file: Optional[str],
+        level: int = logging.DEBUG,
+        asynchronous: bool = False,
+        process_safe: bool = False,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        batch_size: int = 256,
+        queue: Any = None,
+    ) -> None:
         """
         Initializes the logger with a log file and the specified level.
 
         Args:
-            log_file (str): The path to the file where logs will be recorded.
+            log_file (Optional[str]): The path to the file where logs will be recorded,
+                None for a worker logger writing to `queue`.
             level (int): The logging level. The default is DEBUG.
+            asynchronous (bool): Write the logs from a background thread.
+            process_safe (bool): Use a multiprocessing queue (implies asynchronous).
+            max_bytes (int): Size at which the log file is rotated. 0 disables rotation.
+            backup_count (int): Number of rotated files kept.
+            batch_size (int): Maximum number of records written at once.
+            queue: Queue of another (asynchronous, process safe) Logger to send the
+                records to, used by worker processes.
         """
         super().__init__()
         self.logger: logging.Logger = logging.getLogger("JsonLogger")
         self.logger.setLevel(level)
-
-        # Create a FileHandler to direct logs to the specified file
-        file_handler: logging.FileHandler = logging.FileHandler(log_file)
+        self.queue: Any = queue
+        self.listener: Optional[BatchQueueListener] = None
+        self._handler: Optional[logging.Handler] = None
+
+        if queue is not None:
+            # Worker side: the owner of the queue writes the file. A forked worker
+            # inherits the owner's handler, which would send every record twice
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, AsyncQueueHandler) and handler.queue is queue:
+                    self.logger.removeHandler(handler)
+            self._handler = AsyncQueueHandler(queue, process_safe=True)
+            self.logger.addHandler(self._handler)
+            return
+
+        # Create a rotating FileHandler to direct logs to the specified file
+        file_handler: BatchFileHandler = BatchFileHandler(
+            log_file, max_bytes=max_bytes, backup_count=backup_count
+        )
         file_handler.setLevel(level)
 
         # Set the custom format as JSON
         formatter: JsonFormatter = JsonFormatter()
         file_handler.setFormatter(formatter)
 
-        # Add the handler to the logger
-        self.logger.addHandler(file_handler)
+        if not (asynchronous or process_safe):
+            # Add the handler to the logger
+            self._handler = file_handler
+            self.logger.addHandler(file_handler)
+            return
+
+        if process_safe:
+            import multiprocessing
+
+            self.queue = multiprocessing.Queue()
+        else:
+            import queue as queue_module
+
+            self.queue = queue_module.SimpleQueue()
+
+        self.listener = BatchQueueListener(
+            self.queue, file_handler, batch_size=batch_size
+        )
+        self.listener.start()
+        self._handler = AsyncQueueHandler(self.queue, process_safe=process_safe)
+        self.logger.addHandler(self._handler)
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """
+        Detaches the logger, writing every queued record and closing the log file.
+        Safe to call more than once.
+        """
+        handler, self._handler = self._handler, None
+        if handler is None:
+            return
+        self.logger.removeHandler(handler)
+        handler.close()
+
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            for file_handler in listener.handlers:
+                file_handler.close()
+            atexit.unregister(self.close)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Checks if a message of the given level would be logged, so callers can skip
+        building it otherwise.
+
+        Args:
+            level (int): The logging level.
+        """
+        return self.logger.isEnabledFor(level)
+
+    def log(self, level: int, message: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Logs a message with the given level. The arguments are merged into the
+        message with %-formatting only if the message is emitted.
+
+        Args:
+            level (int): The logging level.
+            message (str): The log message.
+        """
+        self.logger.log(level, message, *args, **kwargs)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
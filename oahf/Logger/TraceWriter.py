@@ -0,0 +1,251 @@
+import json
+import math
+import os
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Union
+
+# Column name, array typecode, .npy dtype (without byte order)
+_COLUMNS = (
+    ("t", "q", "i8"),
+    ("metaheuristic", "q", "i8"),
+    ("thread", "q", "i8"),
+    ("objective", "d", "f8"),
+    ("feasible", "B", "b1"),
+    ("best", "B", "b1"),
+)
+
+_ROW = (
+    '{"t":%d,"metaheuristic":%d,"thread":%d,"objective":%s,'
+    '"feasible":%s,"best":%s}\n'
+)
+
+
+class TraceWriter:
+    """
+    Streaming sink for solution trajectories.
+
+    Each record holds (monotonic ns, metaheuristic id, thread id, objective,
+    feasibility, best/current). Records go into preallocated column chunks of
+    chunk_size rows; a full chunk is written to disk and released, so a trace of any
+    length runs in constant memory.
+
+    Formats:
+        "ndjson": one JSON object per row, appended to `path`. JSON has no
+            infinity nor NaN, so those objectives are written as null.
+        "npy": each chunk is written as one .npy file per column, named
+            `<path>.<segment>.<column>.npy`, readable with numpy.load.
+
+    Best solutions are always recorded; current solutions can be downsampled to one
+    in `sample_every`.
+    """
+
+    FORMATS = ("ndjson", "npy")
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        trace_format: str = "ndjson",
+        chunk_size: int = 65536,
+        sample_every: int = 1,
+    ) -> None:
+        """
+        Initializes the writer, truncating an existing NDJSON trace.
+
+        Args:
+            path (Union[str, Path]): The trace file (ndjson) or segment prefix (npy).
+            trace_format (str): "ndjson" or "npy".
+            chunk_size (int): Number of rows buffered before writing to disk.
+            sample_every (int): Keep one in every sample_every current solutions.
+        """
+        if trace_format not in self.FORMATS:
+            raise ValueError(f"Unknown trace format {trace_format!r}.")
+
+        self.path: Path = Path(path)
+        self.trace_format: str = trace_format
+        self.chunk_size: int = max(1, chunk_size)
+        self.sample_every: int = max(1, sample_every)
+        self.segments: int = 0
+        self.rows: int = 0
+        self.skipped: int = 0
+
+        self._columns: List[array] = self._new_chunk()
+        self._size: int = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed: bool = False
+
+        if trace_format == "ndjson":
+            self.path.write_text("")
+
+    def _new_chunk(self) -> List[array]:
+        """Preallocates the columns of a chunk."""
+        return [
+            array(code, bytes(array(code).itemsize * self.chunk_size))
+            for _, code, _ in _COLUMNS
+        ]
+
+    def record(
+        self,
+        metaheuristic_id: int,
+        thread_id: int,
+        objective: float,
+        feasible: bool,
+        best: bool,
+    ) -> None:
+        """
+        Records a row, writing the chunk to disk when it is full.
+
+        Args:
+            metaheuristic_id (int): Id of the MetaHeuristic reporting the solution.
+            thread_id (int): Thread id of the MetaHeuristic.
+            objective (float): The objective function of the solution.
+            feasible (bool): Whether the solution is feasible.
+            best (bool): True for a new best solution, False for a current one.
+        """
+        stamp = time.monotonic_ns()
+        full = None
+        with self._lock:
+            if self._closed:
+                return
+            if not best and self.sample_every > 1:
+                self.skipped += 1
+                if self.skipped % self.sample_every:
+                    return
+
+            i = self._size
+            columns = self._columns
+            columns[0][i] = stamp
+            columns[1][i] = metaheuristic_id
+            columns[2][i] = thread_id
+            columns[3][i] = objective
+            columns[4][i] = feasible
+            columns[5][i] = best
+            self._size = i + 1
+            if self._size == self.chunk_size:
+                full, segment = columns, self.segments
+                self._columns = self._new_chunk()
+                self._size = 0
+                self.segments += 1
+                self.rows += self.chunk_size
+                # Taken before releasing the record lock, so chunks are written in
+                # segment order
+                self._write_lock.acquire()
+
+        if full is not None:
+            self._write(full, self.chunk_size, segment)
+
+    def flush(self) -> None:
+        """Writes the rows recorded so far to disk."""
+        with self._lock:
+            if self._size == 0:
+                return
+            columns, size, segment = self._columns, self._size, self.segments
+            self._columns = self._new_chunk()
+            self._size = 0
+            self.segments += 1
+            self.rows += size
+            self._write_lock.acquire()
+        self._write(columns, size, segment)
+
+    def close(self) -> None:
+        """Flushes the remaining rows and stops recording."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+
+    def _write(self, columns: List[array], size: int, segment: int) -> None:
+        """
+        Writes the first `size` rows of a chunk, outside of the record lock. The
+        caller holds the write lock, released here.
+        """
+        try:
+            if self.trace_format == "ndjson":
+                t, mh, thread, objective, feasible, best = columns
+                bools = ("false", "true")
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.writelines(
+                        _ROW
+                        % (
+                            t[i],
+                            mh[i],
+                            thread[i],
+                            (
+                                repr(objective[i])
+                                if math.isfinite(objective[i])
+                                else "null"
+                            ),
+                            bools[feasible[i]],
+                            bools[best[i]],
+                        )
+                        for i in range(size)
+                    )
+            else:
+                for (name, _, dtype), column in zip(_COLUMNS, columns):
+                    self._write_npy(
+                        Path(f"{self.path}.{segment:06d}.{name}.npy"),
+                        column[:size],
+                        dtype,
+                    )
+        finally:
+            self._write_lock.release()
+
+    @staticmethod
+    def _write_npy(file_path: Path, column: array, dtype: str) -> None:
+        """Writes a one-dimensional array in the .npy (version 1.0) format."""
+        order = "|" if dtype == "b1" else ("<" if sys.byteorder == "little" else ">")
+        header = (
+            f"{{'descr': '{order}{dtype}', 'fortran_order': False, "
+            f"'shape': ({len(column)},), }}"
+        )
+        # Magic (6) + version (2) + header length (2) + header, aligned to 64 bytes
+        padding = 64 - (10 + len(header) + 1) % 64
+        header = header + " " * padding + "\n"
+        with open(file_path, "wb") as file:
+            file.write(b"\x93NUMPY\x01\x00")
+            file.write(len(header).to_bytes(2, "little"))
+            file.write(header.encode("latin1"))
+            column.tofile(file)
+
+    @staticmethod
+    def load(path: Union[str, Path], trace_format: str = "ndjson") -> Dict[str, list]:
+        """
+        Reads a trace back as a dict of columns. Objectives written as null are read
+        as infinity.
+
+        Args:
+            path (Union[str, Path]): The path given to the writer.
+            trace_format (str): "ndjson" or "npy".
+
+        Returns:
+            Dict[str, list]: Column name -> values, in recording order per segment.
+        """
+        columns: Dict[str, list] = {name: [] for name, _, _ in _COLUMNS}
+        path = Path(path)
+        if trace_format == "ndjson":
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    row = json.loads(line)
+                    if row["objective"] is None:
+                        row["objective"] = math.inf
+                    for name in columns:
+                        columns[name].append(row[name])
+            return columns
+
+        segment = 0
+        while os.path.exists(f"{path}.{segment:06d}.t.npy"):
+            for name, code, _ in _COLUMNS:
+                with open(f"{path}.{segment:06d}.{name}.npy", "rb") as file:
+                    file.seek(8)
+                    header_length = int.from_bytes(file.read(2), "little")
+                    file.seek(10 + header_length)
+                    values = array(code, file.read())
+                if code == "B":
+                    columns[name].extend(bool(x) for x in values)
+                else:
+                    columns[name].extend(values)
+            segment += 1
+        return columns
@@ -1,6 +1,29 @@
-from .JsonFormatter import JsonFormatter
-from .Logger import Logger
-from .LogManager import LogManager
-from .LogMessages import LogMessages
+from typing import TYPE_CHECKING
 
-__all__ = ["JsonFormatter", "Logger", "LogManager", "LogMessages"]
+from oahf.Utils.LazyLoader import LazyLoader
+
+if TYPE_CHECKING:
+    from .AsyncQueueHandler import AsyncQueueHandler
+    from .BatchFileHandler import BatchFileHandler
+    from .BatchQueueListener import BatchQueueListener
+    from .JsonFormatter import JsonFormatter
+    from .Logger import Logger
+    from .LogManager import LogManager
+    from .LogMessages import LogMessages
+    from .TraceWriter import TraceWriter
+
+__all__ = [
+    "AsyncQueueHandler",
+    "BatchFileHandler",
+    "BatchQueueListener",
+    "JsonFormatter",
+    "Logger",
+    "LogManager",
+    "LogMessages",
+    "TraceWriter",
+]
+
+# Attribute -> submodule defining it, imported on first access
+_exports = {name: name for name in __all__}
+
+__getattr__, __dir__ = LazyLoader.attach(__name__, _exports)
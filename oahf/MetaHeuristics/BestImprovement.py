@@ -1,12 +1,72 @@
+import multiprocessing
+from typing import List, Optional, Tuple
+
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
+from oahf.Base.Evaluation import Evaluation
 from oahf.Base.Evaluator import Evaluator
 from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.Neighborhood import Neighborhood
 from oahf.Base.NeighborhoodSelection import NeighborhoodSelection
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.Logger.LogManager import LogManager
 from oahf.Utils.Util import Util
 
+# State of a scanning worker process, set once by _init_worker
+_worker: dict = {}
+
+
+def _init_worker(
+    thread_id: int,
+    evaluator: Evaluator,
+    criteria: AcceptanceCriteria,
+    neighborhoods: List[Neighborhood],
+    template: Solution,
+) -> None:
+    _worker.update(
+        thread_id=thread_id,
+        evaluator=evaluator,
+        criteria=criteria,
+        neighborhoods=neighborhoods,
+        template=template,
+    )
+
+
+def _scan_range(
+    neighborhood: int, data: bytes, start: int, stop: int
+) -> Optional[Tuple[Tuple[bool, float], bytes]]:
+    """
+    Scans the movements [start, stop) of a neighborhood of a solution in a worker.
+    :return: (sort key, packed neighbor) of the best accepted neighbor, if any.
+    """
+    evaluator: Evaluator = _worker["evaluator"]
+    criteria: AcceptanceCriteria = _worker["criteria"]
+    ns: Neighborhood = _worker["neighborhoods"][neighborhood]
+    sol = _worker["template"].from_bytes(data)
+    base_eval = evaluator.evaluate(sol)
+    # Incremental evaluators must start from this solution, not the one at fork time
+    evaluator.save_evaluation_state(sol)
+    best_eval = base_eval
+    best_data = None
+
+    ns.set_move_range(start, stop)
+    try:
+        if not ns.build_neighborhood_operation(_worker["thread_id"], sol):
+            return None
+        move = ns.get_move_operation()
+        while move is not None:
+            if move.apply_operation():
+                curr_eval = evaluator.evaluate_move(sol, move, base_eval)
+                if criteria.accept(best_eval, curr_eval, sol):
+                    best_eval = curr_eval
+                    best_data = sol.to_bytes()
+                move.unapply_operation(curr_eval)
+                evaluator.update_evaluation_after_unapply(sol)
+            move = ns.get_move_operation()
+    finally:
+        ns.set_move_range()
+    return None if best_data is None else (best_eval.sort_key, best_data)
+
 
 class BestImprovement(MetaHeuristic):
 
@@ -17,6 +77,8 @@ class BestImprovement(MetaHeuristic):
         evaluator: Evaluator,
         ns: NeighborhoodSelection,
         criteria: AcceptanceCriteria,
+        processes: int = 1,
+        chunks_per_process: int = 4,
     ):
         """
         Initializes the BestImprovement metaheuristic.
@@ -25,9 +87,17 @@ class BestImprovement(MetaHeuristic):
         :param evaluator: Evaluator to assess solutions.
         :param ns: Neighborhood selection strategy.
         :param criteria: Acceptance criteria for new solutions.
+        :param processes: Worker processes scanning splittable neighborhoods (see
+            Neighborhood.move_count); 1 scans every neighborhood in this thread.
+        :param chunks_per_process: Movement ranges per process of each scan, to
+            balance ranges of uneven cost.
         """
         super().__init__(thread_id, stop, evaluator, ns, criteria)
         self.neighborhood = None
+        self.processes = max(1, processes)
+        self.chunks_per_process = max(1, chunks_per_process)
+        self._executor = None
+        self._neighborhoods: List[Neighborhood] = []
 
     def copy(self, thread: int) -> "MetaHeuristic":
         """Creates a copy of the current BestImprovement instance."""
@@ -37,8 +107,89 @@ class BestImprovement(MetaHeuristic):
             self.evaluator,
             self.neighborhood_selection.copy(),
             self.acceptance_criteria.copy(),
+            self.processes,
+            self.chunks_per_process,
         )
 
+    def close(self) -> None:
+        """Shuts the scanning processes down; they are started again if needed."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _start_executor(self, template: Solution) -> None:
+        """
+        Starts the worker processes, each holding a copy of the neighborhoods.
+        :param template: Solution supplying the instance data to unpack solutions.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._neighborhoods = []
+        if self.neighborhood_selection is not None:
+            self._neighborhoods.extend(self.neighborhood_selection.get_all())
+        if self.neighborhood is not None:
+            self._neighborhoods.append(self.neighborhood)
+        methods = multiprocessing.get_all_start_methods()
+        self._executor = ProcessPoolExecutor(
+            self.processes,
+            multiprocessing.get_context("fork" if "fork" in methods else None),
+            initializer=_init_worker,
+            initargs=(
+                self.thread_id,
+                self.evaluator,
+                self.acceptance_criteria,
+                self._neighborhoods,
+                template,
+            ),
+        )
+
+    def parallel_step(
+        self, ns: Neighborhood, curr_sol: Solution, best_eval: Evaluation
+    ) -> Optional[Tuple[Optional[Solution], Evaluation]]:
+        """
+        Scans a splittable neighborhood across the worker processes, each on a range
+        of its movements and its own copy of the solution.
+        :param ns: The neighborhood.
+        :param curr_sol: The solution whose neighborhood is scanned.
+        :param best_eval: The evaluation to improve on.
+        :return: (best neighbor or None, its evaluation), or None if the neighborhood
+            cannot be split and must be scanned serially.
+        """
+        if not ns.build_neighborhood_operation(self.thread_id, curr_sol):
+            return None, best_eval
+        count = ns.move_count()
+        if count is None:
+            return None
+        if self._executor is None or not any(n is ns for n in self._neighborhoods):
+            self.close()
+            self._start_executor(curr_sol)
+        index = next(i for i, n in enumerate(self._neighborhoods) if n is ns)
+
+        data = curr_sol.to_bytes()
+        ranges = Neighborhood.split_moves(
+            count, self.processes * self.chunks_per_process
+        )
+        futures = [
+            self._executor.submit(_scan_range, index, data, start, stop)
+            for start, stop in ranges
+        ]
+        self.stop_criteria.increment_counter()
+        best: Optional[Tuple[Tuple[bool, float], bytes]] = None
+        for future in futures:
+            result = future.result()
+            if result is not None and (best is None or result[0] < best[0]):
+                best = result
+        if best is None:
+            return None, best_eval
+
+        neighbor = curr_sol.from_bytes(best[1])
+        neighbor_eval = self.evaluator.evaluate(neighbor)
+        if self.log_solutions:
+            self.log_current_solution(neighbor_eval)
+        if not self.acceptance_criteria.accept(best_eval, neighbor_eval, neighbor):
+            return None, best_eval
+        return neighbor, neighbor_eval
+
     def run(self, sol: Solution) -> Solution:
         """Executes the best improvement strategy on the given solution."""
         best_sol = sol.copy() if sol else None
@@ -64,30 +215,55 @@ class BestImprovement(MetaHeuristic):
                 if ns is None:
                     break
 
+                if self.processes > 1 and curr_sol is not None:
+                    step = self.parallel_step(ns, curr_sol, best_eval)
+                    if step is not None:
+                        neighbor, best_eval = step
+                        if neighbor is not None:
+                            best_sol = neighbor
+                            curr_sol = neighbor.copy()
+                            self.evaluator.save_evaluation_state(curr_sol)
+                        if self.log_solutions:
+                            self.log_best_solution(best_eval)
+                        continue
+
                 build = ns.build_neighborhood_operation(self.thread_id, curr_sol)
 
                 if build:
+                    base_eval = self.evaluator.evaluate(curr_sol)
+                    best_move = None
                     move = ns.get_move_operation()
                     self.stop_criteria.increment_counter()
                     while move is not None and not self.stop_on_evaluations(best_eval):
                         worked = move.apply_operation()
                         if worked:
-                            curr_eval = self.evaluator.evaluate(curr_sol)
+                            curr_eval = self.evaluator.evaluate_move(
+                                curr_sol, move, base_eval
+                            )
                             if self.log_solutions:
                                 self.log_current_solution(curr_eval)
+                            if curr_eval.better_than(base_eval):
+                                ns.report_improving_move(move)
                             if self.acceptance_criteria.accept(
                                 best_eval, curr_eval, curr_sol
                             ):
                                 move.report_apply_improvement(curr_eval, best_eval)
                                 best_sol = curr_sol.copy()
                                 best_eval = curr_eval
+                                best_move = move
                             move.unapply_operation(curr_eval)
-                            self.evaluator.update_evaluation_after_unapply(sol)
+                            self.evaluator.update_evaluation_after_unapply(curr_sol)
 
                         move = ns.get_move_operation()
                         self.stop_criteria.increment_counter()
                         if self.log_solutions:
                             self.log_best_solution(best_eval)
+
+                    # Descend to the best neighbor found in this pass
+                    if best_eval.better_than(base_eval):
+                        curr_sol = best_sol.copy()
+                        self.evaluator.save_evaluation_state(curr_sol)
+                        ns.accept_movement(best_move, curr_sol)
             except Exception as ex:
                 LogManager.something_went_wrong(ns, ex)
                 curr_sol = best_sol.copy() if best_sol else None
@@ -98,3 +274,4 @@ class BestImprovement(MetaHeuristic):
     def set_neighborhood(self, neighborhood):
         """Sets the neighborhood for the BestImprovement instance."""
         self.neighborhood = neighborhood
+        self.close()
@@ -70,13 +70,15 @@ class FirstImprovement(MetaHeuristic):
                     while move is not None and not self.stop_on_evaluations(best_eval):
                         worked = move.apply_operation()
                         if worked:
-                            curr_eval = self.evaluator.evaluate(curr_sol)
+                            curr_eval = self.evaluator.evaluate_move(
+                                curr_sol, move, best_eval
+                            )
                             if self.acceptance_criteria.accept(
                                 best_eval, curr_eval, curr_sol
                             ):
                                 move.report_apply_improvement(curr_eval, best_eval)
                                 best_sol = curr_sol  # No need to copy here
-                                ns.accept_movement()
+                                ns.accept_movement(move)
                                 self.evaluator.save_evaluation_state(best_sol)
                                 return best_sol
                             else:
@@ -110,7 +110,9 @@ class GRC(MetaHeuristic):
                         worked = move.apply_operation()
 
                         if worked:
-                            curr_eval = self.evaluator.evaluate(curr_sol)
+                            curr_eval = self.evaluator.evaluate_move(
+                                curr_sol, move, best_eval
+                            )
                             if self.acceptance_criteria.accept(
                                 best_eval, curr_eval, curr_sol
                             ):
@@ -120,7 +122,7 @@ class GRC(MetaHeuristic):
                                 move.report_apply_improvement(curr_eval, best_eval)
                                 improved = True
                                 best_eval = curr_eval
-                                ns.accept_movement()
+                                ns.accept_movement(move)
                                 break
                             else:
                                 move.unapply_operation(curr_eval)
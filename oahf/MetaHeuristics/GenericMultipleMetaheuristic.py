@@ -1,12 +1,15 @@
 import time
-from typing import List
+from typing import List, Optional, Union
 
 from oahf.Base.Evaluator import Evaluator
 from oahf.Base.MetaHeuristic import MetaHeuristic
 from oahf.Base.Pool import Pool
+from oahf.Base.SharedEvaluationTable import SharedEvaluationTable
+from oahf.Base.SharedMemory import SharedMemory
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.Base.ThreadManager import ThreadManager
+from oahf.ImplementedBase.SharedEvaluator import SharedEvaluator
 from oahf.Logger.LogManager import LogManager
 from oahf.Utils.Util import Util
 
@@ -23,6 +26,7 @@ class GenericMultipleMetaheuristic(MetaHeuristic):
         repeatable: bool,
         change_solution: StopCriteria,
         criteria,
+        shared_memory: Optional[Union[SharedMemory, SharedEvaluationTable]] = None,
     ):
         """
         Initializes the GenericMultipleMetaheuristic.
@@ -35,8 +39,12 @@ class GenericMultipleMetaheuristic(MetaHeuristic):
         :param repeatable: Indicates if the process is repeatable.
         :param change_solution: Criteria to change the solution.
         :param criteria: Acceptance criteria for new solutions.
+        :param shared_memory: Optional store of already scored solutions shared by the threads,
+            also wrapping the evaluators of the metaheuristics.
         """
-        super().__init__(thread_id, stop, evaluator, criteria, meta_heuristics)
+        super().__init__(thread_id, stop, evaluator, None, criteria, meta_heuristics)
+        if shared_memory is not None:
+            SharedEvaluator.share(self, shared_memory)
         self.solution_pool = pool
         self.mhs = [
             [None for _ in range(num_threads)] for _ in range(len(meta_heuristics))
@@ -44,6 +52,7 @@ class GenericMultipleMetaheuristic(MetaHeuristic):
         self.num_threads = num_threads
         self.repeatable = repeatable
         self.change_solution_criteria = change_solution
+        self.shared_memory = shared_memory
 
     def copy(self, thread: int) -> "MetaHeuristic":
         copied_metaheuristics = [m.copy(thread) for m in self.meta_heuristics_used]
@@ -57,6 +66,7 @@ class GenericMultipleMetaheuristic(MetaHeuristic):
             self.repeatable,
             self.change_solution_criteria.copy(),
             self.acceptance_criteria.copy(),
+            self.shared_memory,
         )
 
     def main_run(self, thread_id: int, solutions: List, mhs: List) -> None:
@@ -1,9 +1,12 @@
+from typing import Any, Dict, List
+
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
 from oahf.Base.CrossOver import CrossOver
 from oahf.Base.Evaluator import Evaluator
 from oahf.Base.MetaHeuristic import MetaHeuristic
 from oahf.Base.Pool import Pool
 from oahf.Base.Selection import Selection
+from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.ImplementedBase.ListPool import ListPool
 from oahf.MetaHeuristics.Pertubation import Pertubation
@@ -33,11 +36,15 @@ class GeneticAlgorithm(MetaHeuristic):
             crossover (CrossOver): The crossover strategy.
             criteria (AcceptanceCriteria): The acceptance criteria for solutions.
         """
-        super().__init__(thread_id, stop, evaluator, criteria, mutations, construction)
+        super().__init__(
+            thread_id, stop, evaluator, None, criteria, [mutations, construction]
+        )
         self.construction = construction
         self.selection = selection
         self.crossover = crossover
         self.mutations = mutations
+        self.generation: int = 0
+        self._population: List[Solution] = []
 
     def copy(self, thread: int) -> "GeneticAlgorithm":
         """Create a copy of the GeneticAlgorithm instance.
@@ -59,6 +66,27 @@ class GeneticAlgorithm(MetaHeuristic):
             self.acceptance_criteria.copy(),
         )
 
+    def get_state(self) -> Dict[str, Any]:
+        """Adds the current population and generation.
+
+        Returns:
+            Dict[str, Any]: The state to continue the run from a checkpoint.
+        """
+        state = super().get_state()
+        state["generation"] = self.generation
+        state["population"] = self._population
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores a state returned by get_state.
+
+        Args:
+            state (Dict[str, Any]): The state saved in a checkpoint.
+        """
+        super().set_state(state)
+        self.generation = state["generation"]
+        self._population = list(state["population"])
+
     def run(self, population: Pool) -> Pool:
         """Run the genetic algorithm on a population of solutions.
 
@@ -68,25 +96,30 @@ class GeneticAlgorithm(MetaHeuristic):
         Returns:
             Pool: The final population after evolution.
         """
-        if not population:
-            raise Exception(
-                "GeneticAlgorithm assumes the population will be filled with empty solutions at the start."
-            )
-
         curr_pop = ListPool()
-        generation = 0
+        if self.resuming:
+            # Population, generation and counters were restored from a checkpoint
+            for sol in self._population:
+                curr_pop.add_solution(sol)
+        else:
+            if not population:
+                raise Exception(
+                    "GeneticAlgorithm assumes the population will be filled with empty solutions at the start."
+                )
+
+            self.generation = 0
+
+            # Construct the initial population using the construction heuristic
+            for sol in population:
+                curr_pop.add(self.construction.run_operation(sol, self), self.evaluator)
 
-        # Construct the initial population using the construction heuristic
-        for sol in population:
-            curr_pop.add(self.construction.run_operation(sol, self), self.evaluator)
+            self.stop_criteria.reset()
 
         new_pop = ListPool()
         evaluations = []
 
-        self.stop_criteria.reset()
-
         while not self.stop():
-            generation += 1
+            self.generation += 1
             self.stop_criteria.increment_counter()
             evaluations.clear()
 
@@ -110,4 +143,15 @@ class GeneticAlgorithm(MetaHeuristic):
             for sol in new_pop:
                 curr_pop.add(self.mutations.run_operation(sol), self.evaluator)
 
+            self._population = curr_pop.get_list()
+            self.checkpoint()
+
         return curr_pop
+
+    def set_neighborhood(self, neighborhood) -> None:
+        """Sets the neighborhood of the mutations; the GA has none of its own.
+
+        Args:
+            neighborhood (Neighborhood): The neighborhood for the mutations.
+        """
+        self.mutations.set_neighborhood(neighborhood)
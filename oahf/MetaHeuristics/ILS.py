@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
 from oahf.Base.Evaluator import Evaluator
@@ -37,11 +37,12 @@ class ILS(MetaHeuristic):
             criteria (AcceptanceCriteria): The acceptance criteria for solutions.
         """
         super().__init__(
-            thread_id, stop, evaluator, criteria, pertubation, local_search
+            thread_id, stop, evaluator, None, criteria, [pertubation, local_search]
         )
         self.number_pertubations = number_pertubations
         self.solutions = solution_pool
         self.change_solution_criteria = change_solution
+        self._current_solution: Optional[Solution] = None
 
     def copy(self, thread: int) -> "ILS":
         """Creates a copy of the ILS instance.
@@ -52,8 +53,7 @@ class ILS(MetaHeuristic):
         Returns:
             ILS: A new instance of ILS that is a copy of this instance.
         """
-        return ILS
-        (
+        return ILS(
             thread,
             self.stop_criteria.copy(),
             self.evaluator,
@@ -65,6 +65,31 @@ class ILS(MetaHeuristic):
             self.acceptance_criteria.copy(),
         )
 
+    def get_state(self) -> Dict[str, Any]:
+        """Adds the pool, the current solution and the change-solution counter.
+
+        Returns:
+            Dict[str, Any]: The state to continue the run from a checkpoint.
+        """
+        state = super().get_state()
+        state["solutions"] = self.solutions.get_list()
+        state["current_solution"] = self._current_solution
+        state["change_solution"] = self.change_solution_criteria.get_state()
+        return state
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restores a state returned by get_state.
+
+        Args:
+            state (Dict[str, Any]): The state saved in a checkpoint.
+        """
+        super().set_state(state)
+        self.solutions.clear()
+        for solution in state["solutions"]:
+            self.solutions.add_solution(solution)
+        self._current_solution = state["current_solution"]
+        self.change_solution_criteria.set_state(state["change_solution"])
+
     def run(self, sol: Optional[Solution]) -> Optional[Solution]:
         """Executes the Iterated Local Search meta-heuristic.
 
@@ -77,10 +102,14 @@ class ILS(MetaHeuristic):
         perturbation = self.meta_heuristics_used[0]  # Perturbation method
         local_search = self.meta_heuristics_used[1]  # Local search method
 
-        self.solutions.clear()
-        self.stop_criteria.reset()
+        if self.resuming:
+            # Pool, counters and current solution were restored from a checkpoint
+            curr_sol = self._current_solution
+        else:
+            self.solutions.clear()
+            self.stop_criteria.reset()
+            curr_sol = sol.copy() if sol is not None else None
 
-        curr_sol = sol.copy() if sol is not None else None
         while not self.stop_on_evaluations(
             self.evaluator.evaluate(self.solutions.get_best(self.evaluator))
         ):
@@ -97,7 +126,9 @@ class ILS(MetaHeuristic):
             )
             if self.change_solution_criteria.stop():
                 curr_sol = self.solutions.get_solution_at(
-                    ThreadManager.get_next(self.thread_id, 0, self.solutions.count())
+                    ThreadManager.get_next(
+                        self.thread_id, 0, self.solutions.count() - 1
+                    )
                 )
                 if curr_sol is not None:
                     curr_sol = curr_sol.copy()
@@ -110,9 +141,20 @@ class ILS(MetaHeuristic):
                     self.evaluator.evaluate(self.solutions.get_best(self.evaluator))
                 )
 
+            self._current_solution = curr_sol
+            self.checkpoint()
+
         self.solutions.add(
             curr_sol.copy() if curr_sol is not None else None, self.evaluator
         )
         self.solutions.add(sol.copy() if sol is not None else None, self.evaluator)
 
         return self.solutions.get_best(self.evaluator)
+
+    def set_neighborhood(self, neighborhood) -> None:
+        """Sets the neighborhood of the local search; ILS has none of its own.
+
+        Args:
+            neighborhood (Neighborhood): The neighborhood for the local search.
+        """
+        self.meta_heuristics_used[1].set_neighborhood(neighborhood)
@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Iterable, List, Optional, Union
+
+from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.Pool import Pool
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+from oahf.Base.ThreadManager import ThreadManager
+from oahf.Logger.LogManager import LogManager
+
+# Inner metaheuristic and stop signal of a worker process, set once by _init_worker
+_worker: dict = {}
+
+
+class _StopSignal:
+    """
+    Parent of the inner metaheuristic in a worker process, stopping it once POPMUSIC
+    sets the shared event.
+    """
+
+    def __init__(self, event) -> None:
+        self.event = event
+
+    def stop(self) -> bool:
+        return self.event.is_set()
+
+    def stop_on_evaluations(self, evs: Iterable[Evaluation]) -> bool:
+        return self.event.is_set()
+
+
+def _init_worker(inner: MetaHeuristic, stopped) -> None:
+    ThreadManager.reseed(os.getpid())
+    _worker["inner"] = inner
+    _worker["parent"] = _StopSignal(stopped)
+
+
+def _optimize_part(part: Solution) -> Optional[Solution]:
+    """Runs the inner metaheuristic of a worker process on a part."""
+    inner = _worker["inner"]
+    return _best_solution(inner, inner.run_operation(part, _worker["parent"]))
+
+
+def _best_solution(
+    inner: MetaHeuristic, result: Optional[Union[Solution, Pool]]
+) -> Optional[Solution]:
+    if isinstance(result, Pool):
+        return result.get_best(inner.evaluator)
+    return result
+
+
+class POPMUSIC(MetaHeuristic):
+    """
+    Decomposition metaheuristic (POPMUSIC, Partial OPtimization Metaheuristic Under
+    Special Intensification Conditions). Every round splits the current solution into
+    parts with Solution.shift_decomposition, optimizes the parts concurrently with
+    the inner metaheuristic, and puts them back together with
+    Solution.merge_solutions. Merged solutions that the acceptance criteria accepts
+    replace the current solution, which the next round decomposes. Each round moves
+    the part boundaries by one more unit, so a part never stays stuck at the same
+    cut. The search ends when the stop criteria are met or no round of a whole cycle
+    of shifts improves the best solution.
+
+    The parts are subproblems: the inner metaheuristic and its evaluator work on
+    parts, while the evaluator of POPMUSIC scores whole solutions. With processes
+    above 1 the parts are optimized in worker processes, each with a copy of the
+    inner metaheuristic. The processes are forked where available, so the inner
+    metaheuristic need not be picklable, but parts and their results must be. While
+    the workers run, the stop criteria of POPMUSIC is checked every poll_interval
+    seconds, and once met a shared event stops the inner metaheuristics.
+    """
+
+    # Seconds between two checks of the stop criteria while worker processes run
+    poll_interval: float = 0.01
+
+    def __init__(
+        self,
+        thread_id: int,
+        stop: StopCriteria,
+        evaluator: Evaluator,
+        inner: MetaHeuristic,
+        criteria: AcceptanceCriteria,
+        parts: int,
+        shifts: int = 1,
+        processes: int = 1,
+    ) -> None:
+        """
+        Initializes POPMUSIC.
+        :param thread_id: Identifier for the thread.
+        :param stop: Stopping criteria; its iterations count rounds.
+        :param evaluator: Evaluator of whole solutions.
+        :param inner: Metaheuristic optimizing each part.
+        :param criteria: Acceptance criteria of merged solutions.
+        :param parts: Number of parts (k) of each decomposition.
+        :param shifts: Number of distinct shifts of the part boundaries; the search
+            ends after this many rounds in a row without improvement.
+        :param processes: Worker processes optimizing parts; 1 optimizes them one
+            after the other in this thread.
+        """
+        super().__init__(thread_id, stop, evaluator, None, criteria, [inner])
+        self.parts = max(1, parts)
+        self.shifts = max(1, shifts)
+        self.processes = max(1, processes)
+        self._stopped = None
+
+    def copy(self, thread: int) -> "POPMUSIC":
+        """Creates a copy of the POPMUSIC instance."""
+        return POPMUSIC(
+            thread,
+            self.stop_criteria.copy(),
+            self.evaluator,
+            self.meta_heuristics_used[0].copy(thread),
+            self.acceptance_criteria.copy(),
+            self.parts,
+            self.shifts,
+            self.processes,
+        )
+
+    def set_neighborhood(self, neighborhood) -> None:
+        """Sets the neighborhood of the inner metaheuristic."""
+        self.meta_heuristics_used[0].set_neighborhood(neighborhood)
+
+    def optimize_parts(self, parts: List[Solution], executor) -> List[Solution]:
+        """
+        Optimizes every part with the inner metaheuristic.
+        :param parts: The parts of a decomposition.
+        :param executor: Pool of worker processes, or None to run in this thread.
+        :return: The optimized parts, in order; a part is kept when its run fails.
+        """
+        inner = self.meta_heuristics_used[0]
+        results: List[Optional[Solution]] = []
+        if executor is None:
+            for part in parts:
+                try:
+                    result = inner.run_operation(part.copy(), self)
+                    results.append(_best_solution(inner, result))
+                except Exception as ex:
+                    LogManager.something_went_wrong(type(inner), ex)
+                    results.append(None)
+        else:
+            futures = [executor.submit(_optimize_part, part) for part in parts]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, self.poll_interval, FIRST_COMPLETED)
+                if pending and not self._stopped.is_set() and self.stop():
+                    self._stopped.set()
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    LogManager.something_went_wrong(type(inner), ex)
+                    results.append(None)
+        return [part if r is None else r for part, r in zip(parts, results)]
+
+    def run(self, sol: Optional[Solution]) -> Optional[Solution]:
+        """Executes POPMUSIC on the given solution."""
+        if sol is None:
+            return None
+        best_sol = curr_sol = sol.copy()
+        best_eval = curr_eval = self.evaluator.evaluate(best_sol)
+        self.stop_criteria.reset()
+        self.acceptance_criteria.reset()
+
+        executor = None
+        if self.processes > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._stopped = context.Event()
+            executor = ProcessPoolExecutor(
+                self.processes,
+                context,
+                initializer=_init_worker,
+                initargs=(self.meta_heuristics_used[0], self._stopped),
+            )
+
+        shift = 0
+        failures = 0
+        try:
+            while failures < self.shifts and not self.stop_on_evaluations(best_eval):
+                self.stop_criteria.increment_counter()
+                parts = curr_sol.shift_decomposition(self.parts, shift)
+                shift = (shift + 1) % self.shifts
+                if not parts:
+                    LogManager.something_went_wrong(
+                        self.__class__, "the solution cannot be decomposed"
+                    )
+                    break
+
+                merged = curr_sol.merge_solutions(self.optimize_parts(parts, executor))
+                merged_eval = self.evaluator.evaluate(merged)
+                if self.log_solutions:
+                    self.log_current_solution(merged_eval)
+
+                if self.acceptance_criteria.accept(curr_eval, merged_eval, merged):
+                    curr_sol = merged
+                    curr_eval = merged_eval
+                if merged_eval.better_than(best_eval):
+                    best_sol = merged
+                    best_eval = merged_eval
+                    failures = 0
+                else:
+                    failures += 1
+                if self.log_solutions:
+                    self.log_best_solution(best_eval)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+                self._stopped = None
+
+        return best_sol
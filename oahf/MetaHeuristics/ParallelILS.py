@@ -1,13 +1,18 @@
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
+from oahf.Base.Evaluation import Evaluation
 from oahf.Base.Evaluator import Evaluator
 from oahf.Base.MetaHeuristic import MetaHeuristic
 from oahf.Base.Pool import Pool
+from oahf.Base.SharedEvaluationTable import SharedEvaluationTable
+from oahf.Base.SharedMemory import SharedMemory
 from oahf.Base.Solution import Solution
 from oahf.Base.StopCriteria import StopCriteria
 from oahf.Base.ThreadManager import ThreadManager
+from oahf.ImplementedBase.SharedEvaluator import SharedEvaluator
 from oahf.MetaHeuristics.Pertubation import Pertubation
 
 
@@ -26,6 +31,7 @@ class ParallelILS(MetaHeuristic):
         change_solution_criteria: StopCriteria,
         criteria: AcceptanceCriteria,
         destination_pool: Optional[Pool] = None,
+        shared_memory: Optional[Union[SharedMemory, SharedEvaluationTable]] = None,
     ) -> None:
         """Initialize the ParallelILS meta-heuristic.
 
@@ -38,22 +44,34 @@ class ParallelILS(MetaHeuristic):
             number_pertubations (int): The number of pertubations to apply.
             solution_pool (Pool): The initial solution pool.
             num_threads (int): The number of threads to use for parallel execution.
-            repeatable (bool): Whether to wait for all tasks to finish before proceeding.
+            repeatable (bool): Run the threads in lockstep, waiting for all of them at
+                every iteration, so runs are reproducible. Otherwise every thread
+                iterates on its own and shares its solutions as soon as found; each
+                shared solution then counts as one iteration of the stop criteria.
             change_solution_criteria (StopCriteria): The criteria to change solutions.
             criteria (AcceptanceCriteria): The acceptance criteria for solutions.
             destination_pool (Optional[Pool]): Optional destination pool.
+            shared_memory (Optional[Union[SharedMemory, SharedEvaluationTable]]): Optional store of
+                already scored solutions shared by the workers. The evaluators of the
+                pertubation and the local search are wrapped with it too.
         """
         super().__init__(
-            thread_id, stop, evaluator, criteria, pertubation, local_search
+            thread_id, stop, evaluator, None, criteria, [pertubation, local_search]
         )
+        if shared_memory is not None:
+            SharedEvaluator.share(self, shared_memory)
         self.number_pertubations = number_pertubations
         self.initial_sols = solution_pool
         self.solutions = destination_pool if destination_pool else solution_pool
         self.repeatable = repeatable
         self.num_threads = num_threads
         self.change_solution_criteria = change_solution_criteria
+        self.shared_memory = shared_memory
         self.pertubations = []  # To be filled in during run
         self.local_searches = []  # To be filled in during run
+        # Guards the solution pool and the incumbent in the asynchronous mode
+        self._pool_lock = threading.Lock()
+        self._best_eval: Optional[Evaluation] = None
 
     def copy(self, thread: int) -> "ParallelILS":
         """Create a copy of the ParallelILS instance.
@@ -77,6 +95,7 @@ class ParallelILS(MetaHeuristic):
             self.change_solution_criteria.copy(),
             self.acceptance_criteria.copy(),
             self.solutions.copy(),
+            self.shared_memory,
         )
 
     def main_run(self, thread_id: int, solutions: List[Solution]) -> None:
@@ -100,6 +119,70 @@ class ParallelILS(MetaHeuristic):
         # Update the solution in the thread's solution list
         solutions[thread_id] = curr_sol
 
+    def set_neighborhood(self, neighborhood) -> None:
+        """Sets the neighborhood of the local search.
+
+        Args:
+            neighborhood (Neighborhood): The neighborhood for the local search.
+        """
+        self.meta_heuristics_used[1].set_neighborhood(neighborhood)
+
+    def restart_solution(self, thread_id: int) -> Solution:
+        """Draw a copy of a random pool solution to restart a thread from.
+
+        Args:
+            thread_id (int): The thread ID.
+
+        Returns:
+            Solution: The restart solution.
+        """
+        with self._pool_lock:
+            index = ThreadManager.get_next(
+                thread_id + self.thread_id, 0, self.solutions.count() - 1
+            )
+            return self.solutions.get_solution_at(index).copy()
+
+    def publish(self, solution: Solution) -> None:
+        """Add a thread's solution to the pool, updating the incumbent.
+
+        Args:
+            solution (Solution): The solution found by the thread.
+        """
+        evaluation = self.evaluator.evaluate(solution)
+        with self._pool_lock:
+            self.stop_criteria.increment_counter()
+            self.solutions.add(solution, self.evaluator)
+            if self.log_solutions:
+                self.log_current_solution(evaluation)
+            if self._best_eval is None or evaluation.better_than(self._best_eval):
+                self._best_eval = evaluation
+                if self.log_solutions:
+                    self.log_best_solution(evaluation)
+
+    def worker_run(self, thread_id: int) -> None:
+        """Iterate perturbation and local search on one thread until the stop criteria
+        are met, without waiting for the other threads.
+
+        Args:
+            thread_id (int): The thread ID.
+        """
+        pertubation = self.pertubations[thread_id]
+        local_search = self.local_searches[thread_id]
+        change_solution = self.change_solution_criteria.copy()
+        change_solution.reset()
+        curr_sol = self.restart_solution(thread_id)
+
+        while not self.stop_on_evaluations(self._best_eval):
+            for _ in range(self.number_pertubations):
+                curr_sol = pertubation.run_operation(curr_sol.copy(), self)
+            curr_sol = local_search.run_operation(curr_sol, self)
+            self.publish(curr_sol.copy())
+
+            change_solution.increment_counter()
+            if change_solution.stop():
+                curr_sol = self.restart_solution(thread_id)
+                change_solution.reset()
+
     def run(self, sol: Optional[Solution]) -> Optional[Solution]:
         """Execute the ParallelILS meta-heuristic.
 
@@ -117,6 +200,9 @@ class ParallelILS(MetaHeuristic):
             self.solutions.add(sol.copy(), self.evaluator)
             for s in self.initial_sols.get_list():
                 self.solutions.add(s.copy(), self.evaluator)
+            self._best_eval = self.evaluator.evaluate(
+                self.solutions.get_best(self.evaluator)
+            )
 
             # Initialize perturbations and local searches for each thread
             self.pertubations = [
@@ -127,10 +213,21 @@ class ParallelILS(MetaHeuristic):
                 self.meta_heuristics_used[1].copy(i + self.thread_id)
                 for i in range(self.num_threads)
             ]
+            # The copies are made here, after set_trace reached the originals
+            if self.trace is not None:
+                for meta in self.pertubations + self.local_searches:
+                    meta.set_trace(self.trace)
 
             self.stop_criteria.reset()
 
-            while not self.stop_on_evaluations(
+            if not self.repeatable:
+                tasks = [
+                    executor.submit(self.worker_run, i) for i in range(self.num_threads)
+                ]
+                for task in tasks:
+                    task.result()
+
+            while self.repeatable and not self.stop_on_evaluations(
                 self.evaluator.evaluate(self.solutions.get_best(self.evaluator))
             ):
                 self.stop_criteria.increment_counter()
@@ -149,13 +246,12 @@ class ParallelILS(MetaHeuristic):
                     if len(solutions_current) < self.num_threads:
                         solutions_current.append(
                             self.solutions.get_solution_at(
-                                ThreadManager.get_next(i, 0, self.solutions.count())
+                                ThreadManager.get_next(i, 0, self.solutions.count() - 1)
                             ).copy()
                         )
                     tasks.append(executor.submit(self.main_run, i, solutions_current))
 
-                if self.repeatable:
-                    [task.result() for task in tasks]  # Wait for all tasks to complete
+                [task.result() for task in tasks]  # Wait for all tasks to complete
 
                 # Log and add new solutions to the pool
                 for i in range(self.num_threads):
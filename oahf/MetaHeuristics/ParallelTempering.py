@@ -0,0 +1,286 @@
+import math
+import multiprocessing
+from typing import List, Optional, Tuple
+
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.NeighborhoodSelection import NeighborhoodSelection
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+from oahf.Base.ThreadManager import ThreadManager
+from oahf.ImplementedBase.SimulatedAnnealing import SimulatedAnnealing
+from oahf.Logger.LogManager import LogManager
+
+# (sort key, packed solution) of a replica state sent to the parent
+ReplicaState = Tuple[Tuple[bool, float], bytes]
+
+
+class ParallelTempering(MetaHeuristic):
+    """
+    Parallel tempering (replica exchange): one replica per temperature of a ladder,
+    each in its own process, runs a Metropolis walk on its neighborhoods. A replica
+    applies movements, scores them with Evaluator.evaluate_move and accepts them with
+    a SimulatedAnnealing criteria held at its temperature. After every swap_interval
+    movements the replicas send their current solutions (Solution.to_bytes), and the
+    best ones visited since the last exchange, to this process, which swaps the
+    states of adjacent replicas, alternating even and odd pairs, with the
+    replica-exchange probability
+    min(1, exp((E_i - E_j) * (1 / T_i - 1 / T_j))). Good solutions thus drift to the
+    cold replicas, while hot replicas keep exploring.
+
+    The stop criteria is checked here between exchanges; its iterations count
+    exchanges. Replicas are forked where available, so the neighborhoods and the
+    evaluator need not be picklable.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        stop: StopCriteria,
+        evaluator: Evaluator,
+        ns: NeighborhoodSelection,
+        temperatures: List[float],
+        swap_interval: int = 1000,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes ParallelTempering.
+        :param thread_id: Identifier for the thread.
+        :param stop: Stopping criteria; its iterations count exchanges.
+        :param evaluator: Evaluator to assess solutions.
+        :param ns: Neighborhood selection of the replicas.
+        :param temperatures: Temperature of each replica, from the coldest to the
+            hottest (see geometric_ladder).
+        :param swap_interval: Movements evaluated by each replica between exchanges.
+        :param start_method: multiprocessing start method, by default fork if
+            available.
+        """
+        super().__init__(thread_id, stop, evaluator, ns)
+        self.neighborhood = None
+        self.temperatures = sorted(temperatures)
+        self.swap_interval = max(1, swap_interval)
+        self.start_method = start_method
+        # Accepted exchanges / attempted exchanges of each adjacent pair (i, i + 1)
+        self.swaps_accepted: List[int] = [0] * max(0, len(self.temperatures) - 1)
+        self.swaps_attempted: List[int] = [0] * max(0, len(self.temperatures) - 1)
+
+    @staticmethod
+    def geometric_ladder(t_min: float, t_max: float, replicas: int) -> List[float]:
+        """
+        Builds temperatures with a constant ratio between neighbors, which keeps the
+        exchange rates of all adjacent pairs alike when the energies spread evenly.
+        :param t_min: The coldest temperature.
+        :param t_max: The hottest temperature.
+        :param replicas: The number of temperatures.
+        :return: The temperatures, from the coldest to the hottest.
+        """
+        if replicas <= 1:
+            return [t_min]
+        ratio = (t_max / t_min) ** (1.0 / (replicas - 1))
+        return [t_min * ratio**i for i in range(replicas)]
+
+    def copy(self, thread: int) -> "ParallelTempering":
+        """Creates a copy of the ParallelTempering instance."""
+        copy = ParallelTempering(
+            thread,
+            self.stop_criteria.copy(),
+            self.evaluator,
+            self.neighborhood_selection.copy() if self.neighborhood_selection else None,
+            self.temperatures,
+            self.swap_interval,
+            self.start_method,
+        )
+        copy.neighborhood = self.neighborhood
+        return copy
+
+    def set_neighborhood(self, neighborhood) -> None:
+        """Sets the only neighborhood of the replicas."""
+        self.neighborhood = neighborhood
+
+    def swap_rates(self) -> List[float]:
+        """Returns the fraction of accepted exchanges of each adjacent pair."""
+        return [
+            accepted / attempted if attempted else 0.0
+            for accepted, attempted in zip(self.swaps_accepted, self.swaps_attempted)
+        ]
+
+    def metropolis_walk(
+        self,
+        criteria: SimulatedAnnealing,
+        curr_sol: Solution,
+        curr_eval: Evaluation,
+        steps: int,
+        best_key: Optional[Tuple[bool, float]] = None,
+    ) -> Tuple[Evaluation, Optional[ReplicaState]]:
+        """
+        Runs Metropolis movements on a solution, in place.
+        :param criteria: The acceptance criteria at the replica temperature.
+        :param curr_sol: The solution, modified by the accepted movements.
+        :param curr_eval: Its evaluation.
+        :param steps: The number of movements to evaluate.
+        :param best_key: Sort key of the best solution visited so far, if any.
+        :return: The evaluation of the solution after the walk, and the best solution
+            visited during the walk if better than best_key (None otherwise).
+        """
+        best: Optional[ReplicaState] = None
+        if best_key is None or curr_eval.sort_key < best_key:
+            best = (curr_eval.sort_key, curr_sol.to_bytes())
+            best_key = best[0]
+        while steps > 0:
+            ns = self.neighborhood or self.neighborhood_selection.get_next(
+                self.thread_id
+            )
+            if ns is None:
+                self.neighborhood_selection.reset(self.thread_id)
+                ns = self.neighborhood_selection.get_next(self.thread_id)
+            if ns is None or not ns.build_neighborhood_operation(
+                self.thread_id, curr_sol
+            ):
+                break
+
+            move = ns.get_move_operation()
+            if move is None:
+                break
+            while move is not None and steps > 0:
+                steps -= 1
+                if move.apply_operation():
+                    next_eval = self.evaluator.evaluate_move(curr_sol, move, curr_eval)
+                    if criteria.accept(curr_eval, next_eval, curr_sol):
+                        ns.accept_movement(move)
+                        self.evaluator.save_evaluation_state(curr_sol)
+                        curr_eval = next_eval
+                        if curr_eval.sort_key < best_key:
+                            best = (curr_eval.sort_key, curr_sol.to_bytes())
+                            best_key = best[0]
+                        break  # rebuild the neighborhood on the new solution
+                    move.unapply_operation(next_eval)
+                    self.evaluator.update_evaluation_after_unapply(curr_sol)
+                move = ns.get_move_operation()
+        return curr_eval, best
+
+    def _run_replica(self, replica: int, connection, sol: Solution) -> None:
+        """
+        Main loop of a replica process. Receives the state to continue from (None to
+        keep its own) before every walk, and answers with its state and the best
+        solution visited during the walk (None if not better than the earlier ones).
+        """
+        ThreadManager.reseed(replica + 1)
+        criteria = SimulatedAnnealing(1.0, 0.0, 1, self.thread_id)
+        criteria.set_temperature(self.temperatures[replica])
+        curr_sol = sol.copy()
+        best_key: Optional[Tuple[bool, float]] = None
+        try:
+            while True:
+                message = connection.recv()
+                if message is None:
+                    break
+                if message[0] is not None:
+                    curr_sol = sol.from_bytes(message[0])
+                curr_eval = self.evaluator.evaluate(curr_sol)
+                self.evaluator.save_evaluation_state(curr_sol)
+                curr_eval, best = self.metropolis_walk(
+                    criteria, curr_sol, curr_eval, self.swap_interval, best_key
+                )
+                if best is not None:
+                    best_key = best[0]
+                connection.send(((curr_eval.sort_key, curr_sol.to_bytes()), best))
+        except Exception as ex:
+            LogManager.something_went_wrong(self.__class__, ex)
+            raise
+        finally:
+            connection.close()
+
+    def _exchange(
+        self, states: List[ReplicaState], parity: int
+    ) -> List[Optional[bytes]]:
+        """
+        Attempts to swap the states of the adjacent pairs starting at parity.
+        :return: The state each replica continues from, None to keep its own.
+        """
+        moved: List[Optional[bytes]] = [None] * len(states)
+        for i in range(parity, len(states) - 1, 2):
+            cold_infeasible, cold = states[i][0]
+            hot_infeasible, hot = states[i + 1][0]
+            self.swaps_attempted[i] += 1
+            if cold_infeasible != hot_infeasible:
+                swap = cold_infeasible  # a feasible hot state always moves down
+            else:
+                exponent = (cold - hot) * (
+                    1.0 / self.temperatures[i] - 1.0 / self.temperatures[i + 1]
+                )
+                swap = exponent >= 0 or ThreadManager.get_next_double(
+                    self.thread_id
+                ) < math.exp(exponent)
+            if swap:
+                self.swaps_accepted[i] += 1
+                moved[i], moved[i + 1] = states[i + 1][1], states[i][1]
+        return moved
+
+    def run(self, sol: Optional[Solution]) -> Optional[Solution]:
+        """
+        Runs the replicas until the stop criteria are met.
+        :param sol: The initial solution of every replica.
+        :return: The best solution found by any replica.
+        """
+        if sol is None or not self.temperatures:
+            return sol
+        start_method = self.start_method or (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        context = multiprocessing.get_context(start_method)
+        replicas = len(self.temperatures)
+        self.swaps_accepted = [0] * (replicas - 1)
+        self.swaps_attempted = [0] * (replicas - 1)
+        self.stop_criteria.reset()
+
+        best_sol = sol.copy()
+        best_eval = self.evaluator.evaluate(best_sol)
+        connections = []
+        processes = []
+        for i in range(replicas):
+            parent, child = context.Pipe()
+            connections.append(parent)
+            processes.append(
+                context.Process(
+                    target=self._run_replica,
+                    args=(i, child, sol),
+                    name=f"oahf-tempering-{i}",
+                )
+            )
+        try:
+            for process in processes:
+                process.start()
+            moved: List[Optional[bytes]] = [None] * replicas
+            exchanges = 0
+            while True:
+                for connection, state in zip(connections, moved):
+                    connection.send((state,))
+                answers = [c.recv() for c in connections]
+                states: List[ReplicaState] = [state for state, _ in answers]
+                self.stop_criteria.increment_counter()
+
+                visited = [best for _, best in answers if best is not None]
+                coldest = min(visited, key=lambda state: state[0], default=None)
+                if coldest is not None and coldest[0] < best_eval.sort_key:
+                    best_sol = sol.from_bytes(coldest[1])
+                    best_eval = self.evaluator.evaluate(best_sol)
+                    if self.log_solutions:
+                        self.log_best_solution(best_eval)
+                if self.stop_on_evaluations(best_eval):
+                    break
+                moved = self._exchange(states, exchanges % 2)
+                exchanges += 1
+
+            for connection in connections:
+                connection.send(None)
+        finally:
+            for process in processes:
+                process.join(timeout=1.0)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for connection in connections:
+                connection.close()
+
+        return best_sol
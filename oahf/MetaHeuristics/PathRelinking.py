@@ -0,0 +1,254 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from oahf.Base.AcceptanceCriteria import AcceptanceCriteria
+from oahf.Base.DifferenceNeighborhood import DifferenceNeighborhood
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.Pool import Pool
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+from oahf.Base.ThreadManager import ThreadManager
+from oahf.ImplementedBase.ListSelection import ListSelection
+from oahf.Logger.LogManager import LogManager
+
+
+class PathRelinking(MetaHeuristic):
+    """Path Relinking between members of a solution pool.
+
+    Walks from an initiating solution towards a guiding solution, applying at each step
+    the best movement of a DifferenceNeighborhood, and inserts the best intermediate
+    solution found on the path back into the pool.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        stop: StopCriteria,
+        evaluator: Evaluator,
+        relinking: DifferenceNeighborhood,
+        solution_pool: Pool,
+        number_pairs: int,
+        num_threads: int,
+        criteria: AcceptanceCriteria,
+    ) -> None:
+        """Initialize the PathRelinking meta-heuristic.
+
+        Args:
+            thread_id (int): The ID of the thread.
+            stop (StopCriteria): The stopping criteria for the algorithm.
+            evaluator (Evaluator): The evaluator used to assess solutions.
+            relinking (DifferenceNeighborhood): Neighborhood generating the moves towards the guiding solution.
+            solution_pool (Pool): Pool the pairs are drawn from and the intermediates are added to.
+            number_pairs (int): Number of pairs relinked per iteration.
+            num_threads (int): Number of threads used to relink the pairs of an iteration.
+            criteria (AcceptanceCriteria): The acceptance criteria for intermediate solutions.
+        """
+        super().__init__(
+            thread_id,
+            stop,
+            evaluator,
+            neighborhood_selection=ListSelection(False, relinking),
+            acceptance_criteria=criteria,
+        )
+        self.neighborhood = relinking
+        self.solutions = solution_pool
+        self.number_pairs = number_pairs
+        self.num_threads = max(1, num_threads)
+        self.neighborhoods: List[DifferenceNeighborhood] = []  # Filled in during run
+
+    def copy(self, thread: int) -> "PathRelinking":
+        """Creates a copy of the PathRelinking instance.
+
+        Args:
+            thread (int): The ID of the thread for the copied instance.
+
+        Returns:
+            PathRelinking: A new instance of PathRelinking that is a copy of this instance.
+        """
+        return PathRelinking(
+            thread,
+            self.stop_criteria.copy(),
+            self.evaluator,
+            self.neighborhood.copy(),
+            self.solutions.copy(),
+            self.number_pairs,
+            self.num_threads,
+            self.acceptance_criteria.copy(),
+        )
+
+    def select_pairs(self) -> List[Tuple[Solution, Solution]]:
+        """Draws the (initiating, guiding) pairs of distinct pool members to relink.
+
+        Returns:
+            List[Tuple[Solution, Solution]]: The pairs for the current iteration.
+        """
+        pairs = []
+        last = self.solutions.count() - 1
+        for _ in range(self.number_pairs):
+            origin = ThreadManager.get_next(self.thread_id, 0, last)
+            guide = ThreadManager.get_next(self.thread_id, 0, last - 1)
+            if guide >= origin:
+                guide += 1
+            pairs.append(
+                (
+                    self.solutions.get_solution_at(origin),
+                    self.solutions.get_solution_at(guide),
+                )
+            )
+        return pairs
+
+    def relink(
+        self,
+        thread_id: int,
+        neighborhood: DifferenceNeighborhood,
+        origin: Solution,
+        guide: Solution,
+    ) -> Tuple[Optional[Solution], Optional[Evaluation]]:
+        """Walks from origin to guide and returns the best intermediate solution.
+
+        Every candidate step is applied, evaluated and unapplied on the same solution,
+        so evaluators keeping an incremental state only pay for the move itself.
+
+        Args:
+            thread_id (int): The thread ID.
+            neighborhood (DifferenceNeighborhood): The neighborhood owned by the thread.
+            origin (Solution): The initiating solution.
+            guide (Solution): The guiding solution.
+
+        Returns:
+            Tuple[Optional[Solution], Optional[Evaluation]]: The best intermediate and its evaluation,
+            or (None, None) if the path has no intermediate solution.
+        """
+        curr_sol = origin.copy()
+        curr_base_eval = self.evaluator.evaluate(curr_sol)
+        best_sol = None
+        best_eval = None
+
+        neighborhood.set_guiding_solution(guide)
+        self.evaluator.save_evaluation_state(curr_sol)
+
+        while not self.stop():
+            if not neighborhood.build_neighborhood_operation(thread_id, curr_sol):
+                break
+
+            step_move = None
+            step_eval = None
+            move = neighborhood.get_move_operation()
+            while move is not None:
+                if move.apply_operation():
+                    curr_eval = self.evaluator.evaluate_move(
+                        curr_sol, move, curr_base_eval
+                    )
+                    if step_eval is None or curr_eval.better_than(step_eval):
+                        step_move = move
+                        step_eval = curr_eval
+                    move.unapply_operation(curr_eval)
+                    self.evaluator.update_evaluation_after_unapply(curr_sol)
+                move = neighborhood.get_move_operation()
+
+            if step_move is None or not step_move.apply_operation():
+                break
+
+            neighborhood.accept_movement(step_move)
+            self.evaluator.save_evaluation_state(curr_sol)
+            curr_base_eval = step_eval
+
+            if neighborhood.distance(curr_sol) == 0:
+                break  # reached the guiding solution, which is already in the pool
+
+            if best_eval is None or self.acceptance_criteria.accept(
+                best_eval, step_eval, curr_sol
+            ):
+                if best_eval is not None:
+                    step_move.report_apply_improvement(step_eval, best_eval)
+                best_sol = curr_sol.copy()
+                best_eval = step_eval
+
+        neighborhood.set_guiding_solution(None)
+        return best_sol, best_eval
+
+    def main_run(
+        self,
+        thread_id: int,
+        pairs: List[Tuple[Solution, Solution]],
+        results: List[Tuple[Optional[Solution], Optional[Evaluation]]],
+    ) -> None:
+        """Relinks the pairs assigned to a given thread.
+
+        Args:
+            thread_id (int): Index of the thread, pairs i with i % num_threads == thread_id belong to it.
+            pairs (List[Tuple[Solution, Solution]]): All pairs of the iteration.
+            results (List[Tuple[Optional[Solution], Optional[Evaluation]]]): Output list, one entry per pair.
+        """
+        neighborhood = self.neighborhoods[thread_id]
+        for i in range(thread_id, len(pairs), self.num_threads):
+            if self.stop():
+                break
+            try:
+                results[i] = self.relink(
+                    thread_id + self.thread_id, neighborhood, *pairs[i]
+                )
+            except Exception as ex:
+                LogManager.something_went_wrong(neighborhood, ex)
+
+    def run(self, sol: Optional[Solution]) -> Optional[Solution]:
+        """Executes the Path Relinking meta-heuristic.
+
+        Args:
+            sol (Optional[Solution]): An optional solution added to the pool before relinking.
+
+        Returns:
+            Optional[Solution]: The best solution in the pool.
+        """
+        if sol is not None:
+            self.solutions.add(sol.copy(), self.evaluator)
+
+        self.neighborhoods = [self.neighborhood] + [
+            self.neighborhood.copy() for _ in range(1, self.num_threads)
+        ]
+
+        self.stop_criteria.reset()
+        self.acceptance_criteria.reset()
+
+        best_eval = self.evaluator.evaluate(self.solutions.get_best(self.evaluator))
+
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            while self.solutions.count() > 1 and not self.stop_on_evaluations(
+                best_eval
+            ):
+                self.stop_criteria.increment_counter()
+
+                pairs = self.select_pairs()
+                results = [(None, None)] * len(pairs)
+
+                if self.num_threads == 1:
+                    self.main_run(0, pairs, results)
+                else:
+                    tasks = [
+                        executor.submit(self.main_run, i, pairs, results)
+                        for i in range(min(self.num_threads, len(pairs)))
+                    ]
+                    [task.result() for task in tasks]  # Wait for all tasks to complete
+
+                # Pools are not thread-safe, so intermediates are only added here
+                for intermediate, intermediate_eval in results:
+                    if intermediate is None:
+                        continue
+                    if self.log_solutions:
+                        self.log_current_solution(intermediate_eval)
+                    self.solutions.add(intermediate, self.evaluator)
+
+                best_eval = self.evaluator.evaluate(
+                    self.solutions.get_best(self.evaluator)
+                )
+                if self.log_solutions:
+                    self.log_best_solution(best_eval)
+
+        return self.solutions.get_best(self.evaluator)
+
+    def set_neighborhood(self, neighborhood: DifferenceNeighborhood):
+        """Sets the relinking neighborhood for the PathRelinking instance."""
+        self.neighborhood = neighborhood
+        self.neighborhood_selection = ListSelection(False, neighborhood)
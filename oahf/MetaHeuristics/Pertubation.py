@@ -87,7 +87,9 @@ class Pertubation(MetaHeuristic):
                     while move is not None and not self.stop_on_evaluations(best_eval):
                         worked = move.apply_operation()
                         if worked:
-                            curr_eval = self.evaluator.evaluate(curr_sol)
+                            curr_eval = self.evaluator.evaluate_move(
+                                curr_sol, move, best_eval
+                            )
                             if (
                                 self.accept_infeasible or not curr_eval.infeasible()
                             ):  # TODO: use AcceptanceCriteria
@@ -0,0 +1,379 @@
+import math
+import multiprocessing
+import queue
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory as SharedBlock
+from typing import List, Optional, Tuple, Union
+
+from oahf.Base.Evaluation import Evaluation
+from oahf.Base.Evaluator import Evaluator
+from oahf.Base.MetaHeuristic import MetaHeuristic
+from oahf.Base.Pool import Pool
+from oahf.Base.Solution import Solution
+from oahf.Base.StopCriteria import StopCriteria
+from oahf.Base.ThreadManager import ThreadManager
+from oahf.Logger.LogManager import LogManager
+
+
+class IncumbentSlot:
+    """
+    Shared-memory slot holding the best solution found by any process.
+
+    Layout: version, infeasible flag, objective function, publishing member and
+    payload length, followed by the solution packed with Solution.to_bytes. Writers
+    and payload reads take an inter-process lock; readers poll the lock-free key and
+    version to decide whether a read is worth it.
+    """
+
+    _HEADER = struct.Struct("<QBdiI")
+
+    def __init__(self, size: int, context) -> None:
+        """
+        Creates the slot.
+        :param size: Maximum size of a packed solution, in bytes.
+        :param context: The multiprocessing context of the processes sharing it.
+        """
+        self.size: int = size
+        self._block = SharedBlock(create=True, size=self._HEADER.size + size)
+        self._lock = context.Lock()
+        self._HEADER.pack_into(self._block.buf, 0, 0, 1, math.inf, -1, 0)
+
+    def close(self) -> None:
+        """Releases the shared memory; called by the creating process."""
+        self._block.close()
+        self._block.unlink()
+
+    def key(self) -> Tuple[bool, float]:
+        """(infeasible, objective function) of the incumbent, as Evaluation.sort_key."""
+        _, infeasible, objective, _, _ = self._HEADER.unpack_from(self._block.buf)
+        return bool(infeasible), objective
+
+    def version(self) -> int:
+        return self._HEADER.unpack_from(self._block.buf)[0]
+
+    def publish(self, member: int, evaluation: Evaluation, solution: Solution) -> bool:
+        """
+        Replaces the incumbent if the solution is better.
+        :param member: Index of the publishing member.
+        :param evaluation: The evaluation of the solution.
+        :param solution: The solution.
+        :return: True if the solution became the incumbent.
+        """
+        if evaluation.sort_key >= self.key():
+            return False
+        payload = solution.to_bytes()
+        if len(payload) > self.size:
+            raise ValueError(
+                f"Packed solution of {len(payload)} bytes exceeds the slot size."
+            )
+        with self._lock:
+            version, infeasible, objective, _, _ = self._HEADER.unpack_from(
+                self._block.buf
+            )
+            if evaluation.sort_key >= (bool(infeasible), objective):
+                return False
+            start = self._HEADER.size
+            self._block.buf[start : start + len(payload)] = payload
+            self._HEADER.pack_into(
+                self._block.buf,
+                0,
+                version + 1,
+                evaluation.infeasible(),
+                evaluation.get_objective_function(),
+                member,
+                len(payload),
+            )
+        return True
+
+    def read(self, template: Solution) -> Optional[Tuple[int, int, Solution]]:
+        """
+        Reads the incumbent.
+        :param template: A solution of the instance, used to unpack it.
+        :return: (version, publishing member, solution), None if empty.
+        """
+        with self._lock:
+            version, _, _, member, length = self._HEADER.unpack_from(self._block.buf)
+            start = self._HEADER.size
+            payload = bytes(self._block.buf[start : start + length])
+        if version == 0:
+            return None
+        return version, member, template.from_bytes(payload)
+
+
+class _MemberTrace:
+    """Trace sink publishing the best objective a member reaches to the portfolio."""
+
+    def __init__(self, portfolio: "Portfolio", member: int) -> None:
+        self.portfolio = portfolio
+        self.member = member
+
+    def record(self, metaheuristic_id, thread_id, objective, feasible, best) -> None:
+        if best:
+            self.portfolio._report(self.member, not feasible, objective)
+
+
+class Portfolio(MetaHeuristic):
+    """
+    Algorithm portfolio: runs several configured MetaHeuristics concurrently, one
+    process each, on the same instance and keeps the best of their solutions.
+
+    Each member runs in epochs (one run_operation each) until the portfolio stops.
+    After an epoch a member publishes its result to a shared-memory IncumbentSlot
+    if it beats the incumbent, and starts the next epoch from the incumbent if it
+    is better than its own result (restart_from_incumbent). Members can also read
+    the incumbent bound through `incumbent_key()` to prune.
+
+    The parent process watches the best objective of each member; members still
+    lagging behind the leader by more than `lag_tolerance` (relative) once
+    `grace_seconds` have passed are told to stop, keeping at least `min_members`
+    running, so the remaining processes get the CPU.
+
+    The portfolio's stop criteria should be time-based: every member process checks
+    it, and its iterations count member epochs. Members are handed to the processes
+    by fork where available, so they need not be picklable; solutions cross
+    processes with Solution.to_bytes/from_bytes.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        stop: StopCriteria,
+        evaluator: Evaluator,
+        meta_heuristics: List[MetaHeuristic],
+        solution_pool: Pool,
+        restart_from_incumbent: bool = True,
+        lag_tolerance: Optional[float] = 0.05,
+        grace_seconds: float = 10.0,
+        min_members: int = 1,
+        check_interval: float = 0.5,
+        slot_size: int = 1 << 20,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes the Portfolio.
+        :param thread_id: Identifier for the thread.
+        :param stop: Stopping criteria of the whole portfolio.
+        :param evaluator: Evaluator to compare the members' solutions.
+        :param meta_heuristics: The members, run concurrently.
+        :param solution_pool: Pool receiving the members' final solutions.
+        :param restart_from_incumbent: Start each epoch from the incumbent if better.
+        :param lag_tolerance: Relative gap to the leader above which a member lags;
+            None never stops members early.
+        :param grace_seconds: Time before lagging members can be stopped.
+        :param min_members: Number of members never stopped early.
+        :param check_interval: Seconds between two checks of the members.
+        :param slot_size: Maximum size of a packed solution, in bytes.
+        :param start_method: multiprocessing start method, by default fork if
+            available.
+        """
+        super().__init__(thread_id, stop, evaluator, None, None, meta_heuristics)
+        self.solution_pool = solution_pool
+        self.restart_from_incumbent = restart_from_incumbent
+        self.lag_tolerance = lag_tolerance
+        self.grace_seconds = grace_seconds
+        self.min_members = max(1, min_members)
+        self.check_interval = check_interval
+        self.slot_size = slot_size
+        self.start_method = start_method
+        self.stopped_early: List[int] = []
+
+        # Set while running, shared with the member processes
+        self._member: Optional[int] = None
+        self._slot: Optional[IncumbentSlot] = None
+        self._infeasible = None
+        self._objectives = None
+        self._terminated = None
+
+    def copy(self, thread: int) -> "Portfolio":
+        return Portfolio(
+            thread,
+            self.stop_criteria.copy(),
+            self.evaluator,
+            [m.copy(thread) for m in self.meta_heuristics_used],
+            self.solution_pool.copy(),
+            self.restart_from_incumbent,
+            self.lag_tolerance,
+            self.grace_seconds,
+            self.min_members,
+            self.check_interval,
+            self.slot_size,
+            self.start_method,
+        )
+
+    def set_neighborhood(self, neighborhood) -> None:
+        for meta in self.meta_heuristics_used:
+            meta.set_neighborhood(neighborhood)
+
+    def stop(self) -> bool:
+        return super().stop() or (
+            self._member is not None and bool(self._terminated[self._member])
+        )
+
+    def stop_on_evaluations(self, evs: List["Evaluation"]) -> bool:
+        return super().stop_on_evaluations(evs) or (
+            self._member is not None and bool(self._terminated[self._member])
+        )
+
+    def incumbent_key(self) -> Tuple[bool, float]:
+        """(infeasible, objective function) of the best solution of all members."""
+        if self._slot is None:
+            return True, math.inf
+        return self._slot.key()
+
+    def _report(self, member: int, infeasible: bool, objective: float) -> None:
+        """Records the best objective a member has reached."""
+        if (infeasible, objective) < (
+            bool(self._infeasible[member]),
+            self._objectives[member],
+        ):
+            self._infeasible[member] = infeasible
+            self._objectives[member] = objective
+
+    def _best_solution(
+        self, result: Optional[Union[Solution, Pool]]
+    ) -> Optional[Solution]:
+        if isinstance(result, Pool):
+            return result.get_best(self.evaluator)
+        return result
+
+    def _run_member(self, member: int, sol: Optional[Solution], results) -> None:
+        """Main loop of a member process, sending its best solution to results."""
+        self._member = member
+        ThreadManager.reseed(member + 1)
+        metaheuristic = self.meta_heuristics_used[member]
+        metaheuristic.set_trace(_MemberTrace(self, member))
+        template = sol
+        current = sol.copy() if sol is not None else None
+        version = 0
+        best: Optional[Tuple[Evaluation, Solution]] = None
+        try:
+            while not self.stop():
+                self.stop_criteria.increment_counter()
+                result = self._best_solution(metaheuristic.run_operation(current, self))
+                if result is None:
+                    continue
+                template = template or result
+                evaluation = self.evaluator.evaluate(result)
+                self._report(
+                    member, evaluation.infeasible(), evaluation.get_objective_function()
+                )
+                if best is None or evaluation.better_than(best[0]):
+                    best = evaluation, result
+                self._slot.publish(member, evaluation, result)
+                current = result
+
+                if self.restart_from_incumbent and self._slot.version() != version:
+                    incumbent = self._slot.read(template)
+                    if incumbent is not None:
+                        version, owner, solution = incumbent
+                        if owner != member:
+                            current = solution
+        except Exception as ex:
+            LogManager.something_went_wrong(type(metaheuristic), ex)
+            raise
+        finally:
+            results.put(best[1] if best is not None else None)
+
+    def _lagging(self, running: List[int]) -> List[int]:
+        """Members to stop: the ones lagging behind the leader."""
+        keys = {i: (bool(self._infeasible[i]), self._objectives[i]) for i in running}
+        leader = min(keys.values())
+        if math.isinf(leader[1]):
+            return []
+        bound = leader[1] + self.lag_tolerance * max(abs(leader[1]), 1e-9)
+        lagging = [
+            i
+            for i in sorted(running, key=keys.__getitem__, reverse=True)
+            if keys[i][0] > leader[0] or keys[i][1] > bound
+        ]
+        return lagging[: max(0, len(running) - self.min_members)]
+
+    def run(self, sol: Optional[Solution]) -> Optional[Solution]:
+        """
+        Runs the members concurrently until the stop criteria are met.
+        :param sol: The initial solution, or None for constructive members.
+        :return: The best solution found by any member.
+        """
+        start_method = self.start_method or (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        context = multiprocessing.get_context(start_method)
+        members = len(self.meta_heuristics_used)
+        self._slot = IncumbentSlot(self.slot_size, context)
+        self._infeasible = context.Array("b", [1] * members, lock=False)
+        self._objectives = context.Array("d", [math.inf] * members, lock=False)
+        self._terminated = context.Array("b", members, lock=False)
+        self.stopped_early = []
+        if sol is not None:
+            self.solution_pool.add(sol.copy(), self.evaluator)
+
+        # Final solutions of the members; drained while waiting so that no member
+        # blocks on exit with a full pipe
+        results = context.Queue()
+        received = 0
+        # Unpacks the incumbent of the slot: the initial or any received solution
+        template = sol
+        processes = [
+            context.Process(
+                target=self._run_member,
+                args=(i, sol, results),
+                name=f"oahf-portfolio-{i}",
+            )
+            for i in range(members)
+        ]
+        try:
+            for process in processes:
+                process.start()
+            started = time.monotonic()
+            while received < members:
+                # Checked before get: a member puts its result before exiting, so
+                # once all have exited an empty queue means the rest crashed
+                exited = not any(p.is_alive() for p in processes)
+                try:
+                    solution = results.get(timeout=self.check_interval)
+                    received += 1
+                    if solution is not None:
+                        template = template or solution
+                        self.solution_pool.add(solution, self.evaluator)
+                    continue
+                except queue.Empty:
+                    if exited:
+                        break
+                if self.log_solutions:
+                    self._log_incumbent()
+                if (
+                    self.lag_tolerance is None
+                    or time.monotonic() - started < self.grace_seconds
+                ):
+                    continue
+                running = [
+                    i
+                    for i, p in enumerate(processes)
+                    if p.is_alive() and not self._terminated[i]
+                ]
+                for i in self._lagging(running):
+                    self._terminated[i] = 1
+                    self.stopped_early.append(i)
+
+            # Members that crashed only left their solutions in the slot
+            incumbent = self._slot.read(template) if template is not None else None
+            if incumbent is not None:
+                self.solution_pool.add(incumbent[2], self.evaluator)
+            if self.log_solutions:
+                self._log_incumbent()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            self._slot.close()
+            self._slot = None
+
+        return self.solution_pool.get_best(self.evaluator)
+
+    def _log_incumbent(self) -> None:
+        """Logs the incumbent of the members, known only by its sort key here."""
+        infeasible, objective = self._slot.key()
+        if self.trace is not None and not math.isinf(objective):
+            self.trace.record(self.id, self.thread_id, objective, not infeasible, True)
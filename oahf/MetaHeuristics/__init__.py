@@ -1,12 +1,21 @@
-from .BestImprovement import BestImprovement
-from .FirstImprovement import FirstImprovement
-from .GenericMultipleMetaheuristic import GenericMultipleMetaheuristic
-from .GeneticAlgorithm import GeneticAlgorithm
-from .GRASP import GRASP
-from .GRC import GRC
-from .ILS import ILS
-from .ParallelILS import ParallelILS
-from .Pertubation import Pertubation
+from typing import TYPE_CHECKING
+
+from oahf.Utils.LazyLoader import LazyLoader
+
+if TYPE_CHECKING:
+    from .BestImprovement import BestImprovement
+    from .FirstImprovement import FirstImprovement
+    from .GenericMultipleMetaheuristic import GenericMultipleMetaheuristic
+    from .GeneticAlgorithm import GeneticAlgorithm
+    from .GRASP import GRASP
+    from .GRC import GRC
+    from .ILS import ILS
+    from .ParallelILS import ParallelILS
+    from .ParallelTempering import ParallelTempering
+    from .PathRelinking import PathRelinking
+    from .Pertubation import Pertubation
+    from .POPMUSIC import POPMUSIC
+    from .Portfolio import IncumbentSlot, Portfolio
 
 __all__ = [
     "BestImprovement",
@@ -16,6 +25,17 @@ __all__ = [
     "GRASP",
     "GRC",
     "ILS",
+    "IncumbentSlot",
     "ParallelILS",
+    "ParallelTempering",
+    "PathRelinking",
     "Pertubation",
+    "POPMUSIC",
+    "Portfolio",
 ]
+
+# Attribute -> submodule defining it, imported on first access
+_exports = {name: name for name in __all__}
+_exports["IncumbentSlot"] = "Portfolio"
+
+__getattr__, __dir__ = LazyLoader.attach(__name__, _exports)
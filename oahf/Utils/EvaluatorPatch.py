@@ -0,0 +1,54 @@
+from typing import Callable, List, Optional, Tuple
+
+
+class EvaluatorPatch:
+    """
+    Replaces the evaluate method of every concrete Evaluator class with a wrapper,
+    and puts the originals back. Shared by the Profiler and Metrics instrumentation.
+
+    Wrappers carry the method they wrap in `__wrapped__`. A method is only restored
+    while the wrapper installed here is still in place, so when several patches
+    overlap (e.g. a Profiler started under a Metrics registry) stopping one leaves
+    the wrappers of the other working.
+    """
+
+    def __init__(self, wrap: Callable[[type, Callable], Optional[Callable]]) -> None:
+        """
+        Initializes the patch.
+        :param wrap: Builds the wrapper of the evaluate method of a class, or returns
+            None to leave the class alone.
+        """
+        self.wrap = wrap
+        self._patched: List[Tuple[type, str, Callable]] = []
+
+    def apply(self) -> None:
+        """Wraps the evaluate method of every Evaluator subclass defining one."""
+        from oahf.Base.Evaluator import Evaluator
+
+        pending = list(Evaluator.__subclasses__())
+        seen = set()
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            pending.extend(cls.__subclasses__())
+            original = cls.__dict__.get("evaluate")
+            if original is None or getattr(original, "__isabstractmethod__", False):
+                continue
+            wrapper = self.wrap(cls, original)
+            if wrapper is None:
+                continue
+            wrapper.__wrapped__ = original
+            wrapper.__doc__ = original.__doc__
+            setattr(cls, "evaluate", wrapper)
+            self._patched.append((cls, "evaluate", original))
+
+    def restore(self) -> None:
+        """Puts back the original methods still wrapped by this patch."""
+        for cls, name, original in reversed(self._patched):
+            # Leave wrappers installed on top of ours alone
+            current = cls.__dict__.get(name)
+            if getattr(current, "__wrapped__", None) is original:
+                setattr(cls, name, original)
+        self._patched.clear()
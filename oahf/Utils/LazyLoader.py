@@ -0,0 +1,64 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class LazyPackage(ModuleType):
+    """
+    Module type of the lazily loaded oahf packages.
+
+    Importing a submodule sets it as an attribute of its package; since every submodule
+    is named after the class it defines, the class is stored instead so that
+    `from oahf.Base import Entity` keeps returning the class.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        exports: Dict[str, str] = self.__dict__.get("_exports", {})
+        if (
+            isinstance(value, ModuleType)
+            and exports.get(name) == name
+            and value.__name__ == f"{self.__name__}.{name}"
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+class LazyLoader:
+    """Static class providing PEP 562 lazy attribute loading for packages."""
+
+    @staticmethod
+    def attach(
+        package_name: str, exports: Dict[str, str]
+    ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+        """
+        Makes a package import its exported attributes on first access.
+
+        Args:
+            package_name (str): The package's __name__.
+            exports (Dict[str, str]): Attribute name -> submodule defining it.
+
+        Returns:
+            Tuple[Callable, Callable]: The package's __getattr__ and __dir__.
+        """
+        package = sys.modules[package_name]
+        package._exports = exports
+        package.__class__ = LazyPackage
+
+        def __getattr__(name: str) -> Any:
+            submodule = exports.get(name)
+            if submodule is None:
+                raise AttributeError(
+                    f"module {package_name!r} has no attribute {name!r}"
+                )
+            value = getattr(
+                importlib.import_module(f"{package_name}.{submodule}"), name
+            )
+            setattr(package, name, value)
+            return value
+
+        def __dir__() -> List[str]:
+            return sorted(set(package.__dict__) | set(exports))
+
+        return __getattr__, __dir__
@@ -0,0 +1,288 @@
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from oahf.Utils.EvaluatorPatch import EvaluatorPatch
+
+if TYPE_CHECKING:
+    from oahf.Base.Evaluation import Evaluation
+
+# Metric name -> (type, help, label names)
+_METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "oahf_moves_total": (
+        "counter",
+        "Movements returned by Neighborhood.get_move_operation.",
+        ("neighborhood",),
+    ),
+    "oahf_move_applies_total": (
+        "counter",
+        "Movement.apply_operation calls by outcome.",
+        ("movement", "result"),
+    ),
+    "oahf_evaluations_total": (
+        "counter",
+        "Evaluator.evaluate calls.",
+        ("evaluator",),
+    ),
+    "oahf_pool_additions_total": (
+        "counter",
+        "Pool.add calls by acceptance of the solution.",
+        ("pool", "accepted"),
+    ),
+    "oahf_pool_size": (
+        "gauge",
+        "Number of solutions in the pool after the last Pool.add.",
+        ("pool",),
+    ),
+    "oahf_incumbent_objective": (
+        "gauge",
+        "Objective function of the best solution accepted by the pool.",
+        ("pool",),
+    ),
+    "oahf_incumbent_feasible": (
+        "gauge",
+        "1 if the best solution accepted by the pool is feasible.",
+        ("pool",),
+    ),
+    "oahf_uptime_seconds": (
+        "gauge",
+        "Seconds since the metrics were started.",
+        (),
+    ),
+}
+
+_Key = Tuple[str, Tuple[str, ...]]
+
+
+class Metrics:
+    """
+    Live throughput metrics of a running search, in the Prometheus text format.
+
+    While a Metrics registry is started, Neighborhood.get_move_operation,
+    Movement.apply_operation, every Evaluator.evaluate and Pool.add update counters
+    (moves, applies, evaluations, pool additions) and gauges (pool size, incumbent
+    objective) labelled by class name. Rates such as moves/s or the pool acceptance
+    rate are left to the consumer, e.g. `rate(oahf_moves_total[1m])`.
+
+    The hot path takes no lock: each thread increments its own counter shard and
+    exports sum the shards, so a scrape may lag an increment behind the search.
+
+    Example:
+        with Metrics() as metrics:
+            metrics.serve(9464)  # http://127.0.0.1:9464/metrics
+            metrics.export_to_file("oahf.prom", interval=5)  # textfile collector
+            ils.run_operation(sol)
+
+    When no Metrics registry is started the instrumented methods only pay for
+    reading `Metrics.active`.
+    """
+
+    active: ClassVar[Optional["Metrics"]] = None
+
+    def __init__(self) -> None:
+        self.gauges: Dict[_Key, float] = {}
+        self.start_time: float = 0.0
+        self._local = threading.local()
+        self._shards: List[Dict[_Key, int]] = []
+        self._shards_lock = threading.Lock()
+        self._incumbents: Dict[str, "Evaluation"] = {}
+        self._patch = EvaluatorPatch(self._counted)
+        self._stopped = threading.Event()
+        self._exporter: Optional[threading.Thread] = None
+        self._export_path: Optional[str] = None
+        self._server = None
+
+    def __enter__(self) -> "Metrics":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Makes this the active registry and instruments the evaluators."""
+        if Metrics.active is not None and Metrics.active is not self:
+            raise RuntimeError("Another Metrics registry is already running.")
+        self.start_time = time.time()
+        self._patch.apply()
+        Metrics.active = self
+
+    def stop(self) -> None:
+        """
+        Stops collecting, removes the evaluator instrumentation, shuts the exporters
+        down and writes the export file one last time.
+        """
+        if Metrics.active is self:
+            Metrics.active = None
+        self._patch.restore()
+
+        self._stopped.set()
+        if self._exporter is not None:
+            self._exporter.join()
+            self._exporter = None
+        if self._export_path is not None:
+            self.write_file(self._export_path)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def inc(self, name: str, *labels: str) -> None:
+        """Increments a counter in the calling thread's shard."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        key = (name, labels)
+        shard[key] = shard.get(key, 0) + 1
+
+    def set_gauge(self, name: str, value: float, *labels: str) -> None:
+        """Sets a gauge; the last writer wins."""
+        self.gauges[(name, labels)] = value
+
+    def observe_incumbent(self, pool: str, evaluation: "Evaluation") -> None:
+        """Updates the incumbent gauges of a pool if the evaluation is better."""
+        incumbent = self._incumbents.get(pool)
+        if incumbent is None or evaluation.better_than(incumbent):
+            self._incumbents[pool] = evaluation
+            self.gauges[("oahf_incumbent_objective", (pool,))] = (
+                evaluation.get_objective_function()
+            )
+            self.gauges[("oahf_incumbent_feasible", (pool,))] = float(
+                not evaluation.infeasible()
+            )
+
+    @staticmethod
+    def _counted(cls: type, function: Callable) -> Optional[Callable]:
+        """
+        Wraps an evaluate method in a counter of the active registry. Evaluators
+        forwarding evaluate to another one (e.g. SharedEvaluator) are not counted:
+        the evaluator doing the work is, and store hits are no evaluations.
+        """
+        if cls.delegates_evaluate:
+            return None
+        name = cls.__name__
+
+        def counted(*args, **kwargs):
+            metrics = Metrics.active
+            if metrics is not None:
+                metrics.inc("oahf_evaluations_total", name)
+            return function(*args, **kwargs)
+
+        return counted
+
+    def counters(self) -> Dict[_Key, int]:
+        """Returns the counters summed over the thread shards."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        totals: Dict[_Key, int] = {}
+        for shard in shards:
+            for key, value in shard.copy().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def to_prometheus(self) -> str:
+        """Formats every metric in the Prometheus text exposition format (0.0.4)."""
+        samples: Dict[str, List[Tuple[Tuple[str, ...], float]]] = {}
+        for (name, labels), value in self.counters().items():
+            samples.setdefault(name, []).append((labels, value))
+        for (name, labels), value in list(self.gauges.items()):
+            samples.setdefault(name, []).append((labels, value))
+        if self.start_time:
+            samples["oahf_uptime_seconds"] = [((), time.time() - self.start_time)]
+
+        lines: List[str] = []
+        for name, (kind, description, label_names) in _METRICS.items():
+            if name not in samples:
+                continue
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(samples[name]):
+                if labels:
+                    pairs = ",".join(
+                        f'{label}="{self._escape(label_value)}"'
+                        for label, label_value in zip(label_names, labels)
+                    )
+                    lines.append(f"{name}{{{pairs}}} {self._format(value)}")
+                else:
+                    lines.append(f"{name} {self._format(value)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _format(value: float) -> str:
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value) if isinstance(value, float) else str(value)
+
+    def write_file(self, path: str) -> None:
+        """Atomically writes the metrics to a file, e.g. for a textfile collector."""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+    def export_to_file(self, path: str, interval: float = 5.0) -> None:
+        """
+        Rewrites the metrics file every `interval` seconds until stop.
+
+        Args:
+            path (str): The file, usually ending in .prom.
+            interval (float): Seconds between two writes.
+        """
+        self._export_path = path
+        self._stopped.clear()
+
+        def export() -> None:
+            while not self._stopped.wait(interval):
+                self.write_file(path)
+
+        self._exporter = threading.Thread(
+            target=export, name="oahf-metrics-file", daemon=True
+        )
+        self._exporter.start()
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> int:
+        """
+        Serves the metrics over HTTP from a background thread until stop.
+
+        Args:
+            port (int): The port, 0 for any free port.
+            host (str): The interface to bind, local only by default.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="oahf-metrics-http", daemon=True
+        ).start()
+        return self._server.server_address[1]
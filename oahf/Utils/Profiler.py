@@ -0,0 +1,298 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from oahf.Utils.EvaluatorPatch import EvaluatorPatch
+
+
+class ProfileNode:
+    """Aggregated timings of one call path of the profiled tree."""
+
+    __slots__ = ("name", "calls", "wall_ns", "cpu_ns", "children")
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.wall_ns: int = 0
+        self.cpu_ns: int = 0
+        self.children: Dict[str, "ProfileNode"] = {}
+
+    @property
+    def self_wall_ns(self) -> int:
+        """Wall time not spent in any child."""
+        return self.wall_ns - sum(c.wall_ns for c in self.children.values())
+
+    def merge(self, other: "ProfileNode") -> None:
+        """Adds the timings of another node with the same path, recursively."""
+        self.calls += other.calls
+        self.wall_ns += other.wall_ns
+        self.cpu_ns += other.cpu_ns
+        for name, child in other.children.items():
+            if name not in self.children:
+                self.children[name] = ProfileNode(name)
+            self.children[name].merge(child)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall_ms": self.wall_ns / 1e6,
+            "cpu_ms": self.cpu_ns / 1e6,
+            "self_wall_ms": self.self_wall_ns / 1e6,
+            "children": [c.to_dict() for c in self.children.values()],
+        }
+
+
+class Profiler:
+    """
+    Hierarchical profiler of a MetaHeuristic tree.
+
+    While a Profiler is started, MetaHeuristic.run_operation, the neighborhood build
+    and move search, Movement apply/unapply and every Evaluator.evaluate attribute
+    their wall and CPU time to a node of a per-thread call tree (e.g. GRASP -> GRC ->
+    SwapNeighborhood.get_move -> ALWABPEvaluator.evaluate), aggregated per path with
+    call counts. Individual calls are also kept, up to max_events, for a timeline.
+
+    When no Profiler is started the instrumented methods only pay for reading
+    `Profiler.active`.
+
+    Example:
+        with Profiler() as profiler:
+            grasp.run_operation(sol)
+        print(profiler.report())
+        profiler.save_chrome_trace("run.trace.json")  # chrome://tracing, Perfetto
+        profiler.save_speedscope("run.speedscope.json")  # speedscope.app
+    """
+
+    active: ClassVar[Optional["Profiler"]] = None
+
+    def __init__(self, record_events: bool = True, max_events: int = 1_000_000):
+        """
+        Initializes the profiler.
+
+        Args:
+            record_events (bool): Keep individual calls for the Chrome trace.
+            max_events (int): Maximum number of calls kept, later ones are dropped.
+        """
+        self.record_events: bool = record_events
+        self.max_events: int = max_events
+        self.roots: Dict[int, ProfileNode] = {}
+        self.thread_names: Dict[int, str] = {}
+        # (thread id, name, start ns, wall ns, cpu ns)
+        self.events: List[Tuple[int, str, int, int, int]] = []
+        self.dropped_events: int = 0
+        self.start_ns: int = 0
+        self.end_ns: int = 0
+        self._local = threading.local()
+        self._patch = EvaluatorPatch(
+            lambda cls, function: self._timed(function, f"{cls.__name__}.evaluate")
+        )
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Makes this the active profiler and instruments the evaluators."""
+        if Profiler.active is not None and Profiler.active is not self:
+            raise RuntimeError("Another Profiler is already running.")
+        self.start_ns = time.perf_counter_ns()
+        self._patch.apply()
+        Profiler.active = self
+
+    def stop(self) -> None:
+        """Stops profiling and removes the evaluator instrumentation."""
+        if Profiler.active is self:
+            Profiler.active = None
+        self._patch.restore()
+        self.end_ns = time.perf_counter_ns()
+
+    def enter(self, name: str) -> None:
+        """Opens a timed section of the calling thread; must be closed with exit."""
+        local = self._local
+        stack = getattr(local, "stack", None)
+        if stack is None:
+            thread = threading.current_thread()
+            root = ProfileNode(thread.name)
+            self.roots[thread.ident] = root
+            self.thread_names[thread.ident] = thread.name
+            stack = local.stack = [(root, 0, 0)]
+            local.ident = thread.ident
+        children = stack[-1][0].children
+        node = children.get(name)
+        if node is None:
+            node = children[name] = ProfileNode(name)
+        stack.append((node, time.perf_counter_ns(), time.thread_time_ns()))
+
+    def exit(self) -> None:
+        """Closes the last section opened by the calling thread."""
+        wall_end = time.perf_counter_ns()
+        cpu_end = time.thread_time_ns()
+        local = self._local
+        node, wall_start, cpu_start = local.stack.pop()
+        wall = wall_end - wall_start
+        cpu = cpu_end - cpu_start
+        node.calls += 1
+        node.wall_ns += wall
+        node.cpu_ns += cpu
+        if self.record_events:
+            if len(self.events) < self.max_events:
+                self.events.append((local.ident, node.name, wall_start, wall, cpu))
+            else:
+                self.dropped_events += 1
+
+    @staticmethod
+    def _timed(function: Callable, name: str) -> Callable:
+        """Wraps a method in a section of the active profiler."""
+
+        def timed(*args, **kwargs):
+            profiler = Profiler.active
+            if profiler is None:
+                return function(*args, **kwargs)
+            profiler.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.exit()
+
+        return timed
+
+    def merged(self) -> ProfileNode:
+        """Returns the call trees of all threads merged by path."""
+        root = ProfileNode("all threads")
+        for thread_root in self.roots.values():
+            for child in thread_root.children.values():
+                if child.name not in root.children:
+                    root.children[child.name] = ProfileNode(child.name)
+                root.children[child.name].merge(child)
+        root.calls = 1
+        root.wall_ns = sum(c.wall_ns for c in root.children.values())
+        root.cpu_ns = sum(c.cpu_ns for c in root.children.values())
+        return root
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the merged call tree as nested dictionaries."""
+        return self.merged().to_dict()
+
+    def report(self, min_percent: float = 0.5) -> str:
+        """
+        Formats the merged call tree as an indented table.
+
+        Args:
+            min_percent (float): Hide nodes below this share of the total wall time.
+
+        Returns:
+            str: One line per node with calls, wall, self and CPU time.
+        """
+        root = self.merged()
+        total = root.wall_ns or 1
+        lines = [
+            f"{'node':<60} {'calls':>10} {'wall ms':>12} {'self ms':>12} "
+            f"{'cpu ms':>12} {'%':>6}"
+        ]
+
+        def visit(node: ProfileNode, depth: int) -> None:
+            for child in sorted(
+                node.children.values(), key=lambda c: c.wall_ns, reverse=True
+            ):
+                percent = 100 * child.wall_ns / total
+                if percent < min_percent:
+                    continue
+                lines.append(
+                    f"{'  ' * depth + child.name:<60} {child.calls:>10} "
+                    f"{child.wall_ns / 1e6:>12.2f} {child.self_wall_ns / 1e6:>12.2f} "
+                    f"{child.cpu_ns / 1e6:>12.2f} {percent:>6.1f}"
+                )
+                visit(child, depth + 1)
+
+        visit(root, 0)
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Returns the recorded calls in the Chrome trace event format."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self.thread_names.items()
+        ]
+        events.extend(
+            {
+                "name": name,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": (start - self.start_ns) / 1000,
+                "dur": wall / 1000,
+                "args": {"cpu_us": cpu / 1000},
+            }
+            for tid, name, start, wall, cpu in self.events
+        )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped_events},
+        }
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """
+        Returns the call trees of each thread as speedscope sampled profiles, each
+        path weighted by its self wall time.
+        """
+        frames: List[Dict[str, str]] = []
+        frame_index: Dict[str, int] = {}
+        profiles = []
+        for tid, root in self.roots.items():
+            samples: List[List[int]] = []
+            weights: List[int] = []
+
+            def visit(node: ProfileNode, stack: List[int]) -> None:
+                for child in node.children.values():
+                    if child.name not in frame_index:
+                        frame_index[child.name] = len(frames)
+                        frames.append({"name": child.name})
+                    path = stack + [frame_index[child.name]]
+                    if child.self_wall_ns > 0:
+                        samples.append(path)
+                        weights.append(child.self_wall_ns)
+                    visit(child, path)
+
+            visit(root, [])
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": self.thread_names.get(tid, str(tid)),
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": "oahf",
+            "exporter": "oahf.Utils.Profiler",
+        }
+
+    def save_chrome_trace(self, path: str) -> None:
+        """Writes the Chrome trace JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def save_speedscope(self, path: str) -> None:
+        """Writes the speedscope JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_speedscope(), file)
@@ -0,0 +1,444 @@
+import math
+import os
+import random
+import statistics
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Runs one configuration on one instance with a seed and returns its cost (lower is
+# better), e.g. the objective function of the best solution found
+TargetRunner = Callable[[Dict[str, Any], Any, int], float]
+
+
+class Parameter:
+    """A tunable parameter: real, integer or categorical."""
+
+    KINDS = ("real", "integer", "categorical")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        domain: Sequence[Any],
+        log: bool = False,
+    ) -> None:
+        """
+        Initializes the parameter.
+
+        Args:
+            name (str): Key of the parameter in the configurations.
+            kind (str): "real", "integer" or "categorical".
+            domain (Sequence[Any]): (low, high) bounds, or the categorical values.
+            log (bool): Sample real/integer values on a logarithmic scale.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown parameter kind {kind!r}.")
+        if kind != "categorical" and (len(domain) != 2 or domain[0] > domain[1]):
+            raise ValueError(f"Parameter {name!r} needs (low, high) bounds.")
+        self.name: str = name
+        self.kind: str = kind
+        self.domain: Tuple[Any, ...] = tuple(domain)
+        self.log: bool = log
+
+    @classmethod
+    def real(cls, name: str, low: float, high: float, log: bool = False):
+        return cls(name, "real", (low, high), log)
+
+    @classmethod
+    def integer(cls, name: str, low: int, high: int, log: bool = False):
+        return cls(name, "integer", (low, high), log)
+
+    @classmethod
+    def categorical(cls, name: str, values: Sequence[Any]):
+        return cls(name, "categorical", values)
+
+    def _scale(self, value: float) -> float:
+        return math.log(value) if self.log else value
+
+    def _unscale(self, value: float) -> Any:
+        value = math.exp(value) if self.log else value
+        low, high = self.domain
+        value = min(high, max(low, value))
+        return int(round(value)) if self.kind == "integer" else value
+
+    def sample(self, rng: random.Random) -> Any:
+        """Draws a value uniformly from the domain."""
+        if self.kind == "categorical":
+            return rng.choice(self.domain)
+        low, high = (self._scale(x) for x in self.domain)
+        return self._unscale(rng.uniform(low, high))
+
+    def sample_near(self, value: Any, spread: float, rng: random.Random) -> Any:
+        """
+        Draws a value around an elite's value.
+
+        Args:
+            value (Any): The elite's value.
+            spread (float): In (0, 1]; the standard deviation as a fraction of the
+                domain, or for categorical values the probability of changing it.
+            rng (random.Random): The random stream.
+        """
+        if self.kind == "categorical":
+            return rng.choice(self.domain) if rng.random() < spread else value
+        low, high = (self._scale(x) for x in self.domain)
+        return self._unscale(rng.gauss(self._scale(value), spread * (high - low)))
+
+
+class Candidate:
+    """A configuration taking part in the races, with its cost per instance block."""
+
+    def __init__(self, id: int, configuration: Dict[str, Any], iteration: int):
+        self.id: int = id
+        self.configuration: Dict[str, Any] = configuration
+        self.iteration: int = iteration
+        self.costs: Dict[int, float] = {}
+        self.alive: bool = True
+
+    def mean_cost(self, blocks: Sequence[int]) -> float:
+        return statistics.fmean(self.costs[b] for b in blocks)
+
+    def __repr__(self) -> str:
+        return f"Candidate({self.id}, {self.configuration})"
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    """Ranks starting at 1, ties sharing their average rank."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def _gamma_q(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Lentz's continued fraction
+    b = x + 1 - a
+    c = 1 / 1e-300
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1 / d
+        h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def _beta_i(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0 or x >= 1:
+        return 0.0 if x <= 0 else 1.0
+    log_prefix = (
+        math.lgamma(a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + a * math.log(x)
+        + b * math.log(1 - x)
+    )
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _beta_i(b, a, 1 - x)
+    # Lentz's continued fraction
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (1e-300 if abs(d) < 1e-300 else d)
+    h = d
+    for m in range(1, 500):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1 + numerator * d
+            d = 1 / (1e-300 if abs(d) < 1e-300 else d)
+            c = 1 + numerator / c
+            c = 1e-300 if abs(c) < 1e-300 else c
+            h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h / a
+
+
+def _t_p_value(t: float, df: float) -> float:
+    """Two-sided p-value of Student's t distribution."""
+    return _beta_i(df / 2, 0.5, df / (df + t * t))
+
+
+def _run(runner: TargetRunner, configuration: Dict[str, Any], instance, seed: int):
+    """Runs one experiment; executed in a worker process."""
+    return runner(configuration, instance, seed)
+
+
+class RacingTuner:
+    """
+    Iterated racing (as in irace) for MetaHeuristic parameters.
+
+    Each iteration samples candidate configurations, uniformly at first and then
+    around the elites of the previous iteration with a shrinking spread, and races
+    them: the candidates still alive are run on one more (instance, seed) block at a
+    time, in parallel processes, and after `first_test` blocks the ones
+    statistically worse than the best are eliminated (Friedman test with Conover's
+    post-hoc comparisons, or paired t-tests against the best). Elites keep their
+    costs on the blocks already seen, so only new candidates pay for them.
+
+    Example:
+        def run_grasp(configuration, instance, seed):
+            ThreadManager.initialize(1, seed)
+            grasp = build_grasp(instance, **configuration)
+            best = grasp.run_operation(None)
+            return evaluator.evaluate(best).get_objective_function()
+
+        tuner = RacingTuner(
+            run_grasp,
+            [Parameter.real("greediness", 0.0, 1.0), Parameter.integer("pool", 2, 50)],
+            instances,
+            budget=2000,
+        )
+        best = tuner.run()[0]
+    """
+
+    TESTS = ("friedman", "t-test")
+
+    def __init__(
+        self,
+        runner: TargetRunner,
+        parameters: Sequence[Parameter],
+        instances: Sequence[Any],
+        budget: int,
+        iterations: Optional[int] = None,
+        elites: int = 4,
+        first_test: int = 5,
+        test: str = "friedman",
+        alpha: float = 0.05,
+        processes: Optional[int] = None,
+        initial: Optional[Sequence[Dict[str, Any]]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the tuner.
+
+        Args:
+            runner (TargetRunner): Picklable (module-level) function running a
+                configuration on an instance with a seed, returning its cost.
+            parameters (Sequence[Parameter]): The tuned parameters.
+            instances (Sequence[Any]): Training instances, picklable; reused with
+                new seeds when a race needs more blocks.
+            budget (int): Maximum number of runner calls.
+            iterations (Optional[int]): Number of races, by default
+                2 + log2(number of parameters).
+            elites (int): Configurations surviving each race.
+            first_test (int): Blocks run before the first elimination test.
+            test (str): "friedman" or "t-test".
+            alpha (float): Significance level of the elimination tests.
+            processes (Optional[int]): Worker processes, 1 runs in this process.
+            initial (Optional[Sequence[Dict[str, Any]]]): Configurations raced in
+                the first iteration, e.g. the current defaults.
+            seed (Optional[int]): Seed of the sampling and of the instance seeds.
+        """
+        if test not in self.TESTS:
+            raise ValueError(f"Unknown test {test!r}.")
+        if not instances:
+            raise ValueError("At least one instance is needed.")
+        self.runner: TargetRunner = runner
+        self.parameters: List[Parameter] = list(parameters)
+        self.instances: List[Any] = list(instances)
+        self.budget: int = budget
+        self.iterations: int = iterations or 2 + int(
+            math.log2(max(1, len(self.parameters)))
+        )
+        self.elites: int = max(1, elites)
+        self.first_test: int = max(2, first_test)
+        self.test: str = test
+        self.alpha: float = alpha
+        self.processes: int = processes or os.cpu_count() or 1
+        self.initial: List[Dict[str, Any]] = [dict(c) for c in initial or []]
+
+        self.used: int = 0
+        self.candidates: List[Candidate] = []
+        self._rng = random.Random(seed)
+        # (instance index, seed) of each block, extended on demand
+        self._blocks: List[Tuple[int, int]] = []
+        self._seen = set()
+
+    def _block(self, index: int) -> Tuple[int, int]:
+        while len(self._blocks) <= index:
+            order = list(range(len(self.instances)))
+            self._rng.shuffle(order)
+            self._blocks.extend((i, self._rng.randrange(2**31)) for i in order)
+        return self._blocks[index]
+
+    def _new_candidate(self, configuration: Dict[str, Any], iteration: int) -> bool:
+        key = tuple(sorted(configuration.items(), key=lambda item: item[0]))
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        candidate = Candidate(len(self.candidates), configuration, iteration)
+        self.candidates.append(candidate)
+        return True
+
+    def _sample(self, count: int, elites: List[Candidate], iteration: int) -> None:
+        """Adds up to count new candidates, sampled around the elites if any."""
+        spread = max(0.02, 0.5 * (1 - iteration / self.iterations))
+        # Better elites are chosen as parents more often (rank weights n, n-1, ...)
+        weights = list(range(len(elites), 0, -1))
+        added = attempts = 0
+        while added < count and attempts < 100 * count:
+            attempts += 1
+            if iteration == 0 and self.initial:
+                configuration = self.initial.pop(0)
+            elif not elites:
+                configuration = {p.name: p.sample(self._rng) for p in self.parameters}
+            else:
+                parent = self._rng.choices(elites, weights)[0].configuration
+                configuration = {
+                    p.name: p.sample_near(parent[p.name], spread, self._rng)
+                    for p in self.parameters
+                }
+            added += self._new_candidate(configuration, iteration)
+
+    def _evaluate(self, jobs: List[Tuple[Candidate, int]], executor) -> None:
+        """Runs each (candidate, block) job not run yet."""
+        jobs = [(c, b) for c, b in jobs if b not in c.costs]
+        arguments = []
+        for candidate, block in jobs:
+            instance, seed = self._block(block)
+            arguments.append((candidate.configuration, self.instances[instance], seed))
+        if executor is None:
+            costs = [_run(self.runner, *a) for a in arguments]
+        else:
+            futures = [executor.submit(_run, self.runner, *a) for a in arguments]
+            costs = [future.result() for future in futures]
+        for (candidate, block), cost in zip(jobs, costs):
+            candidate.costs[block] = cost
+        self.used += len(jobs)
+
+    def _eliminate(self, alive: List[Candidate], blocks: int) -> List[Candidate]:
+        """Returns the candidates not statistically worse than the best one."""
+        k = len(alive)
+        if k < 2:
+            return alive
+        matrix = [[c.costs[b] for c in alive] for b in range(blocks)]
+
+        if self.test == "t-test":
+            means = [statistics.fmean(row[j] for row in matrix) for j in range(k)]
+            best = min(range(k), key=means.__getitem__)
+            survivors = []
+            for j in range(k):
+                differences = [row[j] - row[best] for row in matrix]
+                sd = statistics.stdev(differences)
+                mean = statistics.fmean(differences)
+                if j == best or mean <= 0:
+                    survivors.append(alive[j])
+                elif sd == 0:
+                    continue
+                else:
+                    t = mean * math.sqrt(blocks) / sd
+                    if _t_p_value(t, blocks - 1) >= self.alpha:
+                        survivors.append(alive[j])
+            return survivors
+
+        ranks = [_ranks(row) for row in matrix]
+        sums = [sum(row[j] for row in ranks) for j in range(k)]
+        a = sum(r * r for row in ranks for r in row)
+        c = blocks * k * (k + 1) ** 2 / 4
+        if a == c:
+            return alive
+        statistic = (k - 1) * sum((s - blocks * (k + 1) / 2) ** 2 for s in sums)
+        statistic /= a - c
+        if _gamma_q((k - 1) / 2, statistic / 2) >= self.alpha:
+            return alive
+
+        best = min(range(k), key=sums.__getitem__)
+        if k == 2:
+            return [alive[best]]
+        df = (blocks - 1) * (k - 1)
+        scale = math.sqrt(2 * (blocks * a - sum(s * s for s in sums)) / df)
+        if scale == 0:
+            return [alive[best]]
+        return [
+            alive[j]
+            for j in range(k)
+            if j == best or _t_p_value((sums[j] - sums[best]) / scale, df) >= self.alpha
+        ]
+
+    def _race(self, alive: List[Candidate], budget: int, executor) -> List[Candidate]:
+        """Races the candidates and returns the survivors, best first."""
+        block = 0
+        while alive and budget > 0:
+            step = self.first_test if block == 0 else 1
+            missing = sum(
+                1 for c in alive for b in range(block, block + step) if b not in c.costs
+            )
+            if missing > budget and block >= self.first_test:
+                break
+            self._evaluate(
+                [(c, b) for c in alive for b in range(block, block + step)], executor
+            )
+            budget -= missing
+            block += step
+            if block >= self.first_test:
+                alive = self._eliminate(alive, block)
+            if len(alive) <= self.elites and block >= self.first_test:
+                break
+
+        blocks = range(block)
+        alive.sort(key=lambda c: c.mean_cost(blocks))
+        return alive
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Runs the iterated race.
+
+        Returns:
+            List[Dict[str, Any]]: The elite configurations, best first.
+        """
+        executor = None
+        if self.processes > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(self.processes)
+        elites: List[Candidate] = []
+        try:
+            for iteration in range(self.iterations):
+                remaining = self.budget - self.used
+                iteration_budget = remaining // (self.iterations - iteration)
+                if iteration_budget < self.first_test * 2:
+                    break
+                new = max(
+                    2,
+                    iteration_budget // (self.first_test + min(5, iteration))
+                    - len(elites),
+                )
+                before = len(self.candidates)
+                self._sample(new, elites, iteration)
+                race = elites + self.candidates[before:]
+                for candidate in race:
+                    candidate.alive = True
+                survivors = self._race(race, iteration_budget, executor)
+                for candidate in race:
+                    candidate.alive = candidate in survivors[: self.elites]
+                elites = survivors[: self.elites]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return [c.configuration for c in elites]
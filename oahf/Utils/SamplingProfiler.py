@@ -0,0 +1,165 @@
+import sys
+import threading
+from collections import Counter
+from types import CodeType
+from typing import Dict, List, Optional, Tuple
+
+
+class SamplingProfiler:
+    """
+    Low-overhead sampling profiler attributing time to the framework components.
+
+    A background thread wakes every `interval` seconds, takes the stacks of the other
+    threads with sys._current_frames() and keeps only the frames of methods defined
+    by MetaHeuristic, Neighborhood, Movement, Evaluator and Constraint subclasses, so
+    each sample reads like "GRASP;GRC;SwapNeighborhood;ALWABPEvaluator". Unlike
+    cProfile, the searched code runs untouched, so the per-move call density does
+    not distort the timings.
+
+    The samples are written in the collapsed-stack format ("frame;frame;frame
+    count" per line) read by flamegraph.pl, speedscope and inferno.
+
+    Example:
+        ils.set_sampling_profiler(SamplingProfiler("ils.collapsed", interval=0.002))
+        ils.run_operation(sol)  # ils.collapsed is written when the run ends
+    """
+
+    def __init__(
+        self,
+        output_path: Optional[str] = None,
+        interval: float = 0.005,
+        per_thread: bool = False,
+    ) -> None:
+        """
+        Initializes the profiler.
+
+        Args:
+            output_path (Optional[str]): Collapsed-stack file written by stop().
+            interval (float): Seconds between two samples.
+            per_thread (bool): Start every stack with the thread name.
+        """
+        self.output_path: Optional[str] = output_path
+        self.interval: float = interval
+        self.per_thread: bool = per_thread
+        self.counts: Counter = Counter()
+        self.samples: int = 0
+
+        self._labels: Dict[CodeType, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._depth: int = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Starts sampling; nested start/stop pairs only sample once."""
+        with self._lock:
+            self._depth += 1
+            if self._depth > 1:
+                return
+            self._labels = self._component_labels()
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="oahf-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and writes the collapsed stacks if an output path is set."""
+        with self._lock:
+            self._depth -= 1
+            if self._depth > 0 or self._thread is None:
+                return
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        if self.output_path is not None:
+            self.save(self.output_path)
+
+    @staticmethod
+    def _component_labels() -> Dict[CodeType, str]:
+        """Maps the code of every method of a component subclass to its class name."""
+        from oahf.Base.Constraint import Constraint
+        from oahf.Base.Evaluator import Evaluator
+        from oahf.Base.MetaHeuristic import MetaHeuristic
+        from oahf.Base.Movement import Movement
+        from oahf.Base.Neighborhood import Neighborhood
+
+        labels: Dict[CodeType, str] = {}
+        pending = [
+            cls
+            for base in (MetaHeuristic, Neighborhood, Movement, Evaluator, Constraint)
+            for cls in base.__subclasses__()
+        ]
+        seen = set()
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            pending.extend(cls.__subclasses__())
+            for attribute in vars(cls).values():
+                if isinstance(attribute, (staticmethod, classmethod)):
+                    attribute = attribute.__func__
+                elif isinstance(attribute, property):
+                    attribute = attribute.fget
+                # Unwrap decorators such as the Profiler's evaluate wrapper
+                attribute = getattr(attribute, "__wrapped__", attribute)
+                code = getattr(attribute, "__code__", None)
+                if code is not None:
+                    labels[code] = cls.__name__
+        return labels
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Takes one sample of every other thread's stack."""
+        labels = self._labels
+        own = threading.get_ident()
+        names = (
+            {t.ident: t.name for t in threading.enumerate()} if self.per_thread else {}
+        )
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                label = labels.get(frame.f_code)
+                if label is not None and (not stack or stack[-1] != label):
+                    stack.append(label)
+                frame = frame.f_back
+            if not stack:
+                continue
+            if self.per_thread:
+                stack.append(names.get(thread_id, str(thread_id)))
+            self.counts[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> List[str]:
+        """Returns the samples as collapsed-stack lines, most frequent first."""
+        return [
+            f"{';'.join(stack)} {count}" for stack, count in self.counts.most_common()
+        ]
+
+    def top(self, n: int = 10) -> List[Tuple[str, float]]:
+        """
+        Returns the components where most samples ended (self time).
+
+        Args:
+            n (int): Number of components.
+
+        Returns:
+            List[Tuple[str, float]]: Component and share of the samples.
+        """
+        leaves: Counter = Counter()
+        for stack, count in self.counts.items():
+            leaves[stack[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [(name, count / total) for name, count in leaves.most_common(n)]
+
+    def save(self, path: str) -> None:
+        """Writes the collapsed-stack file."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(self.collapsed()))
+            file.write("\n")
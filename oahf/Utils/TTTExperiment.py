@@ -0,0 +1,288 @@
+import csv
+import math
+import os
+import statistics
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from oahf.Base.MetaHeuristic import MetaHeuristic
+    from oahf.Base.Pool import Pool
+    from oahf.Base.Solution import Solution
+
+# Builds the configuration of one run from its seed: (root MetaHeuristic, input)
+Factory = Callable[[int], Tuple["MetaHeuristic", Optional[Union["Solution", "Pool"]]]]
+
+
+class TargetTrace:
+    """
+    Trace sink (same record interface as TraceWriter) noting when the incumbent
+    first reaches the target objective.
+    """
+
+    def __init__(self, target: float) -> None:
+        self.target: float = target
+        self.start: float = time.perf_counter()
+        self.time_to_target: Optional[float] = None
+        self.best_objective: float = math.inf
+
+    @property
+    def reached(self) -> bool:
+        return self.time_to_target is not None
+
+    def record(
+        self,
+        metaheuristic_id: int,
+        thread_id: int,
+        objective: float,
+        feasible: bool,
+        best: bool,
+    ) -> None:
+        if not best or not feasible:
+            return
+        if objective < self.best_objective:
+            self.best_objective = objective
+        if self.time_to_target is None and objective <= self.target:
+            self.time_to_target = time.perf_counter() - self.start
+
+
+class TTTRun:
+    """Outcome of one seed of a time-to-target experiment."""
+
+    def __init__(
+        self,
+        seed: int,
+        time_to_target: Optional[float],
+        run_time: float,
+        best_objective: float,
+    ) -> None:
+        self.seed: int = seed
+        # None when the run ended without reaching the target
+        self.time_to_target: Optional[float] = time_to_target
+        self.run_time: float = run_time
+        self.best_objective: float = best_objective
+
+    @property
+    def reached(self) -> bool:
+        return self.time_to_target is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "time_to_target": self.time_to_target,
+            "run_time": self.run_time,
+            "best_objective": self.best_objective,
+        }
+
+
+class TTTResult:
+    """Empirical time-to-target distribution of a configuration."""
+
+    def __init__(self, name: str, target: float, runs: List[TTTRun]) -> None:
+        self.name: str = name
+        self.target: float = target
+        self.runs: List[TTTRun] = sorted(runs, key=lambda r: r.seed)
+
+    def times(self) -> List[float]:
+        """Sorted times to target of the runs that reached it."""
+        return sorted(r.time_to_target for r in self.runs if r.reached)
+
+    @property
+    def success_rate(self) -> float:
+        return len(self.times()) / len(self.runs) if self.runs else 0.0
+
+    def distribution(self) -> List[Tuple[float, float]]:
+        """
+        Returns the points of the TTT plot: the i-th smallest time (1-based) with
+        the probability (i - 1/2) / n, n counting the runs that missed the target.
+        """
+        n = len(self.runs)
+        return [(t, (i + 0.5) / n) for i, t in enumerate(self.times())]
+
+    def exponential_fit(self) -> Optional[Tuple[float, float]]:
+        """
+        Fits a shifted exponential F(t) = 1 - exp(-(t - shift) / scale) through the
+        first and third quartiles of the times, as in the usual TTT plots.
+
+        Returns:
+            Optional[Tuple[float, float]]: (shift, scale), None with fewer than
+            two times.
+        """
+        times = self.times()
+        if len(times) < 2:
+            return None
+        q1, _, q3 = statistics.quantiles(times, n=4)
+        scale = (q3 - q1) / math.log(3)
+        return q1 - scale * math.log(4 / 3), scale
+
+    def summary(self) -> Dict[str, Any]:
+        times = self.times()
+        fit = self.exponential_fit()
+        return {
+            "name": self.name,
+            "target": self.target,
+            "runs": len(self.runs),
+            "success_rate": self.success_rate,
+            "mean": statistics.fmean(times) if times else None,
+            "median": statistics.median(times) if times else None,
+            "min": times[0] if times else None,
+            "max": times[-1] if times else None,
+            "shift": fit[0] if fit else None,
+            "scale": fit[1] if fit else None,
+        }
+
+    def speedup(self, baseline: "TTTResult") -> Dict[str, Optional[float]]:
+        """
+        Compares this configuration against a baseline on the same target.
+
+        Args:
+            baseline (TTTResult): The reference configuration, e.g. one thread.
+
+        Returns:
+            Dict[str, Optional[float]]: Ratio of the baseline mean and median times
+            to these ones, and the probability that a run of this configuration
+            reaches the target first (runs that missed it count as slowest).
+        """
+        mine, theirs = self.times(), baseline.times()
+        mean = median = None
+        if mine and theirs:
+            mean = statistics.fmean(theirs) / statistics.fmean(mine)
+            median = statistics.median(theirs) / statistics.median(mine)
+
+        def key(run: TTTRun) -> float:
+            return run.time_to_target if run.reached else math.inf
+
+        wins = sum(
+            1.0 if key(a) < key(b) else 0.5 if key(a) == key(b) else 0.0
+            for a in self.runs
+            for b in baseline.runs
+        )
+        pairs = len(self.runs) * len(baseline.runs)
+        return {
+            "mean": mean,
+            "median": median,
+            "probability_faster": wins / pairs if pairs else None,
+        }
+
+    def save_csv(self, path: str) -> None:
+        """Writes one row per run, sorted by seed."""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            fields = ["seed", "time_to_target", "run_time", "best_objective"]
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(r.to_dict() for r in self.runs)
+
+
+def _run_seed(
+    factory: Factory, seed: int, target: float, num_threads: int, stop_at_target: bool
+) -> TTTRun:
+    """Runs one seed of the experiment; executed in a worker process."""
+    from oahf.Base.ThreadManager import ThreadManager
+
+    ThreadManager.initialize(num_threads, seed)
+    metaheuristic, sol = factory(seed)
+    trace = TargetTrace(target)
+    metaheuristic.set_trace(trace)
+    if stop_at_target:
+        # Every MetaHeuristic of the tree also asks its parents whether to stop
+        stop = metaheuristic.stop
+        stop_on_evaluations = metaheuristic.stop_on_evaluations
+        metaheuristic.stop = lambda: trace.reached or stop()
+        metaheuristic.stop_on_evaluations = lambda evs: (
+            trace.reached or stop_on_evaluations(evs)
+        )
+
+    trace.start = time.perf_counter()
+    metaheuristic.run_operation(sol)
+    run_time = time.perf_counter() - trace.start
+    return TTTRun(seed, trace.time_to_target, run_time, trace.best_objective)
+
+
+class TTTExperiment:
+    """
+    Time-to-target experiment: runs a MetaHeuristic configuration once per seed in
+    a process pool and measures when each run's incumbent first reaches a target
+    objective (minimization, feasible solutions only).
+
+    The configuration is given as a picklable factory (a module-level function)
+    building the root MetaHeuristic and its input for a seed; ThreadManager is
+    initialized with that seed before the factory is called. The incumbent is
+    followed through the solutions the tree logs (see MetaHeuristic.set_trace).
+
+    Example:
+        def build(seed):
+            return build_ils(instance), initial_solution(instance)
+
+        serial = TTTExperiment(build, target=120.0, runs=100).run("ILS")
+        parallel = TTTExperiment(build_parallel, 120.0, 100, num_threads=4).run()
+        print(parallel.speedup(serial))
+        serial.save_csv("ils.ttt.csv")
+    """
+
+    def __init__(
+        self,
+        factory: Factory,
+        target: float,
+        runs: Union[int, Iterable[int]] = 50,
+        processes: Optional[int] = None,
+        num_threads: int = 1,
+        stop_at_target: bool = True,
+    ) -> None:
+        """
+        Initializes the experiment.
+
+        Args:
+            factory (Factory): Builds (root MetaHeuristic, input) for a seed.
+            target (float): The target objective function.
+            runs (Union[int, Iterable[int]]): Number of seeds (0..runs-1) or seeds.
+            processes (Optional[int]): Worker processes, by default one per CPU
+                divided by num_threads; 1 runs the seeds in this process.
+            num_threads (int): Threads of each run given to ThreadManager.
+            stop_at_target (bool): End each run as soon as it reaches the target.
+        """
+        self.factory: Factory = factory
+        self.target: float = target
+        self.seeds: List[int] = list(range(runs) if isinstance(runs, int) else runs)
+        self.num_threads: int = num_threads
+        self.processes: int = processes or max(
+            1, (os.cpu_count() or 1) // max(1, num_threads)
+        )
+        self.stop_at_target: bool = stop_at_target
+
+    def run(self, name: Optional[str] = None) -> TTTResult:
+        """
+        Runs every seed.
+
+        Args:
+            name (Optional[str]): Label of the configuration in the result.
+
+        Returns:
+            TTTResult: The runs and their time-to-target distribution.
+        """
+        arguments = (self.target, self.num_threads, self.stop_at_target)
+        if self.processes == 1:
+            runs = [_run_seed(self.factory, seed, *arguments) for seed in self.seeds]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(self.processes) as executor:
+                futures = [
+                    executor.submit(_run_seed, self.factory, seed, *arguments)
+                    for seed in self.seeds
+                ]
+                runs = [future.result() for future in futures]
+        return TTTResult(
+            name or getattr(self.factory, "__name__", "configuration"),
+            self.target,
+            runs,
+        )
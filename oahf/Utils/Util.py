@@ -1,15 +1,16 @@
-import hashlib
-import multiprocessing
+import os
 import threading
-from typing import ClassVar, List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
-from oahf.Logger.Logger import Logger
+if TYPE_CHECKING:
+    from oahf.Logger.Logger import Logger
 
 
-class Util:
-    _eps: ClassVar[float] = 1e-5
-    _threads: ClassVar[int] = multiprocessing.cpu_count() - 1
-    _logger: ClassVar[Optional[Logger]] = None
+class UtilMeta(type):
+    """
+    Metaclass of Util, so that its properties can be read from the class itself
+    (e.g. `Util.logger`) rather than returning the property object.
+    """
 
     @property
     def eps(cls) -> float:
@@ -26,15 +27,21 @@ class Util:
         return cls._threads
 
     @property
-    def logger(cls) -> Optional[Logger]:
+    def logger(cls) -> Optional["Logger"]:
         """
         Returns:
             Optional[Logger]: logger currently associated with the class.
         """
         return cls._logger
 
+
+class Util(metaclass=UtilMeta):
+    _eps: ClassVar[float] = 1e-5
+    _threads: ClassVar[int] = (os.cpu_count() or 1) - 1
+    _logger: ClassVar[Optional["Logger"]] = None
+
     @classmethod
-    def set_logger(cls, value: Logger) -> None:
+    def set_logger(cls, value: Optional["Logger"]) -> None:
         """
         Sets a new logger for the Util class.
         """
@@ -66,6 +73,8 @@ class Util:
         Returns:
             str: The resulting hash in hexadecimal format.
         """
+        import hashlib
+
         # Initialize a hashlib object (using SHA-256)
         hash_object = hashlib.sha256()
 
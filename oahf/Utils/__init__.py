@@ -1,4 +1,42 @@
-from .EnumUtil import EnumUtil
-from .Util import Util
+from typing import TYPE_CHECKING
 
-__all__ = ["EnumUtil", "Util"]
+from oahf.Utils.LazyLoader import LazyLoader
+
+if TYPE_CHECKING:
+    from .EnumUtil import EnumUtil
+    from .EvaluatorPatch import EvaluatorPatch
+    from .Metrics import Metrics
+    from .Profiler import ProfileNode, Profiler
+    from .RacingTuner import Candidate, Parameter, RacingTuner
+    from .SamplingProfiler import SamplingProfiler
+    from .TTTExperiment import TargetTrace, TTTExperiment, TTTResult, TTTRun
+    from .Util import Util
+
+__all__ = [
+    "Candidate",
+    "EnumUtil",
+    "EvaluatorPatch",
+    "LazyLoader",
+    "Metrics",
+    "Parameter",
+    "ProfileNode",
+    "Profiler",
+    "RacingTuner",
+    "SamplingProfiler",
+    "TargetTrace",
+    "TTTExperiment",
+    "TTTResult",
+    "TTTRun",
+    "Util",
+]
+
+# Attribute -> submodule defining it, imported on first access
+_exports = {name: name for name in __all__}
+_exports["ProfileNode"] = "Profiler"
+_exports["Candidate"] = "RacingTuner"
+_exports["Parameter"] = "RacingTuner"
+_exports["TargetTrace"] = "TTTExperiment"
+_exports["TTTResult"] = "TTTExperiment"
+_exports["TTTRun"] = "TTTExperiment"
+
+__getattr__, __dir__ = LazyLoader.attach(__name__, _exports)